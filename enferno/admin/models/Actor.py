@@ -147,6 +147,8 @@ class Actor(db.Model, BaseMixin):
     # review fields
     review = db.Column(db.Text)
     review_action = db.Column(db.String)
+    # time of the latest revision, written along with each history row
+    last_modified = db.Column(db.DateTime, index=True)
 
     # tags field : used for etl tagging etc ..
     tags = db.Column(ARRAY(db.String), default=[], nullable=False)
@@ -156,17 +158,25 @@ class Actor(db.Model, BaseMixin):
 
     tsv = db.Column(TSVECTOR)
 
+    # Arabic-normalized, like the search terms matched against it
     search = db.Column(
         db.Text,
         db.Computed("""
-         (id)::text || ' ' ||
-         COALESCE(name, ''::character varying) || ' ' ||
-         COALESCE(name_ar, ''::character varying) || ' ' ||
-         COALESCE(comments, ''::text)
+         normalize_arabic_text(
+             (id)::text || ' ' ||
+             COALESCE(name, ''::character varying) || ' ' ||
+             COALESCE(name_ar, ''::character varying) || ' ' ||
+             COALESCE(comments, ''::text)
+         )
         """),
     )
 
     __table_args__ = (
+        # keyset pagination of the list sort orders, see enferno/utils/keyset.py
+        db.Index(
+            "ix_actor_updated_at_id", db.text("updated_at DESC NULLS LAST"), db.text("id DESC")
+        ),
+        db.Index("ix_actor_status_id", db.text("status DESC NULLS LAST"), db.text("id DESC")),
         db.Index(
             "ix_actor_search",
             "search",
@@ -240,9 +250,12 @@ class Actor(db.Model, BaseMixin):
             user_id = getattr(current_user, "id", 1)
 
         a = ActorHistory(actor_id=self.id, data=self.to_dict(), user_id=user_id)
-        if created:
-            a.created_at = created
-            a.updated_at = created
+        revised = created or DateHelper.utcnow()
+        a.created_at = revised
+        a.updated_at = revised
+        # backdated revisions (imports) must not move the latest one back
+        if self.last_modified is None or revised > self.last_modified:
+            self.last_modified = revised
         a.save()
 
     # returns all related actors
@@ -577,10 +590,7 @@ class Actor(db.Model, BaseMixin):
 
     def get_modified_date(self) -> datetime:
         """Return the last modified date of the actor."""
-        if self.history:
-            return self.history[-1].updated_at
-        else:
-            return self.updated_at
+        return self.last_modified or self.updated_at
 
     # Helper method to handle logic of relating actors (from actor)
 
@@ -871,7 +881,7 @@ class Actor(db.Model, BaseMixin):
             .join(Location, Actor.origin_place_id == Location.id)
             .filter(
                 func.ST_DWithin(
-                    func.cast(Location.latlng, Geography),
+                    Location.latlng_geog,
                     func.cast(point, Geography),
                     radius_in_meters,
                 )
@@ -901,7 +911,7 @@ class Actor(db.Model, BaseMixin):
             .join(Location, Event.location_id == Location.id)
             .filter(
                 func.ST_DWithin(
-                    func.cast(Location.latlng, Geography),
+                    Location.latlng_geog,
                     func.cast(point, Geography),
                     radius_in_meters,
                 )
@@ -1100,3 +1110,79 @@ DROP FUNCTION IF EXISTS validate_actor_id_number(JSONB);
 # Register DDL events to ensure function exists for both fresh installs and migrations
 event.listen(Actor.__table__, "before_create", create_validation_function)
 event.listen(Actor.__table__, "after_drop", drop_validation_function)
+
+# Search document of each actor: its own search text and that of every profile,
+# so text searches match one trigram-indexed row per actor without joining profiles
+create_search_document_triggers = DDL("""
+CREATE OR REPLACE FUNCTION actor_search_document_refresh(aid integer) RETURNS void AS $$
+BEGIN
+    IF aid IS NULL THEN RETURN; END IF;
+    INSERT INTO actor_search_document (actor_id, document)
+    SELECT a.id, normalize_arabic_text(a.search || COALESCE(' ' || (
+        SELECT string_agg(p.search, ' ' ORDER BY p.id)
+        FROM actor_profile p
+        WHERE p.actor_id = a.id
+    ), ''))
+    FROM actor a
+    WHERE a.id = aid
+    ON CONFLICT (actor_id) DO UPDATE SET document = EXCLUDED.document;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION actor_search_document_actor() RETURNS trigger AS $$
+BEGIN
+    PERFORM actor_search_document_refresh(NEW.id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION actor_search_document_profile() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM actor_search_document_refresh(NEW.actor_id);
+        RETURN NULL;
+    END IF;
+    PERFORM actor_search_document_refresh(OLD.actor_id);
+    IF TG_OP = 'UPDATE' THEN
+        IF NEW.actor_id IS DISTINCT FROM OLD.actor_id THEN
+            PERFORM actor_search_document_refresh(NEW.actor_id);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS actor_search_document_insert ON actor;
+CREATE TRIGGER actor_search_document_insert
+    AFTER INSERT ON actor
+    FOR EACH ROW EXECUTE FUNCTION actor_search_document_actor();
+
+DROP TRIGGER IF EXISTS actor_search_document_update ON actor;
+CREATE TRIGGER actor_search_document_update
+    AFTER UPDATE ON actor
+    FOR EACH ROW
+    WHEN (OLD.search IS DISTINCT FROM NEW.search)
+    EXECUTE FUNCTION actor_search_document_actor();
+
+DROP TRIGGER IF EXISTS actor_search_document_profile ON actor_profile;
+CREATE TRIGGER actor_search_document_profile
+    AFTER INSERT OR DELETE ON actor_profile
+    FOR EACH ROW EXECUTE FUNCTION actor_search_document_profile();
+
+DROP TRIGGER IF EXISTS actor_search_document_profile_update ON actor_profile;
+CREATE TRIGGER actor_search_document_profile_update
+    AFTER UPDATE ON actor_profile
+    FOR EACH ROW
+    WHEN (OLD.search IS DISTINCT FROM NEW.search OR OLD.actor_id IS DISTINCT FROM NEW.actor_id)
+    EXECUTE FUNCTION actor_search_document_profile();
+""")
+
+drop_search_document_triggers = DDL("""
+DROP FUNCTION IF EXISTS actor_search_document_actor() CASCADE;
+DROP FUNCTION IF EXISTS actor_search_document_profile() CASCADE;
+DROP FUNCTION IF EXISTS actor_search_document_refresh(integer);
+""")
+
+# The triggers span actor and actor_profile, so wait until every table exists
+event.listen(db.metadata, "after_create", create_search_document_triggers)
+event.listen(db.metadata, "before_drop", drop_search_document_triggers)
@@ -18,7 +18,10 @@ class Atoa(db.Model, BaseMixin):
     extend_existing = True
 
     # This constraint will make sure only one relationship exists across bulletins (and prevent self relation)
-    __table_args__ = (db.CheckConstraint("actor_id < related_actor_id"),)
+    __table_args__ = (
+        db.CheckConstraint("actor_id < related_actor_id"),
+        db.Index("ix_atoa_related_actor_id", "related_actor_id"),
+    )
 
     actor_id = db.Column(db.Integer, db.ForeignKey("actor.id"), primary_key=True)
     related_actor_id = db.Column(db.Integer, db.ForeignKey("actor.id"), primary_key=True)
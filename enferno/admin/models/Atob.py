@@ -17,6 +17,9 @@ class Atob(db.Model, BaseMixin):
 
     extend_existing = True
 
+    # lookups by actor, the primary key leads with bulletin_id
+    __table_args__ = (db.Index("ix_atob_actor_id", "actor_id"),)
+
     # Available Backref: bulletin
     bulletin_id = db.Column(db.Integer, db.ForeignKey("bulletin.id"), primary_key=True)
 
@@ -20,7 +20,10 @@ class Btob(db.Model, BaseMixin):
     extend_existing = True
 
     # This constraint will make sure only one relationship exists across bulletins (and prevent self relation)
-    __table_args__ = (db.CheckConstraint("bulletin_id < related_bulletin_id"),)
+    __table_args__ = (
+        db.CheckConstraint("bulletin_id < related_bulletin_id"),
+        db.Index("ix_btob_related_bulletin_id", "related_bulletin_id"),
+    )
 
     # Source Bulletin
     # Available Backref: bulletin_from
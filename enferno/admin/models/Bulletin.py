@@ -5,7 +5,7 @@ from typing import Any, Optional
 import sqlalchemy
 from flask_login import current_user
 from geoalchemy2 import Geography
-from sqlalchemy import ARRAY, func
+from sqlalchemy import ARRAY, DDL, event, func
 from sqlalchemy.dialects.postgresql import TSVECTOR, JSONB
 
 import enferno.utils.typing as t
@@ -145,34 +145,74 @@ class Bulletin(db.Model, BaseMixin):
     # review fields
     review = db.Column(db.Text)
     review_action = db.Column(db.String)
+    # time of the latest revision, written along with each history row
+    last_modified = db.Column(db.DateTime, index=True)
 
     # metadata
     meta = db.Column(JSONB)
 
-    tsv = db.Column(TSVECTOR)
+    # full-text document: Arabic-normalized, English-stemmed, titles weighted highest
+    tsv = db.Column(
+        TSVECTOR,
+        db.Computed(
+            """
+            setweight(to_tsvector('english'::regconfig, normalize_arabic_text(
+                COALESCE(title, '') || ' ' || COALESCE(title_ar, '') || ' ' ||
+                COALESCE(sjac_title, '') || ' ' || COALESCE(sjac_title_ar, '')
+            )), 'A') ||
+            setweight(to_tsvector('english'::regconfig, normalize_arabic_text(
+                COALESCE(regexp_replace(description, E'<[^>]*>', ' ', 'g'), '')
+            )), 'B') ||
+            setweight(to_tsvector('english'::regconfig, normalize_arabic_text(
+                COALESCE(originid, '') || ' ' || COALESCE(comments, '')
+            )), 'C')
+            """,
+            persisted=True,
+        ),
+    )
 
+    # Arabic-normalized: searches normalize their terms the same way, so one trigram
+    # indexed ILIKE per term matches every spelling variant
     search = db.Column(
         db.Text,
         db.Computed("""
-            CAST(id AS TEXT) || ' ' ||
-            COALESCE(title, '') || ' ' ||
-            COALESCE(title_ar, '') || ' ' ||
-            COALESCE(description, '') || ' ' ||
-            COALESCE(originid, '') || ' ' ||
-            COALESCE(sjac_title, '') || ' ' ||
-            COALESCE(sjac_title_ar, '') || ' ' ||
-            COALESCE(source_link, '') || ' ' ||
-            COALESCE(comments, '')
+            normalize_arabic_text(
+                CAST(id AS TEXT) || ' ' ||
+                COALESCE(title, '') || ' ' ||
+                COALESCE(title_ar, '') || ' ' ||
+                COALESCE(description, '') || ' ' ||
+                COALESCE(originid, '') || ' ' ||
+                COALESCE(sjac_title, '') || ' ' ||
+                COALESCE(sjac_title_ar, '') || ' ' ||
+                COALESCE(source_link, '') || ' ' ||
+                COALESCE(comments, '')
+            )
             """),
     )
 
     __table_args__ = (
+        # keyset pagination of the list sort orders, see enferno/utils/keyset.py
+        db.Index(
+            "ix_bulletin_publish_date_id",
+            db.text("publish_date DESC NULLS LAST"),
+            db.text("id DESC"),
+        ),
+        db.Index(
+            "ix_bulletin_documentation_date_id",
+            db.text("documentation_date DESC NULLS LAST"),
+            db.text("id DESC"),
+        ),
+        db.Index(
+            "ix_bulletin_updated_at_id", db.text("updated_at DESC NULLS LAST"), db.text("id DESC")
+        ),
+        db.Index("ix_bulletin_status_id", db.text("status DESC NULLS LAST"), db.text("id DESC")),
         db.Index(
             "ix_bulletin_search",
             "search",
             postgresql_using="gin",
             postgresql_ops={"search": "gin_trgm_ops"},
         ),
+        db.Index("ix_bulletin_tsv", "tsv", postgresql_using="gin"),
         db.Index(
             "ix_bulletin_tags_gin",
             "tags",
@@ -207,9 +247,12 @@ class Bulletin(db.Model, BaseMixin):
         if not user_id:
             user_id = getattr(current_user, "id", 1)
         b = BulletinHistory(bulletin_id=self.id, data=self.to_dict(), user_id=user_id)
-        if created:
-            b.created_at = created
-            b.updated_at = created
+        revised = created or DateHelper.utcnow()
+        b.created_at = revised
+        b.updated_at = revised
+        # backdated revisions (imports) must not move the latest one back
+        if self.last_modified is None or revised > self.last_modified:
+            self.last_modified = revised
         b.save()
 
     def related(self, include_self: bool = False) -> dict[str, Any]:
@@ -883,7 +926,7 @@ class Bulletin(db.Model, BaseMixin):
             .join(Location, bulletin_locations.c.location_id == Location.id)
             .filter(
                 func.ST_DWithin(
-                    func.cast(Location.latlng, Geography),
+                    Location.latlng_geog,
                     func.cast(point, Geography),
                     radius_in_meters,
                 )
@@ -910,7 +953,7 @@ class Bulletin(db.Model, BaseMixin):
         return Bulletin.id.in_(
             db.session.query(GeoLocation.bulletin_id).filter(
                 func.ST_DWithin(
-                    func.cast(GeoLocation.latlng, Geography),
+                    GeoLocation.latlng_geog,
                     func.cast(point, Geography),
                     radius_in_meters,
                 )
@@ -941,7 +984,7 @@ class Bulletin(db.Model, BaseMixin):
             .join(Location, Event.location_id == Location.id)
             .filter(
                 func.ST_DWithin(
-                    func.cast(Location.latlng, Geography),
+                    Location.latlng_geog,
                     func.cast(point, Geography),
                     radius_in_meters,
                 )
@@ -950,7 +993,90 @@ class Bulletin(db.Model, BaseMixin):
 
     def get_modified_date(self) -> datetime:
         """Return the modified date of the bulletin."""
-        if self.history:
-            return self.history[-1].updated_at
-        else:
-            return self.updated_at
+        return self.last_modified or self.updated_at
+
+
+# Keep bulletin_search_document in sync with the bulletin's search text and the OCR
+# text of its (non-deleted) media, on every write path including bulk OCR runs.
+create_search_document_triggers = DDL("""
+CREATE OR REPLACE FUNCTION bulletin_search_document_refresh(bid integer) RETURNS void AS $$
+BEGIN
+    IF bid IS NULL THEN RETURN; END IF;
+    INSERT INTO bulletin_search_document (bulletin_id, document)
+    SELECT b.id, normalize_arabic_text(b.search) || COALESCE(' ' || (
+        SELECT string_agg(e.search_text, ' ' ORDER BY m.id)
+        FROM media m JOIN extraction e ON e.media_id = m.id
+        WHERE m.bulletin_id = b.id AND NOT m.deleted AND e.search_text IS NOT NULL
+    ), '')
+    FROM bulletin b
+    WHERE b.id = bid
+    ON CONFLICT (bulletin_id) DO UPDATE SET document = EXCLUDED.document;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bulletin_search_document_bulletin() RETURNS trigger AS $$
+BEGIN
+    PERFORM bulletin_search_document_refresh(NEW.id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bulletin_search_document_media() RETURNS trigger AS $$
+BEGIN
+    PERFORM bulletin_search_document_refresh(OLD.bulletin_id);
+    IF TG_OP = 'UPDATE' AND NEW.bulletin_id IS DISTINCT FROM OLD.bulletin_id THEN
+        PERFORM bulletin_search_document_refresh(NEW.bulletin_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bulletin_search_document_extraction() RETURNS trigger AS $$
+BEGIN
+    PERFORM bulletin_search_document_refresh(
+        (SELECT bulletin_id FROM media WHERE id = COALESCE(NEW.media_id, OLD.media_id))
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bulletin_search_document_insert ON bulletin;
+CREATE TRIGGER bulletin_search_document_insert
+    AFTER INSERT ON bulletin
+    FOR EACH ROW EXECUTE FUNCTION bulletin_search_document_bulletin();
+
+DROP TRIGGER IF EXISTS bulletin_search_document_update ON bulletin;
+CREATE TRIGGER bulletin_search_document_update
+    AFTER UPDATE ON bulletin
+    FOR EACH ROW
+    WHEN (OLD.search IS DISTINCT FROM NEW.search)
+    EXECUTE FUNCTION bulletin_search_document_bulletin();
+
+DROP TRIGGER IF EXISTS bulletin_search_document_media ON media;
+CREATE TRIGGER bulletin_search_document_media
+    AFTER UPDATE OF bulletin_id, deleted OR DELETE ON media
+    FOR EACH ROW EXECUTE FUNCTION bulletin_search_document_media();
+
+DROP TRIGGER IF EXISTS bulletin_search_document_extraction ON extraction;
+CREATE TRIGGER bulletin_search_document_extraction
+    AFTER INSERT OR DELETE ON extraction
+    FOR EACH ROW EXECUTE FUNCTION bulletin_search_document_extraction();
+
+DROP TRIGGER IF EXISTS bulletin_search_document_extraction_update ON extraction;
+CREATE TRIGGER bulletin_search_document_extraction_update
+    AFTER UPDATE ON extraction
+    FOR EACH ROW
+    WHEN (OLD.search_text IS DISTINCT FROM NEW.search_text)
+    EXECUTE FUNCTION bulletin_search_document_extraction();
+""")
+
+drop_search_document_triggers = DDL("""
+DROP FUNCTION IF EXISTS bulletin_search_document_bulletin() CASCADE;
+DROP FUNCTION IF EXISTS bulletin_search_document_media() CASCADE;
+DROP FUNCTION IF EXISTS bulletin_search_document_extraction() CASCADE;
+DROP FUNCTION IF EXISTS bulletin_search_document_refresh(integer);
+""")
+
+# The triggers span bulletin, media and extraction, so wait until every table exists
+event.listen(db.metadata, "after_create", create_search_document_triggers)
+event.listen(db.metadata, "before_drop", drop_search_document_triggers)
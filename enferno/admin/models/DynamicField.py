@@ -7,6 +7,7 @@ from sqlalchemy import (
     ARRAY as SQLArray,
     Table,
     MetaData,
+    select,
     update,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -110,6 +111,11 @@ class DynamicField(db.Model, BaseMixin):
         DATETIME: DateTime(timezone=True),  # Date and time
     }
 
+    INDEX_BUILDING = "building"
+    INDEX_VALID = "valid"
+    INDEX_FAILED = "failed"
+    INDEX_DROPPING = "dropping"
+
     id = db.Column(db.Integer, primary_key=True)  # Primary key
     name = db.Column(db.String(50), nullable=False)  # Python identifier for the field
     title = db.Column(db.String(100), nullable=False)  # Human-readable label
@@ -121,6 +127,9 @@ class DynamicField(db.Model, BaseMixin):
     )  # Data type (text, number, single_select, etc.)
 
     searchable = db.Column(db.Boolean, default=False)  # Whether the field is indexed for search
+    # Search index lifecycle, None when the field has no index. The index is built and
+    # dropped CONCURRENTLY by a background task, search only uses fields whose index is valid.
+    index_status = db.Column(db.String(20))
 
     # UI Configuration
     ui_component = db.Column(db.String(20))  # How the field should be rendered in the UI
@@ -263,28 +272,8 @@ class DynamicField(db.Model, BaseMixin):
                 )
             )
 
-            # Create indexes if needed
-            if self.searchable:
-                idx_name = f"ix_{table_name}_{self.name}"
-                if self.field_type == DynamicField.SELECT:
-                    # Use GIN index for array columns (select fields)
-                    db.session.execute(
-                        text(
-                            f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table_name} USING gin ({self.name})"
-                        )
-                    )
-                elif self.field_type in [DynamicField.TEXT, DynamicField.LONG_TEXT]:
-                    # Use GIN trigram index for text search
-                    db.session.execute(
-                        text(
-                            f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table_name} USING gin ({self.name} gin_trgm_ops)"
-                        )
-                    )
-                else:
-                    # Standard B-tree index for numbers, datetime
-                    db.session.execute(
-                        text(f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table_name} ({self.name})")
-                    )
+            # The search index, if any, is built after commit by a background task
+            self.request_index_sync()
 
             # Update SQLAlchemy model - direct mapping from field_type
             column_type = self._column_types.get(self.field_type)
@@ -301,6 +290,43 @@ class DynamicField(db.Model, BaseMixin):
             logger.error(f"Error creating column {self.name}: {str(e)}")
             raise
 
+    @property
+    def index_name(self) -> str:
+        return f"ix_{self.get_entity_model().__tablename__}_{self.name}"
+
+    @property
+    def index_pending(self) -> bool:
+        """Whether the index is waiting for the background task to build or drop it."""
+        return self.index_status in (self.INDEX_BUILDING, self.INDEX_DROPPING)
+
+    def index_sql(self) -> str:
+        """CREATE INDEX CONCURRENTLY statement of the field's search index."""
+        table_name = self.get_entity_model().__tablename__
+        if self.field_type == DynamicField.SELECT:
+            # GIN index for array columns (select fields)
+            method = f"USING gin ({self.name})"
+        elif self.field_type in [DynamicField.TEXT, DynamicField.LONG_TEXT]:
+            # GIN trigram index for text search
+            method = f"USING gin ({self.name} gin_trgm_ops)"
+        else:
+            # Standard B-tree index for numbers, datetime
+            method = f"({self.name})"
+        return f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {self.index_name} ON {table_name} {method}"
+
+    def request_index_sync(self) -> bool:
+        """
+        Mark the index for building or dropping when it does not match `searchable`.
+
+        Returns:
+            - True when the background task has to run (see sync_dynamic_field_index),
+              the caller queues it once the field is committed.
+        """
+        if self.searchable and self.index_status not in (self.INDEX_BUILDING, self.INDEX_VALID):
+            self.index_status = self.INDEX_BUILDING
+        elif not self.searchable and self.index_status not in (None, self.INDEX_DROPPING):
+            self.index_status = self.INDEX_DROPPING
+        return self.index_pending
+
     def drop_column(self):
         """Drop the column from entity table"""
         model_class = self.get_entity_model()
@@ -308,9 +334,8 @@ class DynamicField(db.Model, BaseMixin):
 
         try:
             # Drop indexes first
-            if self.searchable:
-                idx_name = f"ix_{table_name}_{self.name}"
-                db.session.execute(text(f"DROP INDEX IF EXISTS {idx_name}"))
+            if self.searchable or self.index_status:
+                db.session.execute(text(f"DROP INDEX IF EXISTS {self.index_name}"))
 
             # Drop the column
             db.session.execute(text(f"ALTER TABLE {table_name} DROP COLUMN IF EXISTS {self.name}"))
@@ -402,51 +427,54 @@ class DynamicField(db.Model, BaseMixin):
         """Extract current values for all active non-core dynamic fields on an entity.
 
         Returns a flat dict {field_name: serialized_value} suitable for merging
-        into the entity's to_dict output.
+        into the entity's to_dict output. Values preloaded by the batched
+        serializer are returned as they are.
         """
+        prefetched = getattr(entity, "_dynamic_values", None)
+        if prefetched is not None:
+            return prefetched
+
         # Infer entity_type from table name (e.g., Bulletin -> "bulletin")
         entity_type = getattr(entity, "__tablename__", None)
         if not entity_type:
             return {}
+        return cls.extract_values_for_many(entity_type, [entity.id]).get(entity.id, {})
 
-        values = {}
+    @classmethod
+    def extract_values_for_many(cls, entity_type: str, ids: list) -> dict:
+        """Extract the dynamic field values of several entities with a single query.
 
-        fields = (
-            cls.query.filter(
-                cls.entity_type == entity_type,
-                cls.active.is_(True),
-                cls.core.is_(False),  # Exclude core fields - they're handled by model's to_dict
-            )
-            .order_by(cls.sort_order)
-            .all()
-        )
+        Returns a dict {entity_id: {field_name: serialized_value}}, entities
+        without dynamic fields are left out.
+        """
+        from enferno.utils import dynamic_field_cache
 
-        if not fields:
+        values = {}
+
+        # Definitions and table metadata come from the process cache
+        fields = dynamic_field_cache.custom_fields(entity_type)
+        if not fields or not ids:
             return values
 
         # Use SQLAlchemy Core to read current values from DB
         try:
-            meta = MetaData()
-            table = Table(entity_type, meta, autoload_with=db.engine)
+            table = dynamic_field_cache.table(entity_type)
 
-            # Build select for existing columns only
-            field_names = [f.name for f in fields if f.name in table.columns]
-            if not field_names:
+            # Select existing columns only
+            fields = [f for f in fields if f.name in table.columns]
+            if not fields:
                 return values
 
-            # Select current values
-            stmt = table.select().where(table.c.id == entity.id)
-            result = db.session.execute(stmt).first()
-
-            if result:
-                for field in fields:
-                    if field.name in table.columns:
-                        raw = getattr(result, field.name, None)
-                        values[field.name] = cls._serialize_value(field.field_type, raw)
+            stmt = select(table.c.id, *(table.c[f.name] for f in fields)).where(table.c.id.in_(ids))
+            for row in db.session.execute(stmt):
+                values[row.id] = {
+                    field.name: cls._serialize_value(field.field_type, getattr(row, field.name))
+                    for field in fields
+                }
 
         except Exception as e:
             logger.error(
-                f"Failed to extract dynamic field values for {entity_type}#{entity.id}: {e}",
+                f"Failed to extract dynamic field values for {entity_type} {ids}: {e}",
                 exc_info=True,
             )
 
@@ -552,6 +580,7 @@ class DynamicField(db.Model, BaseMixin):
             "ui_component": self.ui_component,
             "required": self.schema_config.get("required", False),
             "searchable": self.searchable,
+            "index_status": self.index_status,
             "schema_config": self.schema_config,
             "ui_config": self.ui_config,
             "validation_config": self.validation_config,
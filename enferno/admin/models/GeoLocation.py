@@ -1,6 +1,6 @@
 from typing import Any
 
-from geoalchemy2 import Geometry
+from geoalchemy2 import Geography, Geometry
 from geoalchemy2.shape import to_shape
 
 from enferno.extensions import db
@@ -23,6 +23,10 @@ class GeoLocation(db.Model, BaseMixin):
     type = db.relationship("GeoLocationType", backref="geolocations")  # Added a relationship
     main = db.Column(db.Boolean)
     latlng = db.Column(Geometry("POINT", srid=4326))
+    # geography copy of latlng so radius searches hit a GiST index instead of casting per row
+    latlng_geog = db.Column(
+        Geography("POINT", srid=4326), db.Computed("latlng::geography", persisted=True)
+    )
     comment = db.Column(db.Text)
     bulletin_id = db.Column(db.Integer, db.ForeignKey("bulletin.id"))
 
@@ -113,27 +113,55 @@ class Incident(db.Model, BaseMixin):
     # review fields
     review = db.Column(db.Text)
     review_action = db.Column(db.String)
+    # time of the latest revision, written along with each history row
+    last_modified = db.Column(db.DateTime, index=True)
+
+    # full-text document: Arabic-normalized, English-stemmed, titles weighted highest
+    tsv = db.Column(
+        TSVECTOR,
+        db.Computed(
+            """
+            setweight(to_tsvector('english'::regconfig, normalize_arabic_text(
+                COALESCE(title, '') || ' ' || COALESCE(title_ar, '')
+            )), 'A') ||
+            setweight(to_tsvector('english'::regconfig, normalize_arabic_text(
+                COALESCE(regexp_replace(description, E'<[^>]*>', ' ', 'g'), '')
+            )), 'B') ||
+            setweight(to_tsvector('english'::regconfig, normalize_arabic_text(
+                COALESCE(comments, '')
+            )), 'C')
+            """,
+            persisted=True,
+        ),
+    )
 
-    tsv = db.Column(TSVECTOR)
-
+    # Arabic-normalized, like the search terms matched against it
     search = db.Column(
         db.Text,
         db.Computed("""
-            CAST(id AS TEXT) || ' ' ||
-            COALESCE(title, '') || ' ' ||
-            COALESCE(title_ar, '') || ' ' ||
-            COALESCE(regexp_replace(regexp_replace(description, E'<.*?>', '', 'g'), E'&nbsp;', '', 'g'), '') || ' ' ||
-            COALESCE(comments, '')
+            normalize_arabic_text(
+                CAST(id AS TEXT) || ' ' ||
+                COALESCE(title, '') || ' ' ||
+                COALESCE(title_ar, '') || ' ' ||
+                COALESCE(regexp_replace(regexp_replace(description, E'<.*?>', '', 'g'), E'&nbsp;', '', 'g'), '') || ' ' ||
+                COALESCE(comments, '')
+            )
             """),
     )
 
     __table_args__ = (
+        # keyset pagination of the list sort orders, see enferno/utils/keyset.py
+        db.Index(
+            "ix_incident_updated_at_id", db.text("updated_at DESC NULLS LAST"), db.text("id DESC")
+        ),
+        db.Index("ix_incident_status_id", db.text("status DESC NULLS LAST"), db.text("id DESC")),
         db.Index(
             "ix_incident_search",
             "search",
             postgresql_using="gin",
             postgresql_ops={"search": "gin_trgm_ops"},
         ),
+        db.Index("ix_incident_tsv", "tsv", postgresql_using="gin"),
     )
 
     def related(self, include_self: bool = False) -> dict[str, Any]:
@@ -176,9 +204,12 @@ class Incident(db.Model, BaseMixin):
         if not user_id:
             user_id = getattr(current_user, "id", 1)
         i = IncidentHistory(incident_id=self.id, data=self.to_dict(), user_id=user_id)
-        if created:
-            i.created_at = created
-            i.updated_at = created
+        revised = created or DateHelper.utcnow()
+        i.created_at = revised
+        i.updated_at = revised
+        # backdated revisions (imports) must not move the latest one back
+        if self.last_modified is None or revised > self.last_modified:
+            self.last_modified = revised
         i.save()
 
     # returns all related incidents
@@ -474,11 +505,6 @@ class Incident(db.Model, BaseMixin):
         Returns:
             - the dictionary representation of the incident.
         """
-        # Try to detect a user session
-        if current_user:
-            if not current_user.can_access(self):
-                return self.restricted_json()
-
         if mode == "1":
             return self.min_json()
         if mode == "2":
@@ -618,10 +644,7 @@ class Incident(db.Model, BaseMixin):
 
     def get_modified_date(self) -> datetime:
         """Return the last modified date of the incident."""
-        if self.history:
-            return self.history[-1].updated_at
-        else:
-            return self.updated_at
+        return self.last_modified or self.updated_at
 
 
 # ----------------------------------- History Tables (Versioning) ------------------------------------
@@ -17,6 +17,9 @@ class Itoa(db.Model, BaseMixin):
 
     extend_existing = True
 
+    # lookups by incident, the primary key leads with actor_id
+    __table_args__ = (db.Index("ix_itoa_incident_id", "incident_id"),)
+
     # Available Backref: actor
     actor_id = db.Column(db.Integer, db.ForeignKey("actor.id"), primary_key=True)
 
@@ -15,6 +15,8 @@ class Itob(db.Model, BaseMixin):
 
     extend_existing = True
 
+    __table_args__ = (db.Index("ix_itob_bulletin_id", "bulletin_id"),)
+
     # Available Backref: incident
     incident_id = db.Column(db.Integer, db.ForeignKey("incident.id"), primary_key=True)
 
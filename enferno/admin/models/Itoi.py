@@ -18,7 +18,10 @@ class Itoi(db.Model, BaseMixin):
     extend_existing = True
 
     # This constraint will make sure only one relationship exists across bulletins (and prevent self relation)
-    __table_args__ = (db.CheckConstraint("incident_id < related_incident_id"),)
+    __table_args__ = (
+        db.CheckConstraint("incident_id < related_incident_id"),
+        db.Index("ix_itoi_related_incident_id", "related_incident_id"),
+    )
 
     # Source Incident
     # Available Backref: incident_from
@@ -10,7 +10,9 @@ import enferno.utils.typing as t
 from enferno.extensions import db
 from enferno.utils.base import BaseMixin
 from enferno.utils.date_helper import DateHelper
+from enferno.utils import search_cache
 from enferno.utils.logging_utils import get_logger
+from enferno.utils.tree_index import TreeIndex
 
 logger = get_logger()
 
@@ -47,6 +49,16 @@ class Label(db.Model, BaseMixin):
         With translated=True, use each ancestor's Arabic title, falling back to the
         English title per level for ancestors that have no translation yet.
         """
+        node = label_tree.nodes().get(self.id) if self.id else None
+        if node is not None and node[0] == self.parent_label_id:
+            parts = [
+                (title_ar or title) if translated else title
+                for _, title, title_ar in label_tree.ancestors(self.id)
+            ]
+            parts.reverse()
+            return " > ".join(parts)
+
+        # unsaved label or pending parent change, walk the relationship
         parts = []
         current = self.parent
         seen = set()
@@ -211,7 +223,7 @@ class Label(db.Model, BaseMixin):
     @staticmethod
     def find_by_ids(ids: list[t.id]) -> list[dict[str, Any]]:
         """
-        finds all items and subitems of a given list of ids, using raw sql query instead of the orm.
+        finds all items and subitems of a given list of ids, using the cached label tree.
 
         Args:
             - ids: list of ids to search for.
@@ -219,19 +231,8 @@ class Label(db.Model, BaseMixin):
         Returns:
             - matching records
         """
-        if not ids:
-            return []
-        qstr = tuple(ids)
-
-        query = """
-                  with recursive lcte (id, parent_label_id, title) as (
-                  select id, parent_label_id, title from label where id in :qstr union all 
-                  select x.id, x.parent_label_id, x.title from lcte c, label x where x.parent_label_id = c.id)
-                  select * from lcte;
-                  """
-        with db.engine.connect() as connection:
-            result = connection.execute(text(query), {"qstr": qstr})
-            return [{"id": x[0], "title": x[2]} for x in result]
+        nodes = label_tree.nodes()
+        return [{"id": id, "title": nodes[id][1]} for id in label_tree.descendants(ids)]
 
     @staticmethod
     def get_children(labels: list, depth: int = 3) -> list:
@@ -245,14 +246,11 @@ class Label(db.Model, BaseMixin):
         Returns:
             - list of children labels.
         """
-        all = []
-        targets = labels
-        while depth != 0:
-            children = Label.get_direct_children(targets)
-            all += children
-            targets = children
-            depth -= 1
-        return all
+        roots = {label.id for label in labels}
+        ids = [id for id in label_tree.descendants(list(roots), depth) if id not in roots]
+        if not ids:
+            return []
+        return Label.query.filter(Label.id.in_(ids)).all()
 
     @staticmethod
     def get_direct_children(labels: list) -> list:
@@ -349,4 +347,10 @@ class Label(db.Model, BaseMixin):
         max_id = db.session.execute(text("select max(id)+1 from label")).scalar()
         db.session.execute(text("alter sequence label_id_seq restart with :m"), {"m": max_id})
         db.session.commit()
+        # bulk mappings skip the ORM events that keep the tree index and search cache fresh
+        label_tree.invalidate()
+        search_cache.bump("label")
         return ""
+
+
+label_tree = TreeIndex("label", Label, Label.parent_label_id)
@@ -9,12 +9,14 @@ import werkzeug
 from flask_login import current_user
 from geoalchemy2 import Geometry, Geography
 from geoalchemy2.shape import to_shape
-from sqlalchemy import ARRAY, func, text
+from sqlalchemy import ARRAY, DDL, Select, event, func, select, text
 
 import enferno.utils.typing as t
+from enferno.admin.models.tables import location_closure
 from enferno.extensions import db
 from enferno.utils.base import BaseMixin
 from enferno.utils.date_helper import DateHelper
+from enferno.utils import search_cache
 from enferno.utils.logging_utils import get_logger
 
 logger = get_logger()
@@ -28,7 +30,10 @@ class Location(db.Model, BaseMixin):
     CELERY_FLAG = "tasks:locations:fullpath:status"
 
     COLOR = "#ff663366"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        db.Index("ix_location_tags", "tags", postgresql_using="gin"),
+        {"extend_existing": True},
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     parent_id = db.Column(db.Integer, db.ForeignKey("location.id"))
@@ -38,6 +43,10 @@ class Location(db.Model, BaseMixin):
     location_type_id = db.Column(db.Integer, db.ForeignKey("location_type.id"))
     location_type = db.relationship("LocationType", foreign_keys=[location_type_id])
     latlng = db.Column(Geometry("POINT", srid=4326))
+    # geography copy of latlng so radius searches hit a GiST index instead of casting per row
+    latlng_geog = db.Column(
+        Geography("POINT", srid=4326), db.Computed("latlng::geography", persisted=True)
+    )
     admin_level_id = db.Column(db.Integer, db.ForeignKey("location_admin_level.id"))
     admin_level = db.relationship("LocationAdminLevel", foreign_keys=[admin_level_id])
     description = db.Column(db.Text)
@@ -77,13 +86,8 @@ class Location(db.Model, BaseMixin):
         Returns:
             - list of children ids.
         """
-        children = (
-            Location.query.with_entities(Location.id)
-            .filter(Location.id_tree.like(f"%[{self.id}]%"))
-            .all()
-        )
         # leaf children will return at least their id
-        return [x[0] for x in children]
+        return db.session.scalars(Location.descendants_of([self.id])).all()
 
     @staticmethod
     def get_children_by_id(id: t.id) -> list:
@@ -96,13 +100,23 @@ class Location(db.Model, BaseMixin):
         Returns:
             - list of children locations.
         """
-        children = (
-            Location.query.with_entities(Location.id)
-            .filter(Location.id_tree.like(f"%[{id}]%"))
-            .all()
-        )
         # leaf children will return at least their id
-        return [x[0] for x in children]
+        return db.session.scalars(Location.descendants_of([id])).all()
+
+    @staticmethod
+    def descendants_of(ids: list) -> Select:
+        """
+        Select the ids of the given locations and all of their descendants.
+
+        Args:
+            - ids: list of location ids.
+
+        Returns:
+            - select statement over the location closure table, usable as a subquery.
+        """
+        return select(location_closure.c.descendant_id).where(
+            location_closure.c.ancestor_id.in_(ids)
+        )
 
     @staticmethod
     def find_by_title(title: str) -> Optional["Location"]:
@@ -447,9 +461,7 @@ class Location(db.Model, BaseMixin):
             func.ST_MakePoint(target_point.get("lng"), target_point.get("lat")), 4326
         )
 
-        return func.ST_DWithin(
-            func.cast(Location.latlng, Geography), func.cast(point, Geography), radius_in_meters
-        )
+        return func.ST_DWithin(Location.latlng_geog, func.cast(point, Geography), radius_in_meters)
 
     @staticmethod
     def rebuild_id_trees():
@@ -460,6 +472,26 @@ class Location(db.Model, BaseMixin):
 
         logger.info("Locations ID tree generated successfuly.")
 
+    @staticmethod
+    def rebuild_closure() -> None:
+        """Rebuild the location closure table from parent ids in a single statement."""
+        query = """
+        DELETE FROM location_closure;
+        WITH RECURSIVE tree(ancestor_id, descendant_id, depth, path) AS (
+            SELECT id, id, 0, ARRAY[id] FROM location
+            UNION ALL
+            SELECT t.ancestor_id, l.id, t.depth + 1, t.path || l.id
+            FROM tree t
+            JOIN location l ON l.parent_id = t.descendant_id
+            WHERE NOT l.id = ANY(t.path)
+        )
+        INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree;
+        """
+        db.session.execute(text(query))
+        db.session.commit()
+        logger.info("Location closure table rebuilt successfully.")
+
     # imports csv data into db
     @staticmethod
     def import_csv(file_storage: werkzeug.datastructures.FileStorage) -> str:
@@ -500,5 +532,71 @@ class Location(db.Model, BaseMixin):
         max_id = db.session.execute(text("select max(id)+1 from location")).scalar()
         db.session.execute(text("alter sequence location_id_seq restart with :m"), {"m": max_id})
         db.session.commit()
+        # bulk mappings skip the ORM events that keep the search cache fresh
+        search_cache.bump("location")
 
         return ""
+
+
+# Keep the closure table in sync with parent_id on every write path (ORM, bulk
+# updates and the CSV import), moving whole subtrees when a parent changes.
+create_closure_triggers = DDL("""
+CREATE OR REPLACE FUNCTION location_closure_sync() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+        VALUES (NEW.id, NEW.id, 0);
+        INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, NEW.id, depth + 1
+        FROM location_closure
+        WHERE descendant_id = NEW.parent_id;
+        RETURN NEW;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM location_closure
+        WHERE ancestor_id = NEW.id AND descendant_id = NEW.parent_id
+    ) THEN
+        RAISE EXCEPTION 'Location %% cannot be placed under its own descendant %%',
+            NEW.id, NEW.parent_id;
+    END IF;
+
+    -- detach the subtree from its old ancestors
+    DELETE FROM location_closure c
+    USING location_closure sub, location_closure sup
+    WHERE sub.ancestor_id = NEW.id
+      AND c.descendant_id = sub.descendant_id
+      AND sup.descendant_id = NEW.id
+      AND sup.ancestor_id <> NEW.id
+      AND c.ancestor_id = sup.ancestor_id;
+
+    -- attach it under the new parent's ancestors
+    INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+    SELECT sup.ancestor_id, sub.descendant_id, sup.depth + sub.depth + 1
+    FROM location_closure sup
+    JOIN location_closure sub ON sub.ancestor_id = NEW.id
+    WHERE sup.descendant_id = NEW.parent_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS location_closure_insert ON location;
+CREATE TRIGGER location_closure_insert
+    AFTER INSERT ON location
+    FOR EACH ROW EXECUTE FUNCTION location_closure_sync();
+
+DROP TRIGGER IF EXISTS location_closure_update ON location;
+CREATE TRIGGER location_closure_update
+    AFTER UPDATE OF parent_id ON location
+    FOR EACH ROW
+    WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+    EXECUTE FUNCTION location_closure_sync();
+""")
+
+drop_closure_triggers = DDL("""
+DROP FUNCTION IF EXISTS location_closure_sync() CASCADE;
+""")
+
+# The closure table is created after location (foreign keys), so both exist at this point
+event.listen(location_closure, "after_create", create_closure_triggers)
+event.listen(location_closure, "before_drop", drop_closure_triggers)
@@ -5,6 +5,7 @@ from sqlalchemy import JSON
 
 from enferno.extensions import db
 from enferno.utils.base import BaseMixin
+from enferno.utils.date_helper import DateHelper
 from enferno.utils.logging_utils import get_logger
 from enferno.admin.models import Bulletin, Actor, Incident
 
@@ -26,11 +27,22 @@ class Query(db.Model, BaseMixin):
     user = db.relationship("User", backref="queries", foreign_keys=[user_id])
     data = db.Column(JSON)
     query_type = db.Column(db.String, nullable=False, default=Bulletin.__tablename__)
+    # keep the matching ids in saved_search_result, see enferno.utils.saved_search
+    materialize = db.Column(db.Boolean, default=False, nullable=False, server_default="false")
+    # when the stored ids were last brought up to date, None until the first build
+    refreshed_at = db.Column(db.DateTime)
 
     # serialize data
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the query."""
-        return {"id": self.id, "name": self.name, "data": self.data, "query_type": self.query_type}
+        return {
+            "id": self.id,
+            "name": self.name,
+            "data": self.data,
+            "query_type": self.query_type,
+            "materialize": self.materialize,
+            "refreshed_at": DateHelper.serialize_datetime(self.refreshed_at),
+        }
 
     def to_json(self) -> str:
         """Return a JSON representation of the query."""
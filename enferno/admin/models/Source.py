@@ -10,7 +10,9 @@ import enferno.utils.typing as t
 from enferno.extensions import db
 from enferno.utils.base import BaseMixin
 from enferno.utils.date_helper import DateHelper
+from enferno.utils import search_cache
 from enferno.utils.logging_utils import get_logger
+from enferno.utils.tree_index import TreeIndex
 
 logger = get_logger()
 
@@ -80,7 +82,7 @@ class Source(db.Model, BaseMixin):
     @staticmethod
     def find_by_ids(ids: list[t.id]) -> list[dict[str, Any]]:
         """
-        finds all items and subitems of a given list of ids, using raw sql query instead of the orm.
+        finds all items and subitems of a given list of ids, using the cached source tree.
 
         Args:
             - ids: list of ids to search for.
@@ -88,18 +90,8 @@ class Source(db.Model, BaseMixin):
         Returns:
             - matching records
         """
-        if not ids:
-            return []
-        qstr = tuple(ids)
-        query = """
-               with  recursive lcte (id, parent_id, title) as (
-               select id, parent_id, title from source where id in :qstr union all 
-               select x.id, x.parent_id, x.title from lcte c, source x where x.parent_id = c.id)
-               select * from lcte;
-               """
-        with db.engine.connect() as connection:
-            result = connection.execute(text(query), {"qstr": qstr})
-            return [{"id": x[0], "title": x[2]} for x in result]
+        nodes = source_tree.nodes()
+        return [{"id": id, "title": nodes[id][1]} for id in source_tree.descendants(ids)]
 
     @staticmethod
     def get_children(sources: list, depth: int = 3) -> list:
@@ -113,14 +105,11 @@ class Source(db.Model, BaseMixin):
         Returns:
             - list of children sources.
         """
-        all = []
-        targets = sources
-        while depth != 0:
-            children = Source.get_direct_children(targets)
-            all += children
-            targets = children
-            depth -= 1
-        return all
+        roots = {source.id for source in sources}
+        ids = [id for id in source_tree.descendants(list(roots), depth) if id not in roots]
+        if not ids:
+            return []
+        return Source.query.filter(Source.id.in_(ids)).all()
 
     @staticmethod
     def get_direct_children(sources: list) -> list:
@@ -177,5 +166,11 @@ class Source(db.Model, BaseMixin):
         max_id = db.session.execute(text("select max(id)+1 from source")).scalar()
         db.session.execute(text("alter sequence source_id_seq restart with :m"), {"m": max_id})
         db.session.commit()
+        # bulk mappings skip the ORM events that keep the tree index and search cache fresh
+        source_tree.invalidate()
+        search_cache.bump("source")
 
         return ""
+
+
+source_tree = TreeIndex("source", Source, Source.parent_id)
@@ -1,3 +1,5 @@
+from sqlalchemy import DDL, event
+
 from enferno.extensions import db
 
 # joint table
@@ -214,3 +216,146 @@ incident_roles = db.Table(
     db.Index("ix_incident_roles_incident_id", "incident_id"),
     extend_existing=True,
 )
+
+# closure table for the location hierarchy, one row per (ancestor, descendant) pair
+# including the (id, id) self pair; kept in sync by triggers on the location table
+location_closure = db.Table(
+    "location_closure",
+    db.Column(
+        "ancestor_id",
+        db.Integer,
+        db.ForeignKey("location.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    db.Column(
+        "descendant_id",
+        db.Integer,
+        db.ForeignKey("location.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    db.Column("depth", db.Integer, nullable=False),
+    db.Index("ix_location_closure_descendant_id", "descendant_id"),
+    extend_existing=True,
+)
+
+# per-bulletin search document: the bulletin's search text plus the OCR text of its
+# media, Arabic-normalized; kept in sync by triggers on bulletin, media and extraction
+bulletin_search_document = db.Table(
+    "bulletin_search_document",
+    db.Column(
+        "bulletin_id",
+        db.Integer,
+        db.ForeignKey("bulletin.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    db.Column("document", db.Text, nullable=False),
+    db.Index(
+        "ix_bulletin_search_document_trgm",
+        "document",
+        postgresql_using="gin",
+        postgresql_ops={"document": "gin_trgm_ops"},
+    ),
+    extend_existing=True,
+)
+
+# per-actor search document: the actor's search text plus the search text of all its
+# profiles, Arabic-normalized; kept in sync by triggers on actor and actor_profile
+actor_search_document = db.Table(
+    "actor_search_document",
+    db.Column(
+        "actor_id",
+        db.Integer,
+        db.ForeignKey("actor.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    db.Column("document", db.Text, nullable=False),
+    db.Index(
+        "ix_actor_search_document_trgm",
+        "document",
+        postgresql_using="gin",
+        postgresql_ops={"document": "gin_trgm_ops"},
+    ),
+    extend_existing=True,
+)
+
+# every distinct tag in use per entity with the number of rows carrying it, trigram
+# indexed so substring and typeahead lookups resolve to exact tags; kept in sync by
+# triggers on the tags column of bulletin, actor and location
+tag_dictionary = db.Table(
+    "tag_dictionary",
+    db.Column("entity", db.String(32), primary_key=True),
+    db.Column("tag", db.String, primary_key=True),
+    db.Column("count", db.Integer, nullable=False, server_default="0"),
+    db.Index(
+        "ix_tag_dictionary_tag_trgm",
+        "tag",
+        postgresql_using="gin",
+        postgresql_ops={"tag": "gin_trgm_ops"},
+    ),
+    extend_existing=True,
+)
+
+TAGGED_TABLES = ("bulletin", "actor", "location")
+
+create_tag_dictionary_triggers = DDL(
+    """
+CREATE OR REPLACE FUNCTION tag_dictionary_sync() RETURNS trigger AS $$
+DECLARE
+    added varchar[] := '{}';
+    removed varchar[] := '{}';
+BEGIN
+    IF TG_OP <> 'DELETE' THEN added := COALESCE(NEW.tags, '{}'); END IF;
+    IF TG_OP <> 'INSERT' THEN removed := COALESCE(OLD.tags, '{}'); END IF;
+
+    INSERT INTO tag_dictionary (entity, tag, count)
+    SELECT TG_ARGV[0], t.tag, 1
+    FROM (SELECT unnest(added) EXCEPT SELECT unnest(removed)) AS t(tag)
+    WHERE t.tag IS NOT NULL AND t.tag <> ''
+    ON CONFLICT (entity, tag) DO UPDATE SET count = tag_dictionary.count + 1;
+
+    UPDATE tag_dictionary d SET count = d.count - 1
+    FROM (SELECT unnest(removed) EXCEPT SELECT unnest(added)) AS t(tag)
+    WHERE d.entity = TG_ARGV[0] AND d.tag = t.tag;
+
+    DELETE FROM tag_dictionary
+    WHERE entity = TG_ARGV[0] AND tag = ANY(removed) AND count <= 0;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+    + "".join(f"""
+DROP TRIGGER IF EXISTS tag_dictionary_sync ON {table};
+CREATE TRIGGER tag_dictionary_sync
+    AFTER INSERT OR DELETE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION tag_dictionary_sync('{table}');
+
+DROP TRIGGER IF EXISTS tag_dictionary_sync_update ON {table};
+CREATE TRIGGER tag_dictionary_sync_update
+    AFTER UPDATE OF tags ON {table}
+    FOR EACH ROW
+    WHEN (OLD.tags IS DISTINCT FROM NEW.tags)
+    EXECUTE FUNCTION tag_dictionary_sync('{table}');
+""" for table in TAGGED_TABLES)
+)
+
+drop_tag_dictionary_triggers = DDL("""
+DROP FUNCTION IF EXISTS tag_dictionary_sync() CASCADE;
+""")
+
+# the triggers span several tables, so wait until every table exists
+event.listen(db.metadata, "after_create", create_tag_dictionary_triggers)
+event.listen(db.metadata, "before_drop", drop_tag_dictionary_triggers)
+
+# matching ids of saved searches with materialize set; the entity is the saved
+# search's query_type, refreshed incrementally by enferno.utils.saved_search
+saved_search_result = db.Table(
+    "saved_search_result",
+    db.Column(
+        "query_id",
+        db.Integer,
+        db.ForeignKey("query.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    db.Column("entity_id", db.Integer, primary_key=True),
+    extend_existing=True,
+)
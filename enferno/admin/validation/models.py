@@ -8,7 +8,7 @@ from pydantic import (
     HttpUrl,
     ValidationInfo,
 )
-from typing import Optional, Any, List, Dict
+from typing import Optional, Any, List, Dict, Literal
 from urllib.parse import urlparse
 from dateutil.parser import parse
 import re
@@ -990,7 +990,8 @@ class LocationQueryValidationModel(StrictValidationModel):
     location_type: Optional[PartialLocationTypeModel] = None
     admin_level: Optional[PartialAdminLevelModel] = None
     country: Optional[PartialCountryModel] = None
-    tags: Optional[str] = None
+    tags: Optional[list[str]] = Field(default_factory=list)
+    inExact: Optional[bool] = False
     optags: Optional[bool] = None
 
 
@@ -1289,6 +1290,12 @@ class BulletinQueryRequestModel(BaseValidationModel):
     per_page: int = Field(ge=1, default=PER_PAGE)
     cursor: Optional[str] = None
     include_count: Optional[bool] = False
+    total_type: Literal["exact", "estimate"] = "exact"
+    # list order, newest or highest first, paged by a (sort value, id) cursor
+    sort_by: Literal["id", "publish_date", "documentation_date", "updated_at", "status"] = "id"
+    text_mode: Literal["trigram", "fulltext"] = "trigram"
+    # id of a saved search of the user, served from its stored ids when materialized
+    saved_search: Optional[int] = None
 
     @field_validator("per_page")
     def validate_per_page(cls, v):
@@ -1458,6 +1465,11 @@ class ActorQueryRequestModel(BaseValidationModel):
     per_page: int = Field(default=PER_PAGE, ge=1)
     cursor: Optional[str] = None
     include_count: Optional[bool] = False
+    total_type: Literal["exact", "estimate"] = "exact"
+    # list order, newest or highest first, paged by a (sort value, id) cursor
+    sort_by: Literal["id", "updated_at", "status"] = "id"
+    # id of a saved search of the user, served from its stored ids when materialized
+    saved_search: Optional[int] = None
 
     @field_validator("per_page")
     def validate_per_page(cls, v):
@@ -1594,6 +1606,12 @@ class IncidentQueryRequestModel(BaseValidationModel):
     per_page: int = Field(default=PER_PAGE, ge=1)
     cursor: Optional[str] = None
     include_count: Optional[bool] = False
+    total_type: Literal["exact", "estimate"] = "exact"
+    # list order, newest or highest first, paged by a (sort value, id) cursor
+    sort_by: Literal["id", "updated_at", "status"] = "id"
+    text_mode: Literal["trigram", "fulltext"] = "trigram"
+    # id of a saved search of the user, served from its stored ids when materialized
+    saved_search: Optional[int] = None
 
     @field_validator("per_page")
     def validate_per_page(cls, v):
@@ -1618,6 +1636,38 @@ class GraphVisualizeRequestModel(BaseValidationModel):
     q: list[dict[str, Any]] | dict[str, Any]
 
 
+class SearchCountRequestModel(BaseValidationModel):
+    entity: Literal["bulletin", "actor", "incident"]
+    q: list[dict[str, Any]] | dict[str, Any] = Field(default_factory=list)
+
+
+class FederatedSearchRequestModel(BaseValidationModel):
+    q: str = Field(min_length=1, max_length=255)
+    entities: list[Literal["bulletin", "actor", "incident"]] = Field(
+        default_factory=lambda: ["bulletin", "actor", "incident"], min_length=1
+    )
+    per_page: int = Field(default=PER_PAGE, ge=1)
+
+    @field_validator("entities")
+    def unique_entities(cls, v):
+        return list(dict.fromkeys(v))
+
+    @field_validator("per_page")
+    def validate_per_page(cls, v):
+        valid_values = [int(x) for x in Config.get("ITEMS_PER_PAGE_OPTIONS")]
+        if v not in valid_values:
+            raise ValueError(f"Invalid per_page value: {v}. Valid values are: {valid_values}")
+        return v
+
+
+class SearchFacetsRequestModel(BaseValidationModel):
+    entity: Literal["bulletin", "actor", "incident"]
+    q: list[dict[str, Any]] | dict[str, Any] = Field(default_factory=list)
+    facets: list[Literal["status", "assignee", "label", "source"]] = Field(
+        default_factory=lambda: ["status", "assignee", "label", "source"]
+    )
+
+
 class FlowmapVisualizeRequestModel(BaseValidationModel):
     q: list[dict[str, Any]]
 
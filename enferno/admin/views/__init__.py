@@ -186,3 +186,4 @@ from . import notifications  # noqa: E402, F401
 from . import background_search  # noqa: E402, F401
 from . import dynamic_fields  # noqa: E402, F401
 from . import flowmap  # noqa: E402, F401
+from . import tags  # noqa: E402, F401
@@ -22,7 +22,9 @@ from enferno.tasks import (
     bulk_update_actors,
     bulk_update_incidents,
     generate_graph,
+    refresh_saved_search,
 )
+from enferno.utils import saved_search
 from enferno.utils.graph_utils import GraphUtils
 from enferno.utils.http_response import HTTPResponse
 from enferno.utils.search_utils import SearchUtils
@@ -165,6 +167,7 @@ def api_query_check_name_exists(
 def api_query_create() -> Response:
     """
     API Endpoint save a query search object (advanced search.)
+    With `materialize` set, the matching ids are stored and kept up to date.
 
     Returns:
         - success/error string based on the operation result.
@@ -175,13 +178,19 @@ def api_query_create() -> Response:
     # current saved searches types
     if query_type not in Query.TYPES:
         return HTTPResponse.error("Invalid Request")
+    materialize = request.json.get("materialize", False)
+    if not isinstance(materialize, bool):
+        return HTTPResponse.error("materialize must be a boolean", status=400)
     if q and name:
         query = Query()
         query.name = name
         query.data = q
         query.query_type = query_type
         query.user_id = current_user.id
+        query.materialize = materialize
         query.save()
+        if query.materialize:
+            refresh_saved_search.delay(query.id)
         return HTTPResponse.created(
             message="Query successfully saved", data={"item": query.to_dict()}
         )
@@ -205,6 +214,9 @@ def api_query_update(
     """
     if not (q := request.json.get("q")):
         return HTTPResponse.error("q parameter not provided", status=400)
+    materialize = request.json.get("materialize")
+    if materialize is not None and not isinstance(materialize, bool):
+        return HTTPResponse.error("materialize must be a boolean", status=400)
 
     query = db.session.get(Query, id)
 
@@ -214,8 +226,16 @@ def api_query_update(
     if query.user_id != current_user.id:
         return HTTPResponse.forbidden("Restricted Access")
 
+    if materialize is None:
+        materialize = query.materialize
+    if q != query.data or materialize != query.materialize:
+        # the stored ids no longer match, rebuilt in the background when still materialized
+        saved_search.clear(query)
     query.data = q
+    query.materialize = materialize
     if query.save():
+        if query.materialize and query.refreshed_at is None:
+            refresh_saved_search.delay(query.id)
         return HTTPResponse.success(message=f"Query {query.name} updated")
 
     return HTTPResponse.error("Query update failed", status=409)
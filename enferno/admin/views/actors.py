@@ -22,9 +22,13 @@ from enferno.extensions import rds, db
 from enferno.tasks import bulk_update_actors
 from enferno.user.models import Role
 from enferno.utils.http_response import HTTPResponse
+from enferno.utils.keyset import keyset_page
 from enferno.utils.background_search import apply_search_timeout, timeout_fallback
+from enferno.utils import saved_search, search_cache
+from enferno.utils.search_count import count_total
 from enferno.utils.logging_utils import get_logger
 from enferno.utils.search_utils import SearchUtils
+from enferno.utils.serializer import preload_relations, serialize_one
 from enferno.utils.validation_utils import validate_with
 import enferno.utils.typing as t
 from . import admin, PER_PAGE, REL_PER_PAGE, can_assign_roles, reject_if_review_locked
@@ -68,6 +72,13 @@ def api_actors(validated_data: dict) -> Response:
     """
     # log search query
     q = validated_data.get("q", [{}])
+    stored = None
+    if saved_search_id := validated_data.get("saved_search"):
+        saved = saved_search.get_saved_search(saved_search_id, current_user, "actor")
+        if saved is None:
+            return HTTPResponse.not_found("Saved search not found")
+        # materialized saved searches join their stored ids, the others run as usual
+        q, stored = saved.data or [{}], saved_search.stored_query(saved, current_user)
     if q and q != [{}]:
         Activity.create(
             current_user,
@@ -80,29 +91,70 @@ def api_actors(validated_data: dict) -> Response:
     cursor = validated_data.get("cursor")
     per_page = validated_data.get("per_page", PER_PAGE)
     include_count = validated_data.get("include_count", False)
+    # simple listings are always counted exactly
+    total_type = validated_data.get("total_type", "exact")
+    sort_by = validated_data.get("sort_by", "id")
 
     apply_search_timeout()
-    search = SearchUtils(q, "actor")
-    base_query = search.get_query().options(
+    search = SearchUtils(q, "actor", user=current_user)
+    list_options = (
         selectinload(Actor.assigned_to),
         selectinload(Actor.first_peer_reviewer),
         selectinload(Actor.roles),
     )
-
-    if include_count and cursor is None:
-        # Check if this is a simple listing query (no search filters)
-        is_simple_listing = q == [{}] or not any(
-            bool(filter_dict) for filter_dict in q if filter_dict
+    # Check if this is a simple listing query (no search filters)
+    is_simple_listing = q == [{}] or not any(bool(filter_dict) for filter_dict in q if filter_dict)
+
+    # Searches page through cached result ids, the search itself only runs on a miss.
+    # Other sort orders are not ordered by id and skip the cache.
+    cached = None
+    if stored is None and not is_simple_listing and sort_by == "id":
+        cached = search_cache.cached_page(
+            Actor,
+            "actor",
+            q,
+            current_user,
+            search.get_query,
+            cursor,
+            per_page,
+            total_type=total_type if include_count and cursor is None else None,
+            options=list_options,
         )
-
+    if cached is None:
+        base_query = (stored if stored is not None else search.get_query()).options(*list_options)
+
+    if cached is not None:
+        items, next_cursor, has_more = cached.items, cached.next_cursor, cached.has_more
+        total_count, total_type = cached.total, cached.total_type
+    elif sort_by != "id":
+        # Keyset on (sort value, id)
+        try:
+            items, next_cursor, has_more = keyset_page(
+                base_query, [getattr(Actor, sort_by), Actor.id], cursor, per_page
+            )
+        except ValueError:
+            return HTTPResponse.error("Invalid cursor")
+        total_count = None
+        if include_count and cursor is None:
+            total_count, total_type = count_total(base_query, total_type)
+    elif include_count and cursor is None:
         if is_simple_listing:
             # For simple listing: use fast COUNT(*) directly on table (~50ms)
-            total_count = db.session.execute(select(func.count(Actor.id))).scalar()
+            count_query = select(func.count(Actor.id))
+            if (access := search.access_condition()) is not None:
+                count_query = count_query.where(access)
+            total_count = db.session.execute(count_query).scalar()
+            total_type = "exact"
 
             # Fast data query without window function overhead
             main_query = base_query.order_by(Actor.id.desc()).limit(per_page + 1)
             result = db.session.execute(main_query)
             items = result.scalars().unique().all()
+        elif total_type == "estimate":
+            # Estimate mode: capped count instead of counting every match
+            main_query = base_query.order_by(Actor.id.desc()).limit(per_page + 1)
+            items = db.session.execute(main_query).scalars().unique().all()
+            total_count, total_type = count_total(base_query, total_type)
         else:
             # For search queries: keep original window function approach
             count_subquery = (
@@ -149,36 +201,28 @@ def api_actors(validated_data: dict) -> Response:
 
         total_count = None
 
-    # Minimal serialization for list view with permission checks
+    # Minimal serialization for list view, access is already enforced by the query
     serialized_items = []
     for item in items:
-        if current_user and current_user.can_access(item):
-            # User has access - return full details
-            serialized_items.append(
-                {
-                    "id": item.id,
-                    "name": item.name,
-                    "name_ar": item.name_ar,
-                    "status": item.status,
-                    "assigned_to": (item.assigned_to.to_compact() if item.assigned_to else None),
-                    "first_peer_reviewer": (
-                        item.first_peer_reviewer.to_compact() if item.first_peer_reviewer else None
-                    ),
-                    "roles": (
-                        [
-                            {"id": role.id, "name": role.name, "color": role.color}
-                            for role in item.roles
-                        ]
-                        if item.roles
-                        else []
-                    ),
-                    "_status": item.status,
-                    "review_action": item.review_action,
-                }
-            )
-        else:
-            # User doesn't have access - return restricted info only
-            serialized_items.append({"id": item.id, "restricted": True})
+        serialized_items.append(
+            {
+                "id": item.id,
+                "name": item.name,
+                "name_ar": item.name_ar,
+                "status": item.status,
+                "assigned_to": (item.assigned_to.to_compact() if item.assigned_to else None),
+                "first_peer_reviewer": (
+                    item.first_peer_reviewer.to_compact() if item.first_peer_reviewer else None
+                ),
+                "roles": (
+                    [{"id": role.id, "name": role.name, "color": role.color} for role in item.roles]
+                    if item.roles
+                    else []
+                ),
+                "_status": item.status,
+                "review_action": item.review_action,
+            }
+        )
 
     response = {
         "items": serialized_items,
@@ -189,7 +233,7 @@ def api_actors(validated_data: dict) -> Response:
     # Add count if it was calculated
     if include_count and cursor is None and total_count is not None:
         response["total"] = total_count
-        response["totalType"] = "exact"
+        response["totalType"] = total_type
 
     return HTTPResponse.success(data=response)
 
@@ -468,7 +512,7 @@ def api_actor_get(
                 actor.to_mini(),
                 "actor",
             )
-            return HTTPResponse.success(data=actor.to_dict(mode))
+            return HTTPResponse.success(data=serialize_one(Actor, actor.id, mode))
         else:
             # block access altogether here, doesn't make sense to send only the id
             Activity.create(
@@ -564,6 +608,7 @@ def actor_relations(id: t.id) -> Response:
     load_more = False if end >= len(items) else True
 
     if data:
+        preload_relations(data, current_user)
         if cls == "actor":
             data = [item.to_dict(exclude=actor) for item in data]
         else:
@@ -1,21 +1,123 @@
 from __future__ import annotations
 
-from flask import Response, json
+from flask import Response, json, request
 from flask_security.decorators import current_user
 
-from enferno.utils.background_search import get_result
+from sqlalchemy.exc import OperationalError
+
+from enferno.admin.models import Activity
+from enferno.admin.validation.models import (
+    FederatedSearchRequestModel,
+    SearchCountRequestModel,
+    SearchFacetsRequestModel,
+)
+from enferno.extensions import db
+from enferno.utils.background_search import (
+    apply_search_timeout,
+    get_ids,
+    get_status,
+    search_timed_out,
+)
+from enferno.utils.federated_search import ENTITIES, federated_search
 from enferno.utils.http_response import HTTPResponse
+from enferno.utils.search_count import get_count, queue_count
+from enferno.utils.search_facets import count_facets
+from enferno.utils.validation_utils import validate_with
 
-from . import admin
+from . import admin, PER_PAGE
 
 
 @admin.route("/api/background-search/<token>")
 def api_background_search(token: str) -> Response:
-    """Return the stored ids of a completed background search (owner only)."""
-    result = get_result(token)
-    if not result or result["user_id"] != current_user.id:
+    """
+    Return the ids of a background search (owner only), also while it is running.
+
+    Query args `from` and `count` select a window of the ids found so far, all
+    of them by default. `count` is the number of ids stored so far and `done`
+    tells whether more may follow.
+    """
+    status = get_status(token)
+    if not status or status["user_id"] != current_user.id:
         return HTTPResponse.not_found()
+    start = max(request.args.get("from", 0, type=int), 0)
+    count = request.args.get("count", type=int)
+    ids = get_ids(token, start, None if count is None else max(count, 0))
     return Response(
-        json.dumps({"entity": result["entity"], "ids": result["ids"]}),
+        json.dumps(
+            {
+                "entity": status["entity"],
+                "ids": ids,
+                "from": start,
+                "count": status["count"],
+                "done": status["done"],
+                "failed": status["failed"],
+            }
+        ),
         content_type="application/json",
     )
+
+
+@admin.post("/api/search-count/")
+@validate_with(SearchCountRequestModel)
+def api_search_count(validated_data: dict) -> Response:
+    """Queue an exact count of a search whose list total was estimated."""
+    token = queue_count(current_user.id, validated_data["entity"], validated_data.get("q", []))
+    return HTTPResponse.success(data={"token": token}, status=202)
+
+
+@admin.route("/api/search-count/<token>")
+def api_search_count_result(token: str) -> Response:
+    """Return a queued exact count (owner only), 202 while it is still running."""
+    result = get_count(token)
+    if not result or result["user_id"] != current_user.id:
+        return HTTPResponse.not_found()
+    if result["pending"]:
+        return HTTPResponse.success(data={"pending": True}, status=202)
+    if result["total"] is None:
+        return HTTPResponse.error("Count could not be completed", status=500)
+    return HTTPResponse.success(data={"total": result["total"], "totalType": "exact"})
+
+
+@admin.post("/api/search-facets/")
+@validate_with(SearchFacetsRequestModel)
+def api_search_facets(validated_data: dict) -> Response:
+    """Count the status, assignee, label and source facets of a search in one query."""
+    apply_search_timeout()
+    try:
+        facets = count_facets(
+            validated_data["entity"],
+            validated_data.get("q", []),
+            current_user,
+            validated_data.get("facets", ["status", "assignee", "label", "source"]),
+        )
+    except OperationalError as error:
+        if not search_timed_out(error):
+            raise
+        db.session.rollback()
+        return HTTPResponse.error("Facet counts took too long for this search", status=503)
+    return HTTPResponse.success(data={"facets": facets})
+
+
+@admin.post("/api/search/")
+@validate_with(FederatedSearchRequestModel)
+def api_federated_search(validated_data: dict) -> Response:
+    """
+    Search bulletins, actors and incidents for the same text in one request.
+
+    Returns the first page of each entity with its estimated total. An entity
+    whose search times out is queued as a background search and reported with
+    `queued` and its token, the other entities are answered as usual.
+    """
+    text = validated_data["q"]
+    entities = validated_data.get("entities", list(ENTITIES))
+    Activity.create(
+        current_user,
+        Activity.ACTION_SEARCH,
+        Activity.STATUS_SUCCESS,
+        {"q": text, "entities": entities},
+        "search",
+    )
+    results = federated_search(
+        text, current_user, entities, validated_data.get("per_page", PER_PAGE)
+    )
+    return HTTPResponse.success(data={"results": results})
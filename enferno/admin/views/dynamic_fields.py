@@ -9,6 +9,7 @@ from enferno.admin.models.DynamicField import DynamicField
 from enferno.admin.models.DynamicFormHistory import DynamicFormHistory
 from enferno.admin.validation.models import DynamicFieldBulkSaveModel
 from enferno.extensions import db
+from enferno.tasks import sync_dynamic_field_index
 from enferno.utils.dynamic_field_utils import create_field, update_field, delete_field
 from enferno.utils.form_history_utils import record_form_history
 from enferno.utils.http_response import HTTPResponse
@@ -161,6 +162,8 @@ def api_dynamic_fields_bulk_save(validated_data: dict) -> Response:
         created_count = 0
         updated_count = 0
         deleted_count = 0
+        # fields whose search index has to be built or dropped after commit
+        index_syncs = []
 
         # All operations in single transaction
         # Creates
@@ -174,6 +177,8 @@ def api_dynamic_fields_bulk_save(validated_data: dict) -> Response:
                     f"Failed to create field '{field_title}'", status=400, errors=[error]
                 )
             created_count += 1
+            if field.index_pending:
+                index_syncs.append(field.id)
 
         # Updates
         for update_item in changes.get("update", []):
@@ -193,6 +198,8 @@ def api_dynamic_fields_bulk_save(validated_data: dict) -> Response:
                     f"Failed to update field '{field_title}'", status=status, errors=[error]
                 )
             updated_count += 1
+            if field.index_pending:
+                index_syncs.append(field.id)
 
         # Deletes
         for field_id in changes.get("delete", []):
@@ -208,6 +215,10 @@ def api_dynamic_fields_bulk_save(validated_data: dict) -> Response:
         # Commit all changes at once
         db.session.commit()
 
+        # Indexes are built and dropped concurrently outside the request transaction
+        for field_id in index_syncs:
+            sync_dynamic_field_index.delay(field_id)
+
         # Log activity after successful commit
         if created_count > 0 or updated_count > 0 or deleted_count > 0:
             Activity.create(
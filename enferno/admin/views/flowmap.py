@@ -82,7 +82,7 @@ def flowmap_actors_for_locations(validated_data: dict) -> Response:
     et_filter = set(event_types) if event_types else None
 
     # Get scoped actor IDs as a subquery
-    search_util = SearchUtils(q, cls="actor")
+    search_util = SearchUtils(q, cls="actor", user=current_user)
     scoped_stmt = search_util.get_query()
     scoped_ids_subq = scoped_stmt.with_only_columns(Actor.id).subquery()
 
@@ -22,8 +22,12 @@ from enferno.extensions import rds, db
 from enferno.tasks import bulk_update_incidents
 from enferno.user.models import Role
 from enferno.utils.http_response import HTTPResponse
+from enferno.utils.keyset import keyset_page
 from enferno.utils.background_search import apply_search_timeout, timeout_fallback
+from enferno.utils import saved_search, search_cache
+from enferno.utils.search_count import count_total
 from enferno.utils.search_utils import SearchUtils
+from enferno.utils.serializer import preload_relations, serialize_one
 from enferno.utils.validation_utils import validate_with
 import enferno.utils.typing as t
 from . import admin, PER_PAGE, REL_PER_PAGE, can_assign_roles, reject_if_review_locked
@@ -73,6 +77,13 @@ def api_incidents(validated_data: dict) -> Response:
     """
     # log search query
     q = validated_data.get("q", {})
+    stored = None
+    if saved_search_id := validated_data.get("saved_search"):
+        saved = saved_search.get_saved_search(saved_search_id, current_user, "incident")
+        if saved is None:
+            return HTTPResponse.not_found("Saved search not found")
+        # materialized saved searches join their stored ids, the others run as usual
+        q, stored = saved.data or {}, saved_search.stored_query(saved, current_user)
     if q and q != {}:
         Activity.create(
             current_user,
@@ -85,29 +96,73 @@ def api_incidents(validated_data: dict) -> Response:
     cursor = validated_data.get("cursor")
     per_page = validated_data.get("per_page", PER_PAGE)
     include_count = validated_data.get("include_count", False)
+    # simple listings are always counted exactly
+    total_type = validated_data.get("total_type", "exact")
+    text_mode = validated_data.get("text_mode", "trigram")
+    sort_by = validated_data.get("sort_by", "id")
 
     apply_search_timeout()
-    search = SearchUtils(q, cls="incident")
-    base_query = search.get_query().options(
+    search = SearchUtils(q, cls="incident", user=current_user, text_mode=text_mode)
+    list_options = (
         selectinload(Incident.assigned_to),
         selectinload(Incident.first_peer_reviewer),
         selectinload(Incident.roles),
     )
-
-    if include_count and cursor is None:
-        # Check if this is a simple listing query (no search filters)
-        is_simple_listing = q == {} or not any(
-            bool(filter_dict) for filter_dict in q if filter_dict
+    # Check if this is a simple listing query (no search filters)
+    is_simple_listing = q == {} or not any(bool(filter_dict) for filter_dict in q if filter_dict)
+
+    # Searches page through cached result ids, the search itself only runs on a miss.
+    # Ranked full-text results and other sort orders are not ordered by id and skip the cache.
+    cached, sort_keys = None, None
+    if stored is None and not is_simple_listing and text_mode == "trigram" and sort_by == "id":
+        cached = search_cache.cached_page(
+            Incident,
+            "incident",
+            q,
+            current_user,
+            search.get_query,
+            cursor,
+            per_page,
+            total_type=total_type if include_count and cursor is None else None,
+            options=list_options,
         )
-
+    if cached is None:
+        base_query = (stored if stored is not None else search.get_query()).options(*list_options)
+        if sort_by != "id":
+            sort_keys = [getattr(Incident, sort_by), Incident.id]
+        elif (rank := search.rank_expression()) is not None:
+            sort_keys = [rank, Incident.id]
+
+    if cached is not None:
+        items, next_cursor, has_more = cached.items, cached.next_cursor, cached.has_more
+        total_count, total_type = cached.total, cached.total_type
+    elif sort_keys is not None:
+        # Keyset on (sort value, id): a sort column, or relevance in ranked full-text mode
+        try:
+            items, next_cursor, has_more = keyset_page(base_query, sort_keys, cursor, per_page)
+        except ValueError:
+            return HTTPResponse.error("Invalid cursor")
+        total_count = None
+        if include_count and cursor is None:
+            total_count, total_type = count_total(base_query, total_type)
+    elif include_count and cursor is None:
         if is_simple_listing:
             # For simple listing: use fast COUNT(*) directly on table (~50ms)
-            total_count = db.session.execute(select(func.count(Incident.id))).scalar()
+            count_query = select(func.count(Incident.id))
+            if (access := search.access_condition()) is not None:
+                count_query = count_query.where(access)
+            total_count = db.session.execute(count_query).scalar()
+            total_type = "exact"
 
             # Fast data query without window function overhead
             main_query = base_query.order_by(Incident.id.desc()).limit(per_page + 1)
             result = db.session.execute(main_query)
             items = result.scalars().unique().all()
+        elif total_type == "estimate":
+            # Estimate mode: capped count instead of counting every match
+            main_query = base_query.order_by(Incident.id.desc()).limit(per_page + 1)
+            items = db.session.execute(main_query).scalars().unique().all()
+            total_count, total_type = count_total(base_query, total_type)
         else:
             # For search queries: keep original window function approach
             count_subquery = (
@@ -154,36 +209,28 @@ def api_incidents(validated_data: dict) -> Response:
 
         total_count = None
 
-    # Minimal serialization for list view with permission checks
+    # Minimal serialization for list view, access is already enforced by the query
     serialized_items = []
     for item in items:
-        if current_user and current_user.can_access(item):
-            # User has access - return full details
-            serialized_items.append(
-                {
-                    "id": item.id,
-                    "title": item.title,
-                    "title_ar": item.title_ar,
-                    "status": item.status,
-                    "assigned_to": (item.assigned_to.to_compact() if item.assigned_to else None),
-                    "first_peer_reviewer": (
-                        item.first_peer_reviewer.to_compact() if item.first_peer_reviewer else None
-                    ),
-                    "roles": (
-                        [
-                            {"id": role.id, "name": role.name, "color": role.color}
-                            for role in item.roles
-                        ]
-                        if item.roles
-                        else []
-                    ),
-                    "_status": item.status,
-                    "review_action": item.review_action,
-                }
-            )
-        else:
-            # User doesn't have access - return restricted info only
-            serialized_items.append({"id": item.id, "restricted": True})
+        serialized_items.append(
+            {
+                "id": item.id,
+                "title": item.title,
+                "title_ar": item.title_ar,
+                "status": item.status,
+                "assigned_to": (item.assigned_to.to_compact() if item.assigned_to else None),
+                "first_peer_reviewer": (
+                    item.first_peer_reviewer.to_compact() if item.first_peer_reviewer else None
+                ),
+                "roles": (
+                    [{"id": role.id, "name": role.name, "color": role.color} for role in item.roles]
+                    if item.roles
+                    else []
+                ),
+                "_status": item.status,
+                "review_action": item.review_action,
+            }
+        )
 
     response = {
         "items": serialized_items,
@@ -194,7 +241,7 @@ def api_incidents(validated_data: dict) -> Response:
     # Add count if it was calculated
     if include_count and cursor is None and total_count is not None:
         response["total"] = total_count
-        response["totalType"] = "exact"
+        response["totalType"] = total_type
 
     return HTTPResponse.success(data=response)
 
@@ -459,7 +506,7 @@ def api_incident_get(
                 incident.to_mini(),
                 "incident",
             )
-            return HTTPResponse.success(data=incident.to_dict(mode))
+            return HTTPResponse.success(data=serialize_one(Incident, incident.id, mode))
         else:
             # block access altogether here, doesn't make sense to send only the id
             Activity.create(
@@ -511,6 +558,7 @@ def incident_relations(id: t.id) -> Response:
 
     # add support for loading all relations at once
     if page == 0:
+        preload_relations(items, current_user)
         if cls == "incident":
             data = [item.to_dict(exclude=incident) for item in items]
         else:
@@ -526,6 +574,7 @@ def incident_relations(id: t.id) -> Response:
     load_more = False if end >= len(items) else True
 
     if data:
+        preload_relations(data, current_user)
         if cls == "incident":
             data = [item.to_dict(exclude=incident) for item in data]
         else:
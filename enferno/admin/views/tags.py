@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from flask import Response, request
+
+from enferno.admin.models.tables import TAGGED_TABLES
+from enferno.utils.http_response import HTTPResponse
+from enferno.utils.tag_dictionary import SUGGEST_LIMIT, suggest_tags
+
+from . import admin
+
+
+@admin.route("/api/tags/")
+def api_tags() -> Response:
+    """
+    API endpoint suggesting tags in use for typeahead.
+
+    Query args: `entity` (bulletin, actor or location), `q` (part of the tag)
+    and `limit`.
+
+    Returns:
+        - json response of the matching tags with their usage counts,
+          exact and prefix matches first.
+    """
+    entity = request.args.get("entity", "bulletin")
+    if entity not in TAGGED_TABLES:
+        return HTTPResponse.error(f"Unsupported entity: {entity}")
+    limit = min(max(request.args.get("limit", SUGGEST_LIMIT, int), 1), 100)
+    items = suggest_tags(entity, request.args.get("q", ""), limit)
+    return HTTPResponse.success(data={"items": items})
@@ -33,6 +33,7 @@ from enferno.admin.models import (
 )
 from enferno.admin.views import admin
 from enferno.data_import.views import imports
+from enferno.utils.search_cache import register_search_cache
 from enferno.utils.soft_delete import register_soft_delete
 from enferno.extensions import (
     db,
@@ -58,6 +59,7 @@ from enferno.user.forms import (
 from enferno.user.models import User, Role
 from enferno.user.models import WebAuthn
 from enferno.user.views import bp_user
+from enferno.utils.json_provider import FastJSONProvider
 from enferno.utils.logging_utils import get_logger
 from enferno.utils.rate_limit_utils import get_real_ip, ratelimit_handler
 
@@ -90,6 +92,9 @@ def create_app(config_object=Config):
         Flask application instance.
     """
     app = Flask(__name__)
+    # set as the class too, Flask-Security subclasses it for lazy strings
+    app.json_provider_class = FastJSONProvider
+    app.json = FastJSONProvider(app)
     register_errorhandlers(app)
     app.config.from_object(config_object)
 
@@ -140,6 +145,7 @@ def register_extensions(app):
     db.init_app(app)
     migrate.init_app(app, db)
     register_soft_delete(db)
+    register_search_cache(db)
     # Skip debug toolbar when CSP is enabled (they conflict)
     if not app.config.get("CSP_ENABLED", False):
         debug_toolbar.init_app(app)
@@ -430,6 +436,7 @@ def register_commands(app):
     app.cli.add_command(commands.reset_all_passwords)
     app.cli.add_command(commands.i18n_cli)
     app.cli.add_command(commands.check_db_alignment)
+    app.cli.add_command(commands.backfill_last_modified)
     app.cli.add_command(commands.doctor)
     app.cli.add_command(commands.generate_config)
     app.cli.add_command(commands.ocr_cli)
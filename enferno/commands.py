@@ -689,6 +689,51 @@ def doctor() -> None:
     raise SystemExit(1 if failed else 0)
 
 
+@click.command("backfill-last-modified")
+@click.option("--batch-size", default=500, show_default=True, help="Rows per transaction")
+@click.option("--dry-run", is_flag=True, help="Report what would be filled without writing")
+@with_appcontext
+def backfill_last_modified(batch_size: int, dry_run: bool) -> None:
+    """Fill in last_modified of bulletins, actors and incidents (one-time, resumable).
+
+    New revisions write last_modified along with their history row. Items
+    revised before the column existed get the time of their latest history
+    row, or their own updated_at when they have none.
+
+    Transitional command for pre-existing data: remove it once deployed
+    installs have run it.
+    """
+    from sqlalchemy import text as sa_text
+
+    for table in ("bulletin", "actor", "incident"):
+        total = db.session.execute(
+            sa_text(f"SELECT count(*) FROM {table} WHERE last_modified IS NULL")
+        ).scalar()
+        if dry_run or not total:
+            click.echo(f"{table}: {total:,} rows without last_modified.")
+            continue
+
+        filled = 0
+        while True:
+            result = db.session.execute(
+                sa_text(
+                    f"UPDATE {table} SET last_modified = COALESCE("
+                    f"(SELECT max(h.updated_at) FROM {table}_history h "
+                    f"WHERE h.{table}_id = {table}.id), {table}.updated_at, {table}.created_at) "
+                    f"WHERE id IN (SELECT id FROM {table} WHERE last_modified IS NULL "
+                    "ORDER BY id LIMIT :batch)"
+                ),
+                {"batch": batch_size},
+            )
+            db.session.commit()
+            if not result.rowcount:
+                break
+            filled += result.rowcount
+            click.echo(f"  {table}: {filled:,}/{total:,} filled")
+
+        click.echo(f"{table}: {filled:,} rows filled.")
+
+
 @click.command()
 @with_appcontext
 def generate_config() -> None:
@@ -70,12 +70,16 @@ class Export(db.Model, BaseMixin):
         (BAY-01-026). Admins keep everything; others keep only in-scope items.
         """
         from enferno.admin.models import Actor, Bulletin, Incident
+        from enferno.utils.search_utils import access_filter
 
         model = {"bulletin": Bulletin, "actor": Actor, "incident": Incident}.get(table)
-        if not model or not isinstance(items, list):
+        if not model or not isinstance(items, list) or not current_user:
             return []
-        rows = model.query.filter(model.id.in_(items)).all()
-        allowed = {r.id for r in rows if current_user and current_user.can_access(r)}
+        query = db.session.query(model.id).filter(model.id.in_(items))
+        access = access_filter(table, current_user)
+        if access is not None:
+            query = query.filter(access)
+        allowed = {row.id for row in query}
         return [i for i in items if i in allowed]
 
     def from_json(self, table: str, json: dict) -> "Export":
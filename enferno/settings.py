@@ -179,6 +179,12 @@ class Config(object):
     # timeout-then-queue behavior) and the bound for background re-runs
     SEARCH_TIMEOUT = int(os.environ.get("SEARCH_TIMEOUT", 30))
     BACKGROUND_SEARCH_TIME_LIMIT = int(os.environ.get("BACKGROUND_SEARCH_TIME_LIMIT", 600))
+    # Seconds a search's result ids stay cached for paging (0 disables)
+    SEARCH_CACHE_TTL = int(os.environ.get("SEARCH_CACHE_TTL", 300))
+    # Run the entity searches of the cross-entity search on separate connections
+    FEDERATED_SEARCH_PARALLEL = (
+        os.environ.get("FEDERATED_SEARCH_PARALLEL", "True").lower() == "true"
+    )
 
     # Google 0Auth
     GOOGLE_OAUTH_ENABLED = manager.get_config("GOOGLE_OAUTH_ENABLED")
@@ -400,6 +406,9 @@ class TestConfig:
     VERSION = _read_version()
     SEARCH_TIMEOUT = 0
     BACKGROUND_SEARCH_TIME_LIMIT = 600
+    SEARCH_CACHE_TTL = 0
+    # test rows live in an uncommitted transaction other connections cannot see
+    FEDERATED_SEARCH_PARALLEL = False
 
     # Flask Core Settings
     SECRET_KEY = "test-secret-key-not-for-production"
@@ -28,6 +28,7 @@ const ActorSearchBox = Vue.defineComponent({
   data: () => {
     return {
       translations: window.translations,
+      tagItems: [],
       searches: [],
       repr: '',
       q: {},
@@ -198,6 +199,15 @@ const ActorSearchBox = Vue.defineComponent({
 
   
   methods: {
+    suggestTags: debounce(function (search) {
+      if (!search) return;
+      api.get('/admin/api/tags/', { params: { entity: 'actor', q: search } }).then(res => {
+        this.tagItems = res.data.items.map(item => item.tag);
+      }).catch(() => {
+        this.tagItems = [];
+      });
+    }, 300),
+
     setActivePanels() {
       if (!this.expandActivePanels) {
         return;
@@ -406,6 +416,8 @@ const ActorSearchBox = Vue.defineComponent({
 
                 <v-combobox
                     v-model="q.tags"
+                    :items="tagItems"
+                    @update:search="suggestTags"
                     @update:model-value="val => q.tags = $root.sanitizeCombobox(val)"
                     :label="translations.inTagsAll_"
                     multiple
@@ -426,6 +438,8 @@ const ActorSearchBox = Vue.defineComponent({
 
                 <v-combobox
                     v-model="q.exTags"
+                    :items="tagItems"
+                    @update:search="suggestTags"
                     @update:model-value="val => q.exTags = $root.sanitizeCombobox(val)"
                     :label="translations.exTagsAny_"
                     multiple
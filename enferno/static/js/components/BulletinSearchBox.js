@@ -32,6 +32,7 @@ const BulletinSearchBox = Vue.defineComponent({
   data: () => {
     return {
       translations: window.translations,
+      tagItems: [],
       searches: [],
       saveDialog: false,
       repr: '',
@@ -165,6 +166,15 @@ const BulletinSearchBox = Vue.defineComponent({
   },
 
   methods: {
+    suggestTags: debounce(function (search) {
+      if (!search) return;
+      api.get('/admin/api/tags/', { params: { entity: 'bulletin', q: search } }).then(res => {
+        this.tagItems = res.data.items.map(item => item.tag);
+      }).catch(() => {
+        this.tagItems = [];
+      });
+    }, 300),
+
     setActivePanels() {
       if (!this.expandActivePanels) {
         return;
@@ -335,6 +345,8 @@ const BulletinSearchBox = Vue.defineComponent({
 
                 <v-combobox
                     v-model="q.tags"
+                    :items="tagItems"
+                    @update:search="suggestTags"
                     @update:model-value="val => q.tags = $root.sanitizeCombobox(val)"
                     :label="translations.inTags_"
                     multiple
@@ -356,6 +368,8 @@ const BulletinSearchBox = Vue.defineComponent({
 
                 <v-combobox
                       v-model="q.exTags"
+                      :items="tagItems"
+                      @update:search="suggestTags"
                       @update:model-value="val => q.exTags = $root.sanitizeCombobox(val)"
                       :label="translations.exTags_"
                       multiple
@@ -32,6 +32,30 @@ const FieldListItem = Vue.defineComponent({
         }
     },
     computed: {
+        // search index state of the saved field, the index is built in the background
+        searchIndexStatus() {
+            return this.field.searchable ? this.field.index_status : null
+        },
+        searchIndexColor() {
+            if (this.searchIndexStatus === 'failed') return 'error'
+            return this.field.searchable ? 'primary' : null
+        },
+        searchIndexIcon() {
+            if (this.searchIndexStatus === 'building') return 'mdi-progress-clock'
+            if (this.searchIndexStatus === 'failed') return 'mdi-magnify-remove-outline'
+            return 'mdi-magnify'
+        },
+        searchIndexTooltip() {
+            return {
+                building: this.translations.searchIndexBuilding_,
+                valid: this.translations.searchIndexValid_,
+                failed: this.translations.searchIndexFailed_,
+            }[this.searchIndexStatus] || (
+                !this.field.searchable && this.field.index_status === 'dropping'
+                    ? this.translations.searchIndexDropping_
+                    : this.translations.markFieldAsSearchable_
+            )
+        },
         componentProps() {
             return this.mapFieldToComponent(this.field)
         },
@@ -176,9 +200,9 @@ const FieldListItem = Vue.defineComponent({
                         </v-tooltip>
                         <v-tooltip location="top">
                             <template v-slot:activator="{ props }">
-                                <v-btn v-bind="props" :disabled="field.core" @click="field.searchable = !field.searchable" density="comfortable" :color="field.searchable ? 'primary' : null" variant="flat" icon size="small"><v-icon>mdi-magnify</v-icon></v-btn>
+                                <v-btn v-bind="props" :disabled="field.core" @click="field.searchable = !field.searchable" density="comfortable" :color="searchIndexColor" variant="flat" icon size="small"><v-icon>{{ searchIndexIcon }}</v-icon></v-btn>
                             </template>
-                            {{ translations.markFieldAsSearchable_ }}
+                            {{ searchIndexTooltip }}
                         </v-tooltip>
                         <v-tooltip location="top">
                             <template v-slot:activator="{ props }">
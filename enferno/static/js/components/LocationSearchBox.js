@@ -9,6 +9,7 @@ const LocationSearchBox = Vue.defineComponent({
   data: () => {
     return {
       translations: window.translations,
+      tagItems: [],
       q: {},
       openPanels: ['0'],
     };
@@ -32,6 +33,17 @@ const LocationSearchBox = Vue.defineComponent({
     this.q = this.modelValue;
   },
 
+  methods: {
+    suggestTags: debounce(function (search) {
+      if (!search) return;
+      api.get('/admin/api/tags/', { params: { entity: 'location', q: search } }).then(res => {
+        this.tagItems = res.data.items.map(item => item.tag);
+      }).catch(() => {
+        this.tagItems = [];
+      });
+    }, 300),
+  },
+
   computed: {
     textSearchCount() {
       let count = 0;
@@ -145,6 +157,8 @@ const LocationSearchBox = Vue.defineComponent({
 
                 <v-combobox
                     v-model="q.tags"
+                    :items="tagItems"
+                    @update:search="suggestTags"
                     :label="translations.tags_"
                     multiple
                     chips
@@ -157,6 +171,7 @@ const LocationSearchBox = Vue.defineComponent({
                 ></v-combobox>
                 <div class="d-flex align-center mt-n2 mb-4">
                   <v-checkbox :label="translations.any_" density="compact" v-model="q.optags" color="primary" class="me-4" hide-details></v-checkbox>
+                  <v-checkbox :label="translations.exactMatch_" density="compact" v-model="q.inExact" color="primary" class="me-4" hide-details></v-checkbox>
                 </div>
 
                 <v-divider class="mb-4"></v-divider>
@@ -611,7 +611,8 @@ const formBuilderMixin = {
         const response = await api.get(
           `/admin/api/dynamic-fields/?entity_type=${entityType}&active=true&searchable=true`,
         );
-        const fields = response?.data?.data ?? [];
+        // fields become searchable once their search index is built
+        const fields = (response?.data?.data ?? []).filter((field) => field.index_status === 'valid');
         this.formBuilder.searchableDynamicFields[entityType] = this.sortFields(fields);
       } catch (err) {
         console.error(err);
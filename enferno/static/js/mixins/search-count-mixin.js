@@ -0,0 +1,61 @@
+// Estimated list totals: large searches report a capped or planner-estimated
+// total, and the exact figure is counted in the background on request.
+const searchCountMixin = {
+  data() {
+    return {
+      countType: 'exact',
+      exactCountLoading: false,
+      exactCountToken: null,
+    };
+  },
+  computed: {
+    totalCountLabel() {
+      const total = this.totalCount.toLocaleString('en-US');
+      return this.countType === 'estimate' ? `~${total}+` : total;
+    },
+  },
+  methods: {
+    setTotalCount(data) {
+      this.totalCount = data.total;
+      this.countType = data.totalType || 'exact';
+      // a new search supersedes any exact count still running
+      this.exactCountToken = null;
+      this.exactCountLoading = false;
+    },
+    requestExactCount(entity) {
+      if (this.exactCountLoading) return;
+      this.exactCountLoading = true;
+      axios
+        .post('/admin/api/search-count/', { entity, q: this.search })
+        .then((response) => {
+          this.exactCountToken = response.data.token;
+          this.pollExactCount(this.exactCountToken);
+        })
+        .catch(() => {
+          this.exactCountLoading = false;
+          this.showSnack('Could not count results');
+        });
+    },
+    pollExactCount(token, delay = 1000) {
+      setTimeout(() => {
+        if (token !== this.exactCountToken) return;
+        axios
+          .get(`/admin/api/search-count/${token}`, { headers: { 'X-Silent-Poll': '1' } })
+          .then((response) => {
+            if (token !== this.exactCountToken) return;
+            if (response.status === 202) {
+              this.pollExactCount(token, Math.min(delay * 2, 10000));
+              return;
+            }
+            this.totalCount = response.data.total;
+            this.countType = response.data.totalType;
+            this.exactCountLoading = false;
+          })
+          .catch(() => {
+            this.exactCountLoading = false;
+            this.showSnack('Could not count results');
+          });
+      }, delay);
+    },
+  },
+};
@@ -7,6 +7,7 @@ from celery.schedules import crontab
 from celery.signals import worker_process_init
 
 from enferno.extensions import db
+from enferno.utils.json_provider import register_celery_serializer
 from enferno.utils.logging_utils import get_logger
 
 # Simple test detection - use TestConfig if in test environment
@@ -20,12 +21,16 @@ else:
     cfg = Config()
 
 celery = Celery("tasks", broker=cfg.celery_broker_url)
+register_celery_serializer()
 # Restrict to JSON only - pickle allows arbitrary code execution
+# Results (graphs, search ids) can be large, encode them with orjson.
+# json stays accepted so results stored before the switch still decode.
 celery.conf.update(
     {
         "accept_content": ["json"],
         "task_serializer": "json",
-        "result_serializer": "json",
+        "result_serializer": "orjson",
+        "result_accept_content": ["json", "orjson"],
     }
 )
 celery.conf.update({"result_backend": os.environ.get("CELERY_RESULT_BACKEND", cfg.result_backend)})
@@ -160,7 +165,11 @@ def setup_periodic_tasks(sender: Any, **kwargs: dict[str, Any]) -> None:
 
 
 # --- Import submodules so Celery discovers all tasks ---
-from enferno.tasks.background_search import background_search  # noqa: E402, F401
+from enferno.tasks.background_search import (  # noqa: E402, F401
+    background_count,
+    background_search,
+    refresh_saved_search,
+)
 from enferno.tasks.bulk_ops import (  # noqa: E402
     bulk_update_actors,
     bulk_update_bulletins,
@@ -178,6 +187,7 @@ from enferno.tasks.deduplication import (  # noqa: E402
     start_dedup,
     update_stats,
 )
+from enferno.tasks.dynamic_fields import sync_dynamic_field_index  # noqa: E402
 from enferno.tasks.exports import (  # noqa: E402
     export_cleanup_cron,
     generate_csv_file,
@@ -227,6 +237,8 @@ __all__ = [
     "process_dedup",
     "start_dedup",
     "update_stats",
+    # dynamic_fields
+    "sync_dynamic_field_index",
     # exports
     "export_cleanup_cron",
     "generate_csv_file",
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-"""Background continuation of interactive searches that hit SEARCH_TIMEOUT."""
+"""Background continuation of interactive searches that hit SEARCH_TIMEOUT,
+and exact counts of searches whose interactive total was estimated."""
 
 from flask import current_app
 from sqlalchemy import text
@@ -11,6 +12,7 @@ from enferno.extensions import db
 from enferno.tasks import celery
 from enferno.user.models import User
 from enferno.utils import background_search as results
+from enferno.utils import saved_search, search_count
 from enferno.utils.logging_utils import get_logger
 from enferno.utils.search_utils import SearchUtils
 
@@ -23,37 +25,87 @@ ENTITY_MODELS = {"bulletin": Bulletin, "actor": Actor, "incident": Incident}
 def background_search(token: str, user_id: int, entity: str, q: list) -> None:
     model = ENTITY_MODELS[entity]
     user = db.session.get(User, user_id)
+    results.start_result(token, user_id, entity)
+    link = f"/admin/{entity}s/?bgs={token}"
+    found = 0
     try:
         limit = current_app.config.get("BACKGROUND_SEARCH_TIME_LIMIT", 600)
-        db.session.execute(text(f"SET LOCAL statement_timeout = {int(limit * 1000)}"))
         query = (
-            SearchUtils(q, entity)
+            SearchUtils(q, entity, user=user)
             .get_query()
             .with_only_columns(model.id, maintain_column_froms=True)
+            .distinct()
             .order_by(model.id.desc())
             .limit(results.MAX_RESULTS)
         )
-        ids = list(dict.fromkeys(db.session.execute(query).scalars()))
+        # Stream through a server-side cursor on a connection of its own, so each
+        # batch is readable as soon as it is fetched and the notification commits
+        # on the session do not close the cursor.
+        with db.engine.connect() as conn:
+            conn.execute(text(f"SET LOCAL statement_timeout = {int(limit * 1000)}"))
+            result = conn.execute(query, execution_options={"yield_per": results.BATCH_SIZE})
+            for batch in result.scalars().partitions():
+                found = results.append_ids(token, batch)
+                if found == len(batch) == results.BATCH_SIZE:
+                    # more is coming, let the user start on the first batch
+                    Notification.send_notification_for_event(
+                        Constants.NotificationEvent.BACKGROUND_SEARCH_STATUS,
+                        user,
+                        "Search Results Arriving",
+                        f"Your background {entity} search found its first {found} results, "
+                        "the rest is added as the search continues.",
+                        link=link,
+                    )
     except Exception:
         db.session.rollback()
+        results.finish_result(token, failed=True)
         logger.exception(f"Background {entity} search failed for user {user_id}")
         Notification.send_notification_for_event(
             Constants.NotificationEvent.BACKGROUND_SEARCH_STATUS,
             user,
             "Search Failed",
-            f"Your background {entity} search could not be completed. "
-            "Try narrowing the search filters.",
+            f"Your background {entity} search could not be completed"
+            + (f" after {found} results. " if found else ". ")
+            + "Try narrowing the search filters.",
         )
         return
 
-    db.session.rollback()  # end the timed read transaction before writing
-    results.store_result(token, user_id, entity, ids)
-    capped = "+" if len(ids) == results.MAX_RESULTS else ""
+    results.finish_result(token)
+    capped = "+" if found == results.MAX_RESULTS else ""
     Notification.send_notification_for_event(
         Constants.NotificationEvent.BACKGROUND_SEARCH_STATUS,
         user,
         "Search Completed",
-        f"Your {entity} search finished with {len(ids)}{capped} results, "
-        "available for 24 hours.",
-        link=f"/admin/{entity}s/?bgs={token}",
+        f"Your {entity} search finished with {found}{capped} results, " "available for 24 hours.",
+        link=link,
     )
+
+
+@celery.task
+def background_count(token: str, user_id: int, entity: str, q: list | dict) -> None:
+    user = db.session.get(User, user_id)
+    try:
+        limit = current_app.config.get("BACKGROUND_SEARCH_TIME_LIMIT", 600)
+        db.session.execute(text(f"SET LOCAL statement_timeout = {int(limit * 1000)}"))
+        total = search_count.exact_count(SearchUtils(q, entity, user=user).get_query())
+    except Exception:
+        db.session.rollback()
+        logger.exception(f"Background {entity} count failed for user {user_id}")
+        # a None total tells the polling client to stop
+        search_count.store_count(token, user_id, entity, None)
+        return
+
+    db.session.rollback()
+    search_count.store_count(token, user_id, entity, total)
+
+
+@celery.task
+def refresh_saved_search(query_id: int, full: bool = True) -> None:
+    """Build the stored ids of a materialized saved search, from scratch unless full is False."""
+    limit = current_app.config.get("BACKGROUND_SEARCH_TIME_LIMIT", 600)
+    try:
+        db.session.execute(text(f"SET LOCAL statement_timeout = {int(limit * 1000)}"))
+        saved_search.refresh(query_id, full=full)
+    except Exception:
+        db.session.rollback()
+        logger.exception(f"Saved search {query_id} could not be materialized")
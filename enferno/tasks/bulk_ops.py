@@ -17,6 +17,7 @@ from enferno.admin.models.Notification import Notification
 from enferno.extensions import db
 from enferno.tasks import BULK_CHUNK_SIZE, celery, chunk_list
 from enferno.user.models import Role, User
+from enferno.utils.date_helper import DateHelper
 from enferno.utils.logging_utils import get_logger
 
 logger = get_logger("celery.tasks.bulk_ops")
@@ -120,10 +121,21 @@ def bulk_update_bulletins(ids: list, bulk: dict, cur_user_id: t.id) -> None:
             db.session.add(bulletin)
             mutated.append(bulletin)
 
+        revised = DateHelper.utcnow()
         revmaps = [
-            {"bulletin_id": b.id, "user_id": cur_user.id, "data": b.to_dict()} for b in mutated
+            {
+                "bulletin_id": b.id,
+                "user_id": cur_user.id,
+                "data": b.to_dict(),
+                "created_at": revised,
+                "updated_at": revised,
+            }
+            for b in mutated
         ]
         db.session.bulk_insert_mappings(BulletinHistory, revmaps)
+        # keep the stored latest revision time in step with the history rows
+        for b in mutated:
+            b.last_modified = revised
 
         # commit session when a batch of items and revisions are added
         db.session.commit()
@@ -264,8 +276,20 @@ def bulk_update_actors(ids: list, bulk: dict, cur_user_id: t.id) -> None:
             db.session.add(actor)
             mutated.append(actor)
 
-        revmaps = [{"actor_id": a.id, "user_id": cur_user.id, "data": a.to_dict()} for a in mutated]
+        revised = DateHelper.utcnow()
+        revmaps = [
+            {
+                "actor_id": a.id,
+                "user_id": cur_user.id,
+                "data": a.to_dict(),
+                "created_at": revised,
+                "updated_at": revised,
+            }
+            for a in mutated
+        ]
         db.session.bulk_insert_mappings(ActorHistory, revmaps)
+        for a in mutated:
+            a.last_modified = revised
 
         # commit session when a batch of items and revisions are added
         db.session.commit()
@@ -410,10 +434,20 @@ def bulk_update_incidents(ids: list, bulk: dict, cur_user_id: t.id) -> None:
             db.session.add(incident)
             mutated.append(incident)
 
+        revised = DateHelper.utcnow()
         revmaps = [
-            {"incident_id": i.id, "user_id": cur_user.id, "data": i.to_dict()} for i in mutated
+            {
+                "incident_id": i.id,
+                "user_id": cur_user.id,
+                "data": i.to_dict(),
+                "created_at": revised,
+                "updated_at": revised,
+            }
+            for i in mutated
         ]
         db.session.bulk_insert_mappings(IncidentHistory, revmaps)
+        for i in mutated:
+            i.last_modified = revised
 
         # commit session when a batch of items and revisions are added
         db.session.commit()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Search indexes of dynamic fields.
+
+CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block, so they
+run here on an autocommit connection, after the field change is committed. The
+table stays writable during the build; the field's index_status tells the
+editor and the search where the index stands.
+"""
+
+from sqlalchemy import text
+
+from enferno.admin.models.DynamicField import DynamicField
+from enferno.extensions import db
+from enferno.tasks import celery
+from enferno.utils.logging_utils import get_logger
+
+logger = get_logger("celery.tasks.dynamic_fields")
+
+_INDEX_VALID = text("""
+    SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE c.relname = :name
+""")
+
+
+@celery.task
+def sync_dynamic_field_index(field_id: int) -> None:
+    """Build or drop a dynamic field's search index to match its searchable flag."""
+    field = db.session.get(DynamicField, field_id)
+    if field is None:
+        return
+    searchable, index_name, index_sql = field.searchable, field.index_name, field.index_sql()
+    db.session.rollback()  # no transaction may stay open around the concurrent DDL
+
+    try:
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            if searchable:
+                # an interrupted concurrent build leaves an invalid index that IF NOT EXISTS would keep
+                if conn.execute(_INDEX_VALID, {"name": index_name}).scalar() is False:
+                    conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+                conn.execute(text(index_sql))
+                valid = conn.execute(_INDEX_VALID, {"name": index_name}).scalar()
+                status = DynamicField.INDEX_VALID if valid else DynamicField.INDEX_FAILED
+            else:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+                status = None
+    except Exception:
+        logger.exception(f"Index {'build' if searchable else 'drop'} failed for {index_name}")
+        status = DynamicField.INDEX_FAILED
+
+    field = db.session.get(DynamicField, field_id)
+    # searchable was toggled while the index was processed, the newer task decides
+    if field is None or field.searchable != searchable:
+        return
+    field.index_status = status
+    db.session.commit()
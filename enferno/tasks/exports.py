@@ -7,7 +7,7 @@ from typing import Any, Literal, Optional
 import boto3
 import pandas as pd
 from celery import chain
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 
 import enferno.utils.typing as t
 from enferno.extensions import db
@@ -15,9 +15,12 @@ from enferno.admin.models import Actor, Bulletin, Incident
 from enferno.export.models import Export
 from enferno.tasks import BULK_CHUNK_SIZE, celery, cfg, chunk_list
 from enferno.utils.csv_utils import convert_list_attributes, escape_csv_formula_cell
+from enferno.utils import json_provider
 from enferno.utils.date_helper import DateHelper
 from enferno.utils.logging_utils import get_logger
 from enferno.utils.pdf_utils import PDFUtil
+from enferno.utils.search_utils import access_filter
+from enferno.utils.serializer import serialize
 
 logger = get_logger("celery.tasks.exports")
 
@@ -54,27 +57,32 @@ def generate_export(export_id: t.id) -> Any:
         raise NotImplementedError(f"Unsupported export file format: {export_request.file_format!r}")
 
 
-def _accessible_items(requester, query_iter, export_id: t.id):
-    """Yield only the items the export requester is authorised to access.
+def _accessible_items(requester, model, ids: list, export_id: t.id) -> list:
+    """Load the requested items the export requester is authorised to access.
 
-    Filters here mirror the per-record group check enforced on direct
-    GET endpoints. Without it the Celery export pipeline would happily
-    serialise restricted items the requester cannot open in the UI.
+    Access is decided in SQL with the same role predicate the search endpoints
+    use, so restricted rows are never loaded. Without it the Celery export
+    pipeline would happily serialise restricted items the requester cannot
+    open in the UI. Items are returned in the order of ``ids``.
     """
     if not requester:
         logger.warning("Export #%s has no requester; skipping all items", export_id)
-        return
-    for item in query_iter:
-        if requester.can_access(item):
-            yield item
-        else:
+        return []
+    stmt = select(model).where(model.id.in_(ids))
+    access = access_filter(model.__tablename__, requester)
+    if access is not None:
+        stmt = stmt.where(access)
+    items = {item.id: item for item in db.session.scalars(stmt)}
+    for item_id in ids:
+        if item_id not in items:
             logger.warning(
                 "Export #%s skipped restricted %s id=%s for requester %s",
                 export_id,
-                item.__tablename__,
-                item.id,
+                model.__tablename__,
+                item_id,
                 requester.id,
             )
+    return [items[item_id] for item_id in ids if item_id in items]
 
 
 def clear_failed_export(export_request: Export) -> None:
@@ -115,20 +123,17 @@ def generate_pdf_files(export_id: t.id) -> t.id | Literal[False]:
     try:
         for group in chunks:
             if export_request.table == "bulletin":
-                rows = Bulletin.query.filter(Bulletin.id.in_(group))
-                for bulletin in _accessible_items(requester, rows, export_id):
+                for bulletin in _accessible_items(requester, Bulletin, group, export_id):
                     pdf = PDFUtil(bulletin)
                     pdf.generate_pdf(f"{Export.export_dir}/{dir_id}/{pdf.filename}")
 
             elif export_request.table == "actor":
-                rows = Actor.query.filter(Actor.id.in_(group))
-                for actor in _accessible_items(requester, rows, export_id):
+                for actor in _accessible_items(requester, Actor, group, export_id):
                     pdf = PDFUtil(actor)
                     pdf.generate_pdf(f"{Export.export_dir}/{dir_id}/{pdf.filename}")
 
             elif export_request.table == "incident":
-                rows = Incident.query.filter(Incident.id.in_(group))
-                for incident in _accessible_items(requester, rows, export_id):
+                for incident in _accessible_items(requester, Incident, group, export_id):
                     pdf = PDFUtil(incident)
                     pdf.generate_pdf(f"{Export.export_dir}/{dir_id}/{pdf.filename}")
 
@@ -162,21 +167,16 @@ def generate_json_file(export_id: t.id) -> t.id | Literal[False]:
     file_path, dir_id = Export.generate_export_file()
     export_type = export_request.table
     try:
-        with open(f"{file_path}.json", "a") as file:
+        with open(f"{file_path}.json", "a", encoding="utf-8") as file:
             file.write("{ \n")
             file.write(f'"{export_type}s": [ \n')
             for group in chunks:
-                if export_type == "bulletin":
-                    rows = Bulletin.query.filter(Bulletin.id.in_(group))
-                elif export_type == "actor":
-                    rows = Actor.query.filter(Actor.id.in_(group))
-                elif export_type == "incident":
-                    rows = Incident.query.filter(Incident.id.in_(group))
-                else:
-                    rows = []
-                batch = ",".join(
-                    item.to_json() for item in _accessible_items(requester, rows, export_id)
+                model = {"bulletin": Bulletin, "actor": Actor, "incident": Incident}.get(
+                    export_type
                 )
+                rows = _accessible_items(requester, model, group, export_id) if model else []
+                items = serialize(model, [item.id for item in rows]) if rows else []
+                batch = ",".join(json_provider.dumps(item) for item in items)
                 if batch:
                     file.write(f"{batch}\n")
                 # less db overhead
@@ -212,8 +212,8 @@ def generate_csv_file(export_id: t.id) -> t.id | Literal[False]:
     try:
         csv_df = pd.DataFrame()
         if export_type == "bulletin":
-            rows = (b for i in export_request.items if (b := db.session.get(Bulletin, i)))
-            for bulletin in _accessible_items(requester, rows, export_id):
+            rows = _accessible_items(requester, Bulletin, export_request.items, export_id)
+            for bulletin in rows:
                 # adjust list attributes to normal dicts
                 adjusted = convert_list_attributes(bulletin.to_csv_dict())
                 # normalize
@@ -221,8 +221,8 @@ def generate_csv_file(export_id: t.id) -> t.id | Literal[False]:
                 csv_df = df if csv_df.empty else pd.merge(csv_df, df, how="outer")
 
         elif export_type == "actor":
-            rows = (a for i in export_request.items if (a := db.session.get(Actor, i)))
-            for actor in _accessible_items(requester, rows, export_id):
+            rows = _accessible_items(requester, Actor, export_request.items, export_id)
+            for actor in rows:
                 # adjust list attributes to normal dicts
                 actor_dict = convert_list_attributes(actor.to_csv_dict())
 
@@ -278,9 +278,9 @@ def generate_export_media(previous_result: int) -> t.id | Literal[False]:
     # get list of previous entity ids and export their medias
     # dynamic query based on table
     if export_type == "bulletin":
-        items = Bulletin.query.filter(Bulletin.id.in_(export_request.items))
+        model = Bulletin
     elif export_type == "actor":
-        items = Actor.query.filter(Actor.id.in_(export_request.items))
+        model = Actor
     elif export_type == "incident":
         # incidents has no media
         # UI switch disabled, but just in case...
@@ -294,7 +294,10 @@ def generate_export_media(previous_result: int) -> t.id | Literal[False]:
             region_name=cfg.AWS_REGION,
         )
 
-    for item in _accessible_items(export_request.requester, items, export_request.id):
+    items = _accessible_items(
+        export_request.requester, model, export_request.items, export_request.id
+    )
+    for item in items:
         for media in item.medias:
             target_file = f"{Export.export_dir}/{export_request.file_id}/{media.media_file}"
 
@@ -5,6 +5,7 @@ from typing import Optional
 
 from enferno.extensions import db, rds
 from enferno.tasks import celery
+from enferno.user.models import User
 from enferno.utils.flowmap_utils import FlowmapUtils
 from enferno.utils.logging_utils import get_logger
 from enferno.utils.search_utils import SearchUtils
@@ -49,7 +50,8 @@ def generate_actor_flowmap(query_json: list, user_id: int) -> Optional[str]:
         rds.delete(error_key)
 
         # Fetch matching actors using SearchUtils (enforces access controls)
-        search_util = SearchUtils(query_json, cls="actor")
+        user = db.session.get(User, user_id)
+        search_util = SearchUtils(query_json, cls="actor", user=user)
         query = search_util.get_query()
         result = db.session.execute(query)
         actors = result.scalars().unique().all()
@@ -97,9 +97,9 @@ def process_graph_generation(
     Returns:
         - Graph data.
     """
-    result_set = get_result_set(query_json, entity_type, type_map)
-    rds.set(f"user{user_id}:graph:status", "pending")
     user = db.session.get(User, user_id)
+    result_set = get_result_set(query_json, entity_type, type_map, user)
+    rds.set(f"user{user_id}:graph:status", "pending")
     graph_utils = GraphUtils(user)
     graph = merge_graphs(result_set, entity_type, graph_utils)
 
@@ -110,7 +110,9 @@ def process_graph_generation(
     return graph
 
 
-def get_result_set(query_json: Any, entity_type: str, type_map: dict) -> Any:
+def get_result_set(
+    query_json: Any, entity_type: str, type_map: dict, user: Optional[User] = None
+) -> Any:
     """
     Retrieve the result set based on the query JSON and entity type.
 
@@ -118,11 +120,12 @@ def get_result_set(query_json: Any, entity_type: str, type_map: dict) -> Any:
         - query_json: Query JSON.
         - entity_type: Entity type.
         - type_map: Type map.
+        - user: User the graph is generated for, restricts the result set to accessible items.
 
     Returns:
         - Result set.
     """
-    search_util = SearchUtils(query_json, cls=entity_type)
+    search_util = SearchUtils(query_json, cls=entity_type, user=user)
     query = search_util.get_query()
     result = db.session.execute(query)
     return result
@@ -139,11 +139,12 @@ def daily_backup_cron():
 @celery.task
 def regenerate_locations() -> None:
     """
-    Regenerate full locations for all entities.
+    Regenerate full locations and the location closure table for all entities.
     """
     try:
         rds.set(Location.CELERY_FLAG, 1)
         Location.regenerate_all_full_locations()
+        Location.rebuild_closure()
     finally:
         rds.delete(Location.CELERY_FLAG)
 
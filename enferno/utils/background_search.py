@@ -3,8 +3,12 @@
 
 Interactive searches run under a bounded Postgres statement_timeout. When the
 database cancels one, the same query is re-run by a Celery worker without the
-interactive bound, the matching ids are stored in Redis for a day, and the user
-gets a notification whose link replays the stored ids in the normal list view.
+interactive bound and the user gets a notification whose link replays the
+stored ids in the normal list view.
+
+The worker streams the matching ids from a server-side cursor and appends them
+to a Redis list batch by batch, next to a small status record, both kept for a
+day. Readers page through the ids found so far while the search is running.
 """
 
 import json
@@ -21,7 +25,9 @@ from enferno.extensions import db, rds
 
 RESULT_TTL = 24 * 60 * 60
 MAX_RESULTS = 10_000
+BATCH_SIZE = 500
 _KEY = "background_search:{}"
+_IDS_KEY = "background_search:{}:ids"
 
 
 def apply_search_timeout() -> None:
@@ -48,17 +54,64 @@ def queue_search(user_id: int, entity: str, q: list) -> str:
     return token
 
 
-def store_result(token: str, user_id: int, entity: str, ids: list) -> None:
-    rds.set(
+def start_result(token: str, user_id: int, entity: str) -> None:
+    """Open the result of a background search, readers see it running and empty."""
+    pipe = rds.pipeline()
+    pipe.delete(_IDS_KEY.format(token))
+    pipe.set(
         _KEY.format(token),
-        json.dumps({"user_id": user_id, "entity": entity, "ids": ids}),
+        json.dumps({"user_id": user_id, "entity": entity, "done": False, "failed": False}),
         ex=RESULT_TTL,
     )
+    pipe.execute()
 
 
-def get_result(token: str) -> dict | None:
+def append_ids(token: str, ids: list) -> int:
+    """Append a batch of matching ids, returns how many ids are stored so far."""
+    if not ids:
+        return rds.llen(_IDS_KEY.format(token))
+    pipe = rds.pipeline()
+    pipe.rpush(_IDS_KEY.format(token), *ids)
+    pipe.expire(_IDS_KEY.format(token), RESULT_TTL)
+    return pipe.execute()[0]
+
+
+def finish_result(token: str, failed: bool = False) -> None:
+    if status := get_status(token):
+        status.update(done=True, failed=failed)
+        rds.set(_KEY.format(token), json.dumps(status), ex=RESULT_TTL)
+
+
+def store_result(token: str, user_id: int, entity: str, ids: list) -> None:
+    """Store a complete result in one go."""
+    start_result(token, user_id, entity)
+    append_ids(token, ids)
+    finish_result(token)
+
+
+def get_status(token: str) -> dict | None:
+    """Owner, entity and progress of a background search, None once expired."""
     payload = rds.get(_KEY.format(token))
-    return json.loads(payload) if payload else None
+    if not payload:
+        return None
+    status = json.loads(payload)
+    status["count"] = rds.llen(_IDS_KEY.format(token))
+    return status
+
+
+def get_ids(token: str, start: int = 0, count: int | None = None) -> list:
+    """A window of the ids found so far, all of them without a count."""
+    if count == 0:
+        return []
+    end = -1 if count is None else start + count - 1
+    return [int(id) for id in rds.lrange(_IDS_KEY.format(token), start, end)]
+
+
+def get_result(token: str) -> dict | None:
+    status = get_status(token)
+    if status is None:
+        return None
+    return {"user_id": status["user_id"], "entity": status["entity"], "ids": get_ids(token)}
 
 
 def timeout_fallback(entity: str):
@@ -16,6 +16,9 @@ class BaseMixin(object):
     updated_at = db.Column(db.DateTime, default=DateHelper.utcnow, onupdate=DateHelper.utcnow)
     deleted = db.Column(db.Boolean, default=False, nullable=False, server_default="false")
 
+    # dynamic field values preloaded for a whole page by enferno.utils.serializer
+    _dynamic_values = None
+
     def serialize_column(self, column_name):
         """
         generic serializer for all table columns (excluding relations etc .)
@@ -54,17 +57,17 @@ class BaseMixin(object):
             return f"---- needs implementation -----> {column_name}"
 
     def get_dynamic_fields(self):
-        from enferno.admin.models.DynamicField import DynamicField
-
         """Get all dynamic fields for this entity type - exclude core fields to avoid collisions with existing model attributes"""
+        from enferno.utils import dynamic_field_cache
+
+        if self._dynamic_values is not None:
+            return self._dynamic_values
 
         # Get the entity type from the table name
         entity_type = self.__tablename__.rstrip("s")  # Remove trailing 's' for plural
 
-        # Query only NON-CORE dynamic fields to avoid collisions with existing model attributes
-        dynamic_fields = DynamicField.query.filter_by(
-            entity_type=entity_type, active=True, core=False
-        ).all()
+        # Only NON-CORE dynamic fields, from the process cache of definitions
+        dynamic_fields = dynamic_field_cache.custom_fields(entity_type)
 
         return {field.name: getattr(self, field.name, None) for field in dynamic_fields}
 
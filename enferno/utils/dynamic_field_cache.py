@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Cached definitions of the active dynamic fields.
+
+Each process keeps a snapshot of the active dynamic fields of every entity and
+answers definition lookups from it, so building a search or serializing an
+item does not query `dynamic_fields`. The entity tables are reflected once per
+snapshot as well, dynamic field columns are added with DDL and are not part of
+the mapped models. As with the label and source trees, a Redis version counter
+is the shared invalidation signal: committed ORM writes to a field (create,
+edit, deactivate, index status changes) bump it and every process reloads its
+snapshot, and reflects the tables again, on the first lookup after the counter
+changes.
+"""
+
+from collections import defaultdict, namedtuple
+
+from sqlalchemy import MetaData, Table, event, select
+from sqlalchemy.orm import Session, object_session
+
+from enferno.admin.models.DynamicField import DynamicField
+from enferno.extensions import db, rds
+
+_KEY = "dynamic_fields:version"
+_PENDING = "dynamic_fields_pending"
+
+# detached copy of a field's definition, safe to share between sessions and threads
+FieldDefinition = namedtuple(
+    "FieldDefinition", "id name entity_type field_type core searchable index_status schema_config"
+)
+
+_state = {"version": None, "snapshot": None, "tables": {}}
+
+
+def invalidate() -> None:
+    """Drop the cached definitions in every process. Call after the write is committed."""
+    rds.incr(_KEY)
+    _state["snapshot"] = None
+    _state["tables"] = {}
+
+
+def _load() -> tuple[dict, str | None]:
+    version = rds.get(_KEY)
+    snapshot = _state["snapshot"]
+    if snapshot is not None and version == _state["version"]:
+        return snapshot, version
+    rows = db.session.execute(
+        select(DynamicField).where(DynamicField.active.is_(True)).order_by(DynamicField.sort_order)
+    ).scalars()
+    snapshot = defaultdict(list)
+    for field in rows:
+        snapshot[field.entity_type].append(
+            FieldDefinition(
+                field.id,
+                field.name,
+                field.entity_type,
+                field.field_type,
+                field.core,
+                field.searchable,
+                field.index_status,
+                dict(field.schema_config or {}),
+            )
+        )
+    snapshot = dict(snapshot)
+    _state["snapshot"], _state["version"], _state["tables"] = snapshot, version, {}
+    return snapshot, version
+
+
+def version() -> str:
+    """Current version of the definitions, changes whenever a field is written."""
+    _, current = _load()
+    return current.decode() if isinstance(current, bytes) else str(current)
+
+
+def active_fields(entity_type: str) -> list[FieldDefinition]:
+    """
+    Get the active dynamic fields of an entity.
+
+    Args:
+        - entity_type: one of 'bulletin', 'actor', 'incident'.
+
+    Returns:
+        - list of field definitions in sort order.
+    """
+    snapshot, _ = _load()
+    return snapshot.get(entity_type, [])
+
+
+def searchable_fields(entity_type: str) -> dict[str, FieldDefinition]:
+    """
+    Get the dynamic fields of an entity the search can filter on.
+
+    Fields whose index is still building (or failed) are not searched yet.
+
+    Returns:
+        - dictionary of field name to definition.
+    """
+    return {
+        field.name: field
+        for field in active_fields(entity_type)
+        if field.searchable and field.index_status == DynamicField.INDEX_VALID
+    }
+
+
+def custom_fields(entity_type: str) -> list[FieldDefinition]:
+    """Get the active non-core dynamic fields of an entity, the ones serialized from its table."""
+    return [field for field in active_fields(entity_type) if not field.core]
+
+
+def _reflect(entity_type: str) -> Table:
+    return Table(entity_type, MetaData(), autoload_with=db.engine)
+
+
+def table(entity_type: str) -> Table:
+    """
+    Get the reflected table of an entity, including the columns of its dynamic fields.
+
+    Args:
+        - entity_type: one of 'bulletin', 'actor', 'incident'.
+
+    Returns:
+        - the table as it was when the current definitions were loaded.
+    """
+    _load()
+    tables = _state["tables"]
+    if entity_type not in tables:
+        tables[entity_type] = _reflect(entity_type)
+    return tables[entity_type]
+
+
+def _mark_pending(mapper, connection, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info[_PENDING] = True
+
+
+for _evt in ("after_insert", "after_update", "after_delete"):
+    event.listen(DynamicField, _evt, _mark_pending)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session) -> None:
+    if session.info.pop(_PENDING, None):
+        invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session) -> None:
+    # the local snapshot may have been loaded from the rolled back writes
+    if session.info.pop(_PENDING, None):
+        _state["snapshot"] = None
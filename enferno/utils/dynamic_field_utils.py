@@ -5,7 +5,8 @@ Used by both single-field endpoints and the bulk-save endpoint.
 
 Key characteristics:
 - No HTTP request/response handling
-- No db.session.commit() - caller controls transactions
+- No db.session.commit() - caller controls transactions, and queues the index
+  task of fields whose `index_pending` is set once they are committed
 - Returns validation errors to the caller and raises database errors
 """
 
@@ -152,6 +153,9 @@ def update_field(field_id, field_data):
         if field.field_type == DynamicField.SELECT:
             field.ensure_option_ids()
 
+        # Build or drop the search index when searchable was toggled
+        field.request_index_sync()
+
     # Add to session
     db.session.add(field)
     db.session.flush()
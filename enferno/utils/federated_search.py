@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Text search across bulletins, actors and incidents at once.
+
+The entity searches run concurrently, each in a worker thread with an app
+context, hence a session and pooled connection, of its own. Workers only fetch
+the first page of ids and an estimated total under the interactive statement
+timeout; the caller hydrates the pages afterwards. An entity whose search is
+cancelled by the timeout is queued as a background search on its own while
+the other entities still answer.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from flask import current_app
+from sqlalchemy.exc import OperationalError
+
+from enferno.admin.models import Actor, Bulletin, Incident
+from enferno.extensions import db
+from enferno.user.models import User
+from enferno.utils.background_search import apply_search_timeout, queue_search, search_timed_out
+from enferno.utils.search_cache import hydrate
+from enferno.utils.search_count import count_total
+from enferno.utils.search_utils import SearchUtils
+
+MODELS = {"bulletin": Bulletin, "actor": Actor, "incident": Incident}
+ENTITIES = tuple(MODELS)
+
+
+def entity_query(entity: str, text: str) -> list | dict:
+    """The entity search for a shared text query, incidents take a single block."""
+    block = {"tsv": text}
+    return block if entity == "incident" else [block]
+
+
+def _search_ids(entity: str, q: list | dict, user, per_page: int) -> dict:
+    """First page of ids and estimated total of one entity search, in the current session."""
+    model = MODELS[entity]
+    apply_search_timeout()
+    try:
+        query = SearchUtils(q, entity, user=user).get_query()
+        ids = list(
+            dict.fromkeys(
+                db.session.execute(
+                    query.with_only_columns(model.id, maintain_column_froms=True)
+                    .order_by(model.id.desc())
+                    .limit(per_page + 1)
+                ).scalars()
+            )
+        )
+        total, total_type = count_total(query, "estimate")
+    except OperationalError as error:
+        if not search_timed_out(error):
+            raise
+        db.session.rollback()
+        return {"queued": True, "token": queue_search(user.id, entity, q)}
+    return {"ids": ids, "total": total, "total_type": total_type}
+
+
+def _search_in_thread(app, entity: str, q: list | dict, user_id: int, per_page: int) -> dict:
+    with app.app_context():
+        return _search_ids(entity, q, db.session.get(User, user_id), per_page)
+
+
+def _serialize(entity: str, item) -> dict:
+    if entity == "actor":
+        title, title_ar = item.name, item.name_ar
+    else:
+        title, title_ar = item.title, item.title_ar
+    return {"id": item.id, "title": title, "title_ar": title_ar, "status": item.status}
+
+
+def federated_search(
+    text: str, user, entities: list[str] = ENTITIES, per_page: int = 10
+) -> dict[str, Any]:
+    """
+    Search several entities for the same text.
+
+    Args:
+        - text: the text searched in every entity.
+        - user: the user the searches run for, restricts the results.
+        - entities: entities to search.
+        - per_page: number of items returned per entity.
+
+    Returns:
+        - dict of entity to its first page: items, nextCursor, total and totalType,
+          or queued and the background search token when the entity timed out.
+    """
+    queries = {entity: entity_query(entity, text) for entity in entities}
+    if current_app.config.get("FEDERATED_SEARCH_PARALLEL", True) and len(entities) > 1:
+        app = current_app._get_current_object()
+        with ThreadPoolExecutor(max_workers=len(entities)) as executor:
+            futures = {
+                entity: executor.submit(_search_in_thread, app, entity, q, user.id, per_page)
+                for entity, q in queries.items()
+            }
+            found = {entity: future.result() for entity, future in futures.items()}
+    else:
+        found = {entity: _search_ids(entity, q, user, per_page) for entity, q in queries.items()}
+
+    results = {}
+    for entity, result in found.items():
+        if result.get("queued"):
+            results[entity] = {"queued": True, "token": result["token"]}
+            continue
+        ids = result["ids"]
+        items = hydrate(MODELS[entity], ids[:per_page])
+        results[entity] = {
+            "items": [_serialize(entity, item) for item in items],
+            "nextCursor": str(ids[per_page - 1]) if len(ids) > per_page else None,
+            "total": result["total"],
+            "totalType": result["total_type"],
+        }
+    return results
@@ -1,5 +1,3 @@
-import json
-
 from sqlalchemy import or_
 
 from enferno.admin.models import (
@@ -22,6 +20,7 @@ from enferno.admin.models import (
     AtoaInfo,
 )
 from enferno.extensions import db
+from enferno.utils.json_provider import dumps, loads
 from enferno.admin.models.tables import (
     bulletin_locations,
     incident_locations,
@@ -117,7 +116,7 @@ class GraphUtils:
             raise ValueError("Unsupported entity type")
 
         graph_json["legend"] = self.get_legend()
-        return json.dumps(graph_json)
+        return dumps(graph_json)
 
     def get_bulletin_graph(self, bulletin_id: int) -> dict:
         nodes = []
@@ -363,8 +362,8 @@ class GraphUtils:
 
     @staticmethod
     def merge_graphs(graph_json1: str, graph_json2: str) -> str:
-        graph1 = json.loads(graph_json1)
-        graph2 = json.loads(graph_json2)
+        graph1 = loads(graph_json1)
+        graph2 = loads(graph_json2)
 
         def node_exists(node, nodes):
             return any(n["id"] == node["id"] for n in nodes)
@@ -388,7 +387,7 @@ class GraphUtils:
         merged_graph = {"nodes": merged_nodes, "links": merged_links}
         merged_graph["legend"] = GraphUtils().get_legend()
 
-        return json.dumps(merged_graph)
+        return dumps(merged_graph)
 
     def expanded_graph(self, entity_type: str, entity_id: int) -> str:
         entity_class = class_mapping.get(entity_type)
@@ -1,8 +1,6 @@
-import json
-
-
 from typing import Any
 from flask import Response
+from enferno.utils.json_provider import dumps
 from enferno.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -21,7 +19,7 @@ class HTTPResponse:
             response_data["data"] = data
         if message is not None:
             response_data["message"] = message
-        return Response(json.dumps(response_data), status=status, content_type="application/json")
+        return Response(dumps(response_data), status=status, content_type="application/json")
 
     @staticmethod
     def _json_error(
@@ -36,7 +34,7 @@ class HTTPResponse:
             else:
                 # Log errors we are not sending to the client to aid troubleshooting
                 logger.error("Error details: %s", errors)
-        return Response(json.dumps(response_data), status=status, content_type="application/json")
+        return Response(dumps(response_data), status=status, content_type="application/json")
 
     @staticmethod
     def success(
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""JSON encoding for API responses, graphs and Celery results.
+
+Full bulletin pages, history snapshots and merged graphs run to megabytes, and
+encoding them with the stdlib `json` module is a large share of the request
+time. orjson is used instead: it encodes datetime, date, UUID and dataclass
+values natively and is several times faster on large payloads.
+
+Dates and times are encoded as ISO 8601 strings, not as the RFC 822 strings
+of Flask's default provider.
+"""
+
+import dataclasses
+from datetime import date, time
+from decimal import Decimal
+from typing import Any, Callable
+from uuid import UUID
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+from kombu.serialization import register
+
+# dicts keyed by ids or enum members are encoded like the stdlib does
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(o: Any) -> Any:
+    """Encode the values orjson does not handle natively (Decimal, __html__ objects)."""
+    if isinstance(o, (date, time)):
+        return o.isoformat()
+    if isinstance(o, (Decimal, UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps_bytes(
+    obj: Any, sort_keys: bool = False, indent: bool = False, default: Callable = _default
+) -> bytes:
+    """
+    Encode a value to UTF-8 JSON bytes.
+
+    Args:
+        - obj: the value to encode.
+        - sort_keys: sort the keys of dicts.
+        - indent: indent nested values by two spaces.
+        - default: encodes the values the encoder does not handle itself.
+
+    Returns:
+        - the encoded value.
+    """
+    option = ORJSON_OPTIONS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=default, option=option)
+
+
+def dumps(
+    obj: Any, sort_keys: bool = False, indent: bool = False, default: Callable = _default
+) -> str:
+    """Encode a value to a JSON string, see `dumps_bytes()`."""
+    return dumps_bytes(obj, sort_keys=sort_keys, indent=indent, default=default).decode()
+
+
+def loads(s: str | bytes) -> Any:
+    """Decode a JSON string or UTF-8 bytes."""
+    return orjson.loads(s)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by `dumps()` and `loads()`.
+
+    Calls with json.dumps() arguments the fast encoder has no equivalent for
+    (a custom `cls` or `default`, other indent widths) are handed to the stdlib.
+    """
+
+    default = staticmethod(_default)
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        indent = kwargs.pop("indent", None)
+        sort_keys = kwargs.pop("sort_keys", self.sort_keys)
+        # spacing only changes the stdlib's output, the fast encoder is always compact
+        kwargs.pop("separators", None)
+        kwargs.pop("ensure_ascii", None)
+        if kwargs or indent not in (None, 2):
+            return super().dumps(obj, indent=indent, sort_keys=sort_keys, **kwargs)
+        return dumps(obj, sort_keys=sort_keys, indent=bool(indent), default=self.default)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            dumps_bytes(obj, sort_keys=self.sort_keys, indent=indent, default=self.default) + b"\n",
+            mimetype=self.mimetype,
+        )
+
+
+def register_celery_serializer() -> None:
+    """Register the fast encoder with kombu as the `orjson` serializer."""
+    # decodes to plain data only, like the json serializer
+    register(
+        "orjson",
+        dumps_bytes,
+        loads,
+        content_type="application/x-orjson",
+        content_encoding="utf-8",
+    )
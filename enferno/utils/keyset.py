@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Keyset pagination for search lists ordered by something other than id.
+
+Pages are read with `WHERE (k1, ..., id) < (cursor values)` over the same
+descending sort, so deep pages cost the same as the first one when a matching
+composite index exists. The cursor is an opaque url-safe string holding the
+sort values of the last item of the page.
+
+A nullable leading column sorts its NULLs last, so it pages through the
+non-null values first and then through the NULL rows by the remaining keys.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Select, and_, literal, or_, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from enferno.extensions import db
+
+
+def _json_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+def encode_cursor(values: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values, default=_json_value).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    """Raises ValueError on a malformed cursor."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(values, list):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return values
+
+
+def _coerce(key: ColumnElement, value):
+    """Turn a cursor value back into the key's python type, dates travel as ISO strings."""
+    if value is None or not isinstance(value, str):
+        return value
+    try:
+        if isinstance(key.type, DateTime):
+            return datetime.fromisoformat(value)
+        if isinstance(key.type, Date):
+            return date.fromisoformat(value)
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor value: {value}") from e
+    return value
+
+
+def _nullable(key: ColumnElement) -> bool:
+    return bool(getattr(key, "nullable", False))
+
+
+def _less(keys: list[ColumnElement], bound: list) -> ColumnElement:
+    if len(keys) == 1:
+        return keys[0] < bound[0]
+    return tuple_(*keys) < tuple_(*bound)
+
+
+def _after(keys: list[ColumnElement], values: list) -> ColumnElement:
+    """Condition selecting the rows that follow the given sort values."""
+    first, *rest = keys
+    bound = [literal(value, key.type) for key, value in zip(keys, values)]
+    if not _nullable(first):
+        return _less(keys, bound)
+    if values[0] is None:
+        return and_(first.is_(None), _less(rest, bound[1:]))
+    return or_(_less(keys, bound), first.is_(None))
+
+
+def keyset_page(
+    query: Select, keys: list[ColumnElement], cursor: str | None, per_page: int
+) -> tuple[list, str | None, bool]:
+    """
+    Read one page of a query sorted descending by the given keys.
+
+    Args:
+        - query: the entity select statement.
+        - keys: sort expressions, most significant first. The last one must be
+          unique (the primary key) so the order is total, only the first one
+          may be nullable.
+        - cursor: cursor of the previous page, None for the first page.
+        - per_page: page size.
+
+    Returns:
+        - tuple of the page items, the next cursor (None on the last page) and
+          whether more pages follow.
+    """
+    order = [key.desc().nulls_last() if _nullable(key) else key.desc() for key in keys]
+    stmt = query.add_columns(*keys).order_by(*order)
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(keys) or values[-1] is None:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        stmt = stmt.where(_after(keys, [_coerce(key, v) for key, v in zip(keys, values)]))
+    rows = db.session.execute(stmt.limit(per_page + 1)).all()
+
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    next_cursor = encode_cursor(list(rows[-1][1:])) if has_more else None
+    return [row[0] for row in rows], next_cursor, has_more
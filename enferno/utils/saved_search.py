@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Materialized saved searches.
+
+A saved search with `materialize` set keeps its matching ids in
+`saved_search_result`, so list views and dashboards built on it join the
+stored ids instead of re-running the search on every load.
+
+The ids are built in full once, by a Celery task after the flag is set or the
+search changes, and then refreshed incrementally: only the entities whose
+updated_at is newer than the last refresh are evaluated against the search
+again. The window reaches REFRESH_OVERLAP further back so rows written by
+transactions still open at the previous refresh are not missed; evaluating a
+row twice is harmless. Access roles are not part of the stored ids, they are
+applied for the reading user.
+
+Reads never refresh in the request. They serve the stored ids as they are and
+queue the incremental refresh in the background, at most once per
+REFRESH_INTERVAL, so a refresh after a large bulk update delays no reader.
+"""
+
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import and_, delete, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql import Select
+
+from enferno.admin.models import Actor, Bulletin, Incident, Query
+from enferno.admin.models.tables import saved_search_result
+from enferno.extensions import db, rds
+from enferno.utils.date_helper import DateHelper
+from enferno.utils.search_utils import SearchUtils, access_filter
+
+MODELS = {"bulletin": Bulletin, "actor": Actor, "incident": Incident}
+REFRESH_OVERLAP = timedelta(minutes=5)
+# seconds between incremental refreshes queued by reads of the same saved search
+REFRESH_INTERVAL = 60
+_QUEUED_KEY = "saved_search:{}:refresh_queued"
+
+
+def get_saved_search(query_id: int, user, entity: str) -> Optional[Query]:
+    """Get a saved search of the user for the given entity, None when there is none."""
+    query = db.session.get(Query, query_id)
+    if query is None or query.user_id != user.id or query.query_type != entity:
+        return None
+    return query
+
+
+def refresh(query_id: int, full: bool = False) -> Optional[Query]:
+    """
+    Bring the stored ids of a materialized saved search up to date and commit.
+
+    Refreshes of the same saved search are serialized by its row lock. A full
+    rebuild waits for the lock, an incremental refresh is skipped while another
+    refresh holds it.
+
+    Args:
+        - query_id: id of the saved search.
+        - full: rebuild all ids instead of re-evaluating the updated entities only,
+          implied when the ids were never built.
+
+    Returns:
+        - the saved search, None when it does not exist, is not materialized or
+          the incremental refresh was skipped.
+    """
+    query = db.session.execute(
+        select(Query)
+        .where(Query.id == query_id)
+        .with_for_update(skip_locked=not full)
+        .execution_options(populate_existing=True)
+    ).scalar_one_or_none()
+    if query is None or not query.materialize:
+        return None
+
+    model = MODELS[query.query_type]
+    stored = saved_search_result.c
+    started = DateHelper.utcnow()
+    matching = (
+        SearchUtils(query.data, query.query_type)
+        .get_query()
+        .with_only_columns(literal(query.id), model.id, maintain_column_froms=True)
+    )
+
+    if full or query.refreshed_at is None:
+        db.session.execute(delete(saved_search_result).where(stored.query_id == query.id))
+    else:
+        since = query.refreshed_at - REFRESH_OVERLAP
+        db.session.execute(
+            delete(saved_search_result).where(
+                stored.query_id == query.id,
+                stored.entity_id.in_(select(model.id).where(model.updated_at >= since)),
+            )
+        )
+        matching = matching.where(model.updated_at >= since)
+
+    db.session.execute(
+        insert(saved_search_result)
+        .from_select([stored.query_id, stored.entity_id], matching)
+        .on_conflict_do_nothing()
+    )
+    query.refreshed_at = started
+    db.session.commit()
+    return query
+
+
+def queue_refresh(query_id: int) -> None:
+    """Queue an incremental refresh of a saved search, unless one was queued recently."""
+    from enferno.tasks import refresh_saved_search
+
+    if rds.set(_QUEUED_KEY.format(query_id), 1, nx=True, ex=REFRESH_INTERVAL):
+        refresh_saved_search.delay(query_id, full=False)
+
+
+def clear(query: Query) -> None:
+    """Drop the stored ids of a saved search that changed or is no longer materialized."""
+    db.session.execute(
+        delete(saved_search_result).where(saved_search_result.c.query_id == query.id)
+    )
+    query.refreshed_at = None
+
+
+def stored_query(query: Query, user) -> Optional[Select]:
+    """
+    Select the entities of a materialized saved search from its stored ids.
+
+    The ids are served as they are, an incremental refresh is queued for later reads.
+
+    Args:
+        - query: the saved search.
+        - user: the user reading it, restricts the entities to the ones they can access.
+
+    Returns:
+        - the select statement, None when the saved search is not materialized or
+          its ids are not built yet, in which case the caller runs the search.
+    """
+    if not query.materialize or query.refreshed_at is None:
+        return None
+    queue_refresh(query.id)
+    model = MODELS[query.query_type]
+    stored = saved_search_result.c
+    statement = select(model).join(
+        saved_search_result, and_(stored.query_id == query.id, stored.entity_id == model.id)
+    )
+    if (access := access_filter(query.query_type, user)) is not None:
+        statement = statement.where(access)
+    return statement
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""Cached result ids of entity searches.
+
+A search's ordered ids are stored in Redis under a key built from the
+normalized query, the entity and the user's role set, so paging and reopening
+a saved search slice the cached list and hydrate one page with a single IN
+query instead of re-running the search.
+
+Every table a search reads has a write generation counter in Redis. The
+counters are part of the cache key: committed ORM writes bump them from a
+session hook (`register_search_cache`), bulk paths that bypass the ORM call
+`bump()` directly, and stale entries are never read again and simply expire.
+"""
+
+import hashlib
+import json
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Any, Callable, Optional
+
+from flask import current_app
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from enferno.extensions import db, rds
+from enferno.settings import Config
+
+MAX_CACHED_IDS = 10_000
+_GEN_KEY = "search_cache:gen:{}"
+_KEY = "search_cache:{}:{}"
+_PENDING = "search_cache_pending"
+
+# tables each entity search reads, a write to any of them invalidates its entries
+SEARCH_TABLES = {
+    "bulletin": (
+        "bulletin",
+        "btob",
+        "atob",
+        "itob",
+        "event",
+        "geo_location",
+        "media",
+        "extraction",
+        "label",
+        "location",
+        "source",
+    ),
+    "actor": (
+        "actor",
+        "actor_profile",
+        "atob",
+        "atoa",
+        "itoa",
+        "event",
+        "label",
+        "location",
+        "source",
+    ),
+    "incident": ("incident", "itob", "itoa", "itoi", "event", "label", "location"),
+}
+_TRACKED = frozenset(table for tables in SEARCH_TABLES.values() for table in tables)
+
+CachedPage = namedtuple("CachedPage", "items next_cursor has_more total total_type")
+
+
+def bump(*tables: str) -> None:
+    """Invalidate the cached searches over the given tables. Call after the write is committed."""
+    for table in tables:
+        rds.incr(_GEN_KEY.format(table))
+
+
+def normalize_query(value: Any) -> Any:
+    """Drop the empty filters of a search query, the query builders ignore them."""
+    if isinstance(value, dict):
+        return {
+            k: normalize_query(v)
+            for k, v in value.items()
+            if v is not None and v not in ("", [], {})
+        }
+    if isinstance(value, list):
+        return [normalize_query(v) for v in value]
+    return value
+
+
+def role_set(user) -> str:
+    """Part of the cache key describing what the user can access."""
+    if user.has_role("Admin"):
+        return "admin"
+    restrictive = "r" if Config.get("ACCESS_CONTROL_RESTRICTIVE") else "o"
+    return restrictive + ":" + ",".join(str(id) for id in sorted(role.id for role in user.roles))
+
+
+def cache_key(entity: str, q: Any, user) -> str:
+    """
+    Build the cache key of a search.
+
+    Args:
+        - entity: one of 'bulletin', 'actor', 'incident'.
+        - q: the search query as posted by the client.
+        - user: the user the search runs for.
+
+    Returns:
+        - the Redis key, which changes whenever one of the searched tables is written to.
+    """
+    tables = SEARCH_TABLES[entity]
+    generations = rds.mget([_GEN_KEY.format(table) for table in tables])
+    payload = json.dumps(
+        [normalize_query(q), role_set(user), [int(g or 0) for g in generations]],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return _KEY.format(entity, hashlib.sha256(payload.encode()).hexdigest())
+
+
+def _fetch_ids(model, query) -> tuple[list, bool]:
+    stmt = (
+        query.with_only_columns(model.id, maintain_column_froms=True)
+        .order_by(model.id.desc())
+        .limit(MAX_CACHED_IDS + 1)
+    )
+    ids = list(dict.fromkeys(db.session.execute(stmt).scalars()))
+    complete = len(ids) <= MAX_CACHED_IDS
+    return ids[:MAX_CACHED_IDS], complete
+
+
+def hydrate(model, ids: list, options: tuple = ()) -> list:
+    """Load the given ids with one IN query, keeping their order and skipping deleted rows."""
+    if not ids:
+        return []
+    rows = db.session.execute(select(model).where(model.id.in_(ids)).options(*options))
+    by_id = {item.id: item for item in rows.scalars().unique()}
+    return [by_id[id] for id in ids if id in by_id]
+
+
+def cached_page(
+    model,
+    entity: str,
+    q: Any,
+    user,
+    build_query: Callable,
+    cursor: Optional[str],
+    per_page: int,
+    total_type: Optional[str] = None,
+    options: tuple = (),
+) -> Optional[CachedPage]:
+    """
+    Serve one page of a search from the id cache, running the search on a miss.
+
+    Args:
+        - model: the searched model.
+        - entity: one of 'bulletin', 'actor', 'incident'.
+        - q: the search query.
+        - user: the user the search runs for.
+        - build_query: returns the search query, only called on a miss.
+        - cursor: id of the last item of the previous page, None for the first page.
+        - per_page: page size.
+        - total_type: "exact" or "estimate" when the total is needed, None otherwise.
+        - options: loader options for hydrating the page.
+
+    Returns:
+        - the page, or None when the cache is disabled or the page lies beyond the
+          cached ids, in which case the caller runs the search itself.
+    """
+    ttl = current_app.config.get("SEARCH_CACHE_TTL", 0)
+    if not ttl:
+        return None
+
+    key = cache_key(entity, q, user)
+    payload = rds.get(key)
+    entry = json.loads(payload) if payload else None
+    query = None
+    if entry is None:
+        query = build_query()
+        ids, complete = _fetch_ids(model, query)
+        entry = {"ids": ids, "complete": complete, "total": None, "total_type": None}
+        if complete:
+            entry["total"], entry["total_type"] = len(ids), "exact"
+    ids = entry["ids"]
+
+    start = bisect_right(ids, -int(cursor), key=lambda id: -id) if cursor else 0
+    window = ids[start : start + per_page + 1]
+    if not entry["complete"] and len(window) <= per_page:
+        # the page runs past the cached ids
+        rds.set(key, json.dumps(entry), ex=ttl)
+        return None
+
+    if total_type and entry["total"] is None:
+        from enferno.utils.search_count import count_total
+
+        entry["total"], entry["total_type"] = count_total(query or build_query(), total_type)
+    rds.set(key, json.dumps(entry), ex=ttl)
+
+    has_more = len(window) > per_page
+    page_ids = window[:per_page]
+    return CachedPage(
+        items=hydrate(model, page_ids, options),
+        next_cursor=str(page_ids[-1]) if has_more else None,
+        has_more=has_more,
+        total=entry["total"],
+        total_type=entry["total_type"],
+    )
+
+
+def _track_writes(session, flush_context) -> None:
+    tables = {
+        obj.__table__.name
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if getattr(obj, "__table__", None) is not None and obj.__table__.name in _TRACKED
+    }
+    if tables:
+        session.info.setdefault(_PENDING, set()).update(tables)
+
+
+def _bump_committed(session) -> None:
+    if tables := session.info.pop(_PENDING, None):
+        bump(*tables)
+
+
+def _discard_pending(session) -> None:
+    session.info.pop(_PENDING, None)
+
+
+def register_search_cache(db) -> None:
+    """Attach the write tracking that invalidates cached searches to the session. Idempotent."""
+    for name, fn in (
+        ("after_flush", _track_writes),
+        ("after_commit", _bump_committed),
+        ("after_rollback", _discard_pending),
+    ):
+        if not event.contains(Session, name, fn):
+            event.listen(Session, name, fn)
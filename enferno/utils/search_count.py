@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Search result totals.
+
+Counting the whole filtered set can cost more than the page itself on broad
+searches. The estimate mode counts at most ESTIMATE_CAP matching rows and, past
+the cap, reports the planner's row estimate instead. When the user asks for the
+exact figure, a Celery worker counts it without the interactive timeout and the
+result is kept in Redis for the client to poll.
+"""
+
+import json
+import secrets
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from enferno.extensions import db, rds
+
+ESTIMATE_CAP = 10_000
+RESULT_TTL = 60 * 60
+_KEY = "background_count:{}"
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper that keeps the statement's bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def exact_count(query: Select) -> int:
+    """Count every row of a search query."""
+    return db.session.execute(
+        select(func.count()).select_from(query.order_by(None).subquery())
+    ).scalar()
+
+
+def planner_estimate(query: Select) -> int:
+    """Row estimate of the query's top plan node, no rows are read."""
+    plan = db.session.execute(_Explain(query)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_total(query: Select, total_type: str = "exact") -> tuple[int, str]:
+    """
+    Count the results of a search query.
+
+    Args:
+        - query: the filtered search query.
+        - total_type: "exact" counts every row, "estimate" stops at ESTIMATE_CAP.
+
+    Returns:
+        - tuple of the total and its type, "exact" or "estimate". Estimates only
+          happen past the cap, so small result sets are always counted exactly.
+    """
+    if total_type != "estimate":
+        return exact_count(query), "exact"
+    capped = exact_count(query.limit(ESTIMATE_CAP + 1))
+    if capped <= ESTIMATE_CAP:
+        return capped, "exact"
+    return max(planner_estimate(query), capped), "estimate"
+
+
+def queue_count(user_id: int, entity: str, q: list | dict) -> str:
+    from enferno.tasks import background_count
+
+    token = secrets.token_urlsafe(16)
+    store_count(token, user_id, entity, None, pending=True)
+    background_count.delay(token, user_id, entity, q)
+    return token
+
+
+def store_count(
+    token: str, user_id: int, entity: str, total: int | None, pending: bool = False
+) -> None:
+    """Store a background count. A finished count with a None total has failed."""
+    rds.set(
+        _KEY.format(token),
+        json.dumps({"user_id": user_id, "entity": entity, "total": total, "pending": pending}),
+        ex=RESULT_TTL,
+    )
+
+
+def get_count(token: str) -> dict | None:
+    payload = rds.get(_KEY.format(token))
+    return json.loads(payload) if payload else None
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Facet counts of entity searches.
+
+All requested facets are computed by one statement: the search's matching ids
+go into a CTE and every facet is a grouped count over it, glued together with
+UNION ALL. The search query carries the SQL access filter, so facets only count
+what the user can open. Results are cached under the search cache key, which
+changes whenever one of the searched tables is written to.
+"""
+
+import json
+from typing import Any
+
+from flask import current_app
+from sqlalchemy import Text, cast, func, literal, null, select, union_all
+
+from enferno.admin.models import Actor, ActorProfile, Bulletin, Incident, Label, Source
+from enferno.admin.models.tables import (
+    actor_labels,
+    actor_sources,
+    bulletin_labels,
+    bulletin_sources,
+    incident_labels,
+)
+from enferno.extensions import db, rds
+from enferno.user.models import User
+from enferno.utils import search_cache
+from enferno.utils.search_utils import SearchUtils
+
+FACET_LIMIT = 50
+
+MODELS = {"bulletin": Bulletin, "actor": Actor, "incident": Incident}
+
+# entity -> facet -> (association table, entity fk column) for label and source facets
+_LINKS = {
+    "bulletin": {
+        "label": (bulletin_labels, bulletin_labels.c.bulletin_id),
+        "source": (bulletin_sources, bulletin_sources.c.bulletin_id),
+    },
+    # actor labels and sources hang off its profiles
+    "actor": {
+        "label": (actor_labels, actor_labels.c.actor_profile_id),
+        "source": (actor_sources, actor_sources.c.actor_profile_id),
+    },
+    "incident": {
+        "label": (incident_labels, incident_labels.c.incident_id),
+    },
+}
+
+FACETS = {entity: ("status", "assignee", *links) for entity, links in _LINKS.items()}
+
+
+def _facet_select(entity: str, facet: str, matched) -> Any:
+    """Grouped (facet, value, title, count) rows of one facet over the matched ids."""
+    model = MODELS[entity]
+    name = literal(facet, Text).label("facet")
+    count = func.count()
+
+    if facet == "status":
+        stmt = (
+            select(name, model.status.label("value"), null().label("title"), count)
+            .select_from(model)
+            .join(matched, matched.c.id == model.id)
+            .group_by(model.status)
+        )
+    elif facet == "assignee":
+        stmt = (
+            select(
+                name,
+                cast(model.assigned_to_id, Text).label("value"),
+                User.name.label("title"),
+                count,
+            )
+            .select_from(model)
+            .join(matched, matched.c.id == model.id)
+            .outerjoin(User, User.id == model.assigned_to_id)
+            .group_by(model.assigned_to_id, User.name)
+        )
+    else:
+        table, fk = _LINKS[entity][facet]
+        target, target_id = (
+            (Label, table.c.label_id) if facet == "label" else (Source, table.c.source_id)
+        )
+        # an actor matches a label once even when several of its profiles carry it
+        count = func.count(matched.c.id.distinct())
+        stmt = select(
+            name, cast(target.id, Text).label("value"), target.title.label("title"), count
+        )
+        if entity == "actor":
+            stmt = stmt.select_from(matched).join(
+                ActorProfile, ActorProfile.actor_id == matched.c.id
+            )
+            stmt = stmt.join(table, fk == ActorProfile.id)
+        else:
+            stmt = stmt.select_from(matched).join(table, fk == matched.c.id)
+        stmt = stmt.join(target, target.id == target_id).group_by(target.id, target.title)
+
+    return stmt.order_by(count.desc()).limit(FACET_LIMIT)
+
+
+def facet_query(entity: str, q: Any, user, facets: list[str]):
+    """
+    Build the single statement counting the requested facets of a search.
+
+    Args:
+        - entity: one of 'bulletin', 'actor', 'incident'.
+        - q: the search query.
+        - user: the user the search runs for, restricts the counted rows.
+        - facets: facet names, those the entity does not have are skipped.
+
+    Returns:
+        - the select statement, or None when no requested facet applies.
+    """
+    facets = [facet for facet in FACETS[entity] if facet in facets]
+    if not facets:
+        return None
+    model = MODELS[entity]
+    matched = (
+        SearchUtils(q, entity, user=user)
+        .get_query()
+        .with_only_columns(model.id, maintain_column_froms=True)
+        .distinct()
+        .cte("matched")
+    )
+    return union_all(*[_facet_select(entity, facet, matched) for facet in facets])
+
+
+def _value(facet: str, value: str | None) -> Any:
+    if value is None or facet == "status":
+        return value
+    return int(value)
+
+
+def count_facets(entity: str, q: Any, user, facets: list[str]) -> dict:
+    """
+    Count the requested facets of a search, from the cache when possible.
+
+    Returns:
+        - dict of facet name to its values, most frequent first, each a dict
+          of value (status, or user/label/source id), title and count.
+    """
+    facets = [facet for facet in FACETS[entity] if facet in facets]
+    ttl = current_app.config.get("SEARCH_CACHE_TTL", 0)
+    key = None
+    if ttl:
+        key = f"{search_cache.cache_key(entity, q, user)}:facets:{','.join(facets)}"
+        if payload := rds.get(key):
+            return json.loads(payload)
+
+    result = {facet: [] for facet in facets}
+    if (stmt := facet_query(entity, q, user, facets)) is not None:
+        for facet, value, title, count in db.session.execute(stmt):
+            result[facet].append({"value": _value(facet, value), "title": title, "count": count})
+
+    if key:
+        rds.set(key, json.dumps(result), ex=ttl)
+    return result
@@ -1,9 +1,25 @@
+import json
 import re
+from collections import OrderedDict
+from functools import reduce
+from threading import Lock
+
 from dateutil.parser import parse
-from sqlalchemy import or_, and_, func, text, select, literal_column, bindparam
+from sqlalchemy import (
+    or_,
+    and_,
+    func,
+    text,
+    select,
+    literal_column,
+    bindparam,
+    exists,
+    false,
+    union_all,
+)
 from sqlalchemy.sql.elements import BinaryExpression, ColumnElement
-from sqlalchemy import String, Integer, DateTime
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import String, Integer, DateTime, REAL
+from sqlalchemy.dialects.postgresql import ARRAY, DOUBLE_PRECISION
 from datetime import datetime, time
 
 from enferno.extensions import db
@@ -25,10 +41,29 @@ from enferno.admin.models import (
     Activity,
     Media,
     Extraction,
+    Btob,
+    Atob,
+    Itob,
+    Atoa,
+    Itoa,
+    Itoi,
 )
 from enferno.admin.models.DynamicField import DynamicField
+from enferno.admin.models.Label import label_tree
+from enferno.admin.models.Source import source_tree
+from enferno.admin.models.tables import (
+    bulletin_roles,
+    actor_roles,
+    incident_roles,
+    actor_search_document,
+    bulletin_search_document,
+)
+from enferno.settings import Config
 from enferno.user.models import Role
+from enferno.utils import dynamic_field_cache
 from enferno.utils.logging_utils import get_logger
+from enferno.utils.search_cache import normalize_query
+from enferno.utils.tag_dictionary import tag_condition
 from enferno.utils.text_utils import normalize_arabic
 
 logger = get_logger()
@@ -69,23 +104,258 @@ def date_between_query(field: ColumnElement, dates: list) -> BinaryExpression:
     return field.between(start_datetime, end_datetime)
 
 
+# text search configuration of the tsv columns: English stemming over Arabic-normalized text
+FTS_CONFIG = literal_column("'english'::regconfig")
+
+
+def fulltext_query(value: str) -> ColumnElement | None:
+    """
+    Build a tsquery from a full-text search string.
+
+    Every part is required: "quoted phrases" must match in order, words ending
+    in * match as prefixes and other words match their English stem. Input is
+    Arabic-normalized the same way as the tsv columns.
+
+    Args:
+        - value: the search string as typed by the user.
+
+    Returns:
+        - the tsquery expression, or None when the string has no searchable words.
+    """
+    parts = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', normalize_arabic(value)):
+        if phrase.strip():
+            parts.append(func.phraseto_tsquery(FTS_CONFIG, phrase))
+        elif word.endswith("*"):
+            # to_tsquery parses operators, keep only word characters
+            if prefix := re.sub(r"\W", "", word):
+                parts.append(func.to_tsquery(FTS_CONFIG, f"{prefix}:*"))
+        elif word:
+            parts.append(func.plainto_tsquery(FTS_CONFIG, word))
+    if not parts:
+        return None
+    return reduce(lambda a, b: a.op("&&")(b), parts)
+
+
+# entity -> (model, role association table, entity fk column)
+ACCESS_ROLE_TABLES = {
+    "bulletin": (Bulletin, bulletin_roles, bulletin_roles.c.bulletin_id),
+    "actor": (Actor, actor_roles, actor_roles.c.actor_id),
+    "incident": (Incident, incident_roles, incident_roles.c.incident_id),
+}
+
+
+def access_filter(entity: str, user) -> ColumnElement | None:
+    """
+    Build the SQL counterpart of User.can_access for bulletins, actors and incidents.
+
+    Restricted rows are filtered by Postgres instead of being loaded and discarded
+    in Python, which keeps counts, pages and id lists consistent with what the
+    user is allowed to open.
+
+    Args:
+        - entity: One of 'bulletin', 'actor', 'incident'.
+        - user: The user the query runs on behalf of.
+
+    Returns:
+        - A boolean expression to add to the WHERE clause, or None when the user
+          is not restricted (admins).
+    """
+    if user.has_role("Admin"):
+        return None
+
+    model, roles_table, entity_fk = ACCESS_ROLE_TABLES[entity]
+    role_ids = [role.id for role in user.roles]
+    conditions = []
+
+    # intersect roles
+    if role_ids:
+        conditions.append(
+            exists().where(entity_fk == model.id, roles_table.c.role_id.in_(role_ids))
+        )
+
+    # items without roles are open unless access control is restrictive
+    if not Config.get("ACCESS_CONTROL_RESTRICTIVE"):
+        conditions.append(~exists().where(entity_fk == model.id))
+
+    return or_(*conditions) if conditions else false()
+
+
+# (searched entity, related entity) -> relation table columns holding the searched
+# entity id and the related entity id; same-entity tables are listed both ways
+RELATION_COLUMNS = {
+    ("bulletin", "bulletin"): [
+        (Btob.related_bulletin_id, Btob.bulletin_id),
+        (Btob.bulletin_id, Btob.related_bulletin_id),
+    ],
+    ("bulletin", "actor"): [(Atob.bulletin_id, Atob.actor_id)],
+    ("bulletin", "incident"): [(Itob.bulletin_id, Itob.incident_id)],
+    ("actor", "bulletin"): [(Atob.actor_id, Atob.bulletin_id)],
+    ("actor", "actor"): [
+        (Atoa.related_actor_id, Atoa.actor_id),
+        (Atoa.actor_id, Atoa.related_actor_id),
+    ],
+    ("actor", "incident"): [(Itoa.actor_id, Itoa.incident_id)],
+    ("incident", "bulletin"): [(Itob.incident_id, Itob.bulletin_id)],
+    ("incident", "actor"): [(Itoa.incident_id, Itoa.actor_id)],
+    ("incident", "incident"): [
+        (Itoi.related_incident_id, Itoi.incident_id),
+        (Itoi.incident_id, Itoi.related_incident_id),
+    ],
+}
+
+
+def related_to(entity: str, related: str, related_id) -> ColumnElement:
+    """
+    Build the condition matching the rows of an entity related to a given item.
+
+    The relation table is read by a subquery in the same statement instead of
+    loading the item and its relations through the ORM and inlining their ids.
+
+    Args:
+        - entity: the searched entity, one of 'bulletin', 'actor', 'incident'.
+        - related: the entity of the item, one of 'bulletin', 'actor', 'incident'.
+        - related_id: id of the item.
+
+    Returns:
+        - the condition on the searched entity's id.
+    """
+    model = ACCESS_ROLE_TABLES[entity][0]
+    ids = union_all(
+        *[
+            select(own).where(other == int(related_id))
+            for own, other in RELATION_COLUMNS[(entity, related)]
+        ]
+    )
+    return model.id.in_(ids)
+
+
+# incident rows matched by exclusion filters, anti-joined to the searched incidents
+_excluded_incident = Incident.__table__.alias("excluded_incident")
+
+# Built search statements of the process, least recently used first. Keyed on the
+# normalized query, the statements hold its values as bound parameters, so
+# SQLAlchemy's compiled cache also serves every repeat of the same query shape.
+STATEMENT_CACHE_SIZE = 512
+_statements = OrderedDict()
+_statements_lock = Lock()
+
+
+def clear_statement_cache() -> None:
+    with _statements_lock:
+        _statements.clear()
+
+
 class SearchUtils:
     """Utility class to build search queries for different models."""
 
-    def __init__(self, q=None, cls=None):
+    TEXT_MODES = ("trigram", "fulltext")
+    FULLTEXT_MODELS = {"bulletin": Bulletin, "incident": Incident}
+    # text the exclusion filters match per entity: (entity id, row id, text column)
+    EXCLUSION_TEXT = {
+        "bulletin": (
+            Bulletin.id,
+            bulletin_search_document.c.bulletin_id,
+            bulletin_search_document.c.document,
+        ),
+        "actor": (Actor.id, actor_search_document.c.actor_id, actor_search_document.c.document),
+        "incident": (Incident.id, _excluded_incident.c.id, _excluded_incident.c.search),
+    }
+
+    def __init__(self, q=None, cls=None, user=None, text_mode="trigram"):
         self.search = q
         self.cls = cls
+        # when set, results are restricted to the items this user can access
+        self.user = user
+        # "fulltext" matches tsv against the tsv column instead of ILIKE over trigrams
+        self.text_mode = text_mode if cls in self.FULLTEXT_MODELS else "trigram"
         self.tsv_words = []  # Store search terms for OCR match detection
-        self._ocr_matched_ids = None  # Cached OCR bulletin IDs from query execution
+        self._rank_queries = []  # tsqueries of full-text mode, used for ranking
 
     def get_ocr_matched_ids(self, bulletin_ids: list) -> set:
         """
         Return set of bulletin IDs that matched via OCR text (not bulletin.search).
-        Uses cached results from query execution - no re-query needed.
+        Only the given ids (the current page) are checked, with one query.
         """
-        if self._ocr_matched_ids is None or not bulletin_ids:
+        if not self.tsv_words or not bulletin_ids:
             return set()
-        return self._ocr_matched_ids & set(bulletin_ids)
+        query = (
+            select(Media.bulletin_id)
+            .join(Extraction, Media.id == Extraction.media_id)
+            .where(Media.bulletin_id.in_(bulletin_ids), Extraction.search_text.isnot(None))
+        )
+        for word in self.tsv_words:
+            query = query.where(Extraction.search_text.ilike(f"%{normalize_arabic(word)}%"))
+        return set(db.session.execute(query).scalars())
+
+    def rank_expression(self) -> ColumnElement | None:
+        """
+        Get the relevance of each result in full-text mode.
+
+        Only meaningful once get_query() has built the conditions.
+
+        Returns:
+            - ts_rank of the model's tsv against every full-text query of the
+              search, or None when the search has no full-text query.
+        """
+        if not self._rank_queries:
+            return None
+        tsquery = reduce(lambda a, b: a.op("||")(b), self._rank_queries)
+        rank = func.ts_rank(self.FULLTEXT_MODELS[self.cls].tsv, tsquery, type_=REAL)
+        # a keyset cursor sends the rank back as a python float, which only
+        # compares equal to the row's own rank in double precision
+        return rank.cast(DOUBLE_PRECISION)
+
+    def _fulltext_match(self, model, value: str) -> ColumnElement | None:
+        """Match the model's tsv column against a full-text search string."""
+        tsquery = fulltext_query(value)
+        if tsquery is None:
+            return None
+        self._rank_queries.append(tsquery)
+        return model.tsv.op("@@")(tsquery)
+
+    @staticmethod
+    def _search_document_match(conditions: list) -> ColumnElement:
+        """Match bulletins whose search document (bulletin and OCR text) meets all conditions."""
+        return Bulletin.id.in_(select(bulletin_search_document.c.bulletin_id).where(*conditions))
+
+    @staticmethod
+    def _actor_document_match(conditions: list) -> ColumnElement:
+        """Match actors whose search document (actor and profile text) meets all conditions."""
+        return Actor.id.in_(select(actor_search_document.c.actor_id).where(*conditions))
+
+    def _exclude_text(
+        self, terms: list, exact: bool = False, match_all: bool = False
+    ) -> ColumnElement | None:
+        """
+        Exclude the rows whose search text matches the terms.
+
+        The excluded set is found with a positive, trigram-indexed match and
+        removed through NOT EXISTS on ids, which PostgreSQL runs as an anti-join
+        instead of evaluating NOT ILIKE against every candidate row.
+
+        Args:
+            terms: Search terms (each treated as a phrase)
+            exact: If True, word boundary match; if False, substring match
+            match_all: Exclude only rows matching every term instead of any of them
+
+        Returns:
+            The exclusion condition, None when there are no terms
+        """
+        entity_id, row_id, column = self.EXCLUSION_TEXT[self.cls]
+        conditions = self._build_term_conditions(column, terms, exact, normalize=True)
+        if not conditions:
+            return None
+        match = and_(*conditions) if match_all else or_(*conditions)
+        return ~exists().where(row_id == entity_id, match)
+
+    @staticmethod
+    def _exclude_terms(extsv: str) -> list:
+        """Terms of the extsv filter: one phrase when quoted, otherwise its words."""
+        extsv = extsv.strip()
+        if len(extsv) > 2 and extsv.startswith('"') and extsv.endswith('"'):
+            return [extsv[1:-1].strip()]
+        return extsv.split()
 
     def _combine_query_blocks(self, build_query):
         """Fold query blocks left-to-right; each block's conditions are
@@ -104,37 +374,85 @@ class SearchUtils:
                 combined = or_(combined, block)
         return combined
 
-    def get_query(self):
-        """Get the query for the given class."""
-        if self.cls == "bulletin":
-            # Handle empty search - return all bulletins
-            if not self.search:
-                return select(Bulletin)
-            combined = self._combine_query_blocks(self.bulletin_query)
-            result = select(Bulletin)
-            if combined is not None:
-                result = result.where(combined)
-            return result
+    def access_condition(self) -> ColumnElement | None:
+        """Return the role predicate for the current user, None if unrestricted."""
+        if self.user is None or self.cls not in ACCESS_ROLE_TABLES:
+            return None
+        return access_filter(self.cls, self.user)
 
-        elif self.cls == "actor":
-            # Handle empty search - return all actors
-            if not self.search:
-                return select(Actor)
-            combined = self._combine_query_blocks(self.actor_query)
-            result = select(Actor)
-            if combined is not None:
-                result = result.where(combined)
-            return result
+    def _restrict(self, result):
+        """Apply the access role predicate (if any) to a select statement."""
+        access = self.access_condition()
+        if access is not None:
+            result = result.where(access)
+        return result
 
-        elif self.cls == "incident":
-            # Get conditions from first query
+    def _build_statement(self):
+        """Build the select statement of a bulletin, actor or incident search, without access roles."""
+        if self.cls == "incident":
             _, conditions = self.incident_query(self.search)
-            # Build final query with all conditions and default sorting
             result = select(Incident)
             if conditions:
                 result = result.where(and_(*conditions))
             return result
 
+        model, build_query = {
+            "bulletin": (Bulletin, self.bulletin_query),
+            "actor": (Actor, self.actor_query),
+        }[self.cls]
+        # empty search, all items
+        if not self.search:
+            return select(model)
+        combined = self._combine_query_blocks(build_query)
+        result = select(model)
+        if combined is not None:
+            result = result.where(combined)
+        return result
+
+    def _statement_key(self) -> str:
+        """Cache key of a search statement: the query and the versions of what it expands."""
+        blocks = self.search if isinstance(self.search, list) else [self.search]
+        blocks = [block for block in blocks if isinstance(block, dict)]
+
+        def used(*keys):
+            return any(block.get(key) for block in blocks for key in keys)
+
+        versions = {}
+        if used("dyn"):
+            versions["dyn"] = dynamic_field_cache.version()
+        if used("childlabels", "childverlabels"):
+            versions["label"] = label_tree.version()
+        if used("childsources"):
+            versions["source"] = source_tree.version()
+        return json.dumps(
+            [self.cls, self.text_mode, normalize_query(self.search), versions],
+            sort_keys=True,
+            default=str,
+        )
+
+    def _cached_statement(self):
+        """Get the search statement from the statement cache, building it on a miss."""
+        key = self._statement_key()
+        with _statements_lock:
+            entry = _statements.get(key)
+            if entry is not None:
+                _statements.move_to_end(key)
+        if entry is None:
+            self.tsv_words, self._rank_queries = [], []
+            entry = (self._build_statement(), tuple(self.tsv_words), tuple(self._rank_queries))
+            with _statements_lock:
+                _statements[key] = entry
+                while len(_statements) > STATEMENT_CACHE_SIZE:
+                    _statements.popitem(last=False)
+        statement, tsv_words, rank_queries = entry
+        # state read after the build: OCR match detection and full-text ranking
+        self.tsv_words, self._rank_queries = list(tsv_words), list(rank_queries)
+        return statement
+
+    def get_query(self):
+        """Get the query for the given class."""
+        if self.cls in ACCESS_ROLE_TABLES:
+            return self._restrict(self._cached_statement())
         elif self.cls == "location":
             return self.build_location_query()
         elif self.cls == "activity":
@@ -220,17 +538,9 @@ class SearchUtils:
         try:
             dyn_filters = q.get("dyn", []) or []
             if isinstance(dyn_filters, list) and dyn_filters:
-                # Preload searchable field meta for the entity type
-                searchable_meta = {
-                    f.name: f
-                    for f in db.session.query(DynamicField)
-                    .filter(
-                        DynamicField.entity_type == entity_type,
-                        DynamicField.active.is_(True),
-                        DynamicField.searchable.is_(True),
-                    )
-                    .all()
-                }
+                # Cached searchable field definitions of the entity type, fields
+                # whose index is still building (or failed) are not searched yet
+                searchable_meta = dynamic_field_cache.searchable_fields(entity_type)
 
                 def _coerce_text(raw):
                     if raw is None:
@@ -378,56 +688,29 @@ class SearchUtils:
         if ids := q.get("ids"):
             conditions.append(Bulletin.id.in_(ids))
 
-        # Text search - PERFORMANCE OPTIMIZED
-        # Searches both bulletin fields AND OCR extracted text from attached media
-        if tsv := q.get("tsv"):
+        # Ranked full-text search over the bulletin tsv column
+        if self.text_mode == "fulltext" and (tsv := q.get("tsv")):
+            if (match := self._fulltext_match(Bulletin, tsv)) is not None:
+                conditions.append(match)
+
+        # Text search over the bulletin search document, which already holds the
+        # bulletin fields AND the OCR text of attached media (one trigram index)
+        elif tsv := q.get("tsv"):
             words = [w for w in tsv.split(" ") if w.strip()]
             if words:
                 # Store for OCR match detection (used by get_ocr_matched_ids)
                 self.tsv_words = words
-                # Fast path: bulletin.search - individual ILIKEs enable GIN trigram index (200x faster)
-                bulletin_conditions = [Bulletin.search.ilike(f"%{word}%") for word in words]
-
-                # Execute OCR query once and cache matching bulletin IDs
-                # This avoids running the expensive ILIKE scan as a subquery inside OR
-                ocr_query = (
-                    select(Media.bulletin_id)
-                    .join(Extraction, Media.id == Extraction.media_id)
-                    .where(Extraction.search_text.isnot(None))
-                )
-                for word in words:
-                    ocr_query = ocr_query.where(
-                        Extraction.search_text.ilike(f"%{normalize_arabic(word)}%")
-                    )
-                result = db.session.execute(ocr_query)
-                self._ocr_matched_ids = {row[0] for row in result}
-
-                # Combine: bulletin text match OR cached OCR ID list
-                # Using IN(list) instead of IN(subquery) lets PG use simple pk lookup
-                if self._ocr_matched_ids:
-                    conditions.append(
-                        or_(and_(*bulletin_conditions), Bulletin.id.in_(self._ocr_matched_ids))
+                conditions.append(
+                    self._search_document_match(
+                        self._build_term_conditions(
+                            bulletin_search_document.c.document, words, normalize=True
+                        )
                     )
-                else:
-                    conditions.extend(bulletin_conditions)
-
-        # exclude  filter - OPTIMIZED APPROACH using raw SQL
-        extsv = q.get("extsv")
-        if extsv:
-            words = [word.strip() for word in extsv.split(" ") if word.strip()]
-            if words:
-                # Use raw SQL with NOT ILIKE ALL for optimal performance
-                # This leverages the GIN trigram index efficiently
-                exclude_patterns = [f"%{word}%" for word in words]
-                placeholders = [f":exclude_{i}" for i in range(len(exclude_patterns))]
-                array_sql = "ARRAY[" + ", ".join(placeholders) + "]"
-                raw_condition = text(f"search NOT ILIKE ALL ({array_sql})")
-
-                # Bind the parameters
-                params = {f"exclude_{i}": pattern for i, pattern in enumerate(exclude_patterns)}
-                raw_condition = raw_condition.bindparams(**params)
+                )
 
-                conditions.append(raw_condition)
+        # Exclude text search: anti-join on the search document, rows containing any word
+        if (exclusion := self._exclude_text(self._exclude_terms(q.get("extsv") or ""))) is not None:
+            conditions.append(exclusion)
 
         # OCR text search - search ONLY in extracted text from media (dedicated filter)
         if ocr := q.get("ocr"):
@@ -452,87 +735,52 @@ class SearchUtils:
             condition = Bulletin.originid.ilike(f"%{originid}%")
             conditions.append(condition)
 
-        # Tags - OPTIMIZED APPROACH respecting UI checkboxes
-        if ref := q.get("tags"):
-            exact = q.get("inExact")  # "Exact Match" checkbox
-            if exact:
-                # User checked "Exact Match" - use fast array containment (9533x faster!)
-                tag_conditions = [
-                    text("tags @> ARRAY[:tag]::varchar[]").bindparams(tag=r) for r in ref
-                ]
-            else:
-                # User wants partial matching - use ILIKE for wildcard behavior
-                tag_conditions = [
-                    func.array_to_string(Bulletin.tags, " ").ilike(f"%{r}%") for r in ref
-                ]
-
-            # "Any" checkbox controls AND vs OR between multiple tags
-            if q.get("opTags", False):
-                conditions.append(or_(*tag_conditions))
-            else:
-                conditions.append(and_(*tag_conditions))
-
-        # Exclude tags
-        if exref := q.get("exTags"):
-            exact = q.get("exExact")
-            if exact:
-                tag_conditions = [
-                    ~func.array_to_string(Bulletin.tags, " ").op("~*")(f"\\y{re.escape(r)}\\y")
-                    for r in exref
-                ]
-            else:
-                tag_conditions = [
-                    ~func.array_to_string(Bulletin.tags, " ").ilike(f"%{r}%") for r in exref
-                ]
+        # Tags: exact tags or tags containing the terms, "Any" switches AND to OR
+        if (
+            condition := tag_condition(
+                Bulletin.tags,
+                "bulletin",
+                q.get("tags", []),
+                q.get("inExact", False),
+                q.get("opTags", False),
+            )
+        ) is not None:
+            conditions.append(condition)
 
-            opexref = q.get("opExTags")
-            if opexref:
-                conditions.append(or_(*tag_conditions))
-            else:
-                conditions.append(and_(*tag_conditions))
+        # Exclude tags: rows carrying any of them, or all of them with "All"
+        if (
+            condition := tag_condition(
+                Bulletin.tags,
+                "bulletin",
+                q.get("exTags", []),
+                q.get("exExact", False),
+                not q.get("opExTags", False),
+            )
+        ) is not None:
+            conditions.append(~condition)
 
         # Search Terms - chips-based multi-term text search
-        # Searches both bulletin fields AND OCR extracted text from attached media
-        # Uses pre-fetched OCR IDs to avoid OR-subquery killing the GIN index
+        # Searches the bulletin search document (bulletin fields AND OCR text)
         if search_terms := q.get("searchTerms"):
             exact = q.get("termsExact", False)
-            bulletin_conds = self._build_term_conditions(Bulletin.search, search_terms, exact)
-            ocr_conds = self._build_term_conditions(
-                Extraction.search_text, search_terms, exact, normalize=True
+            term_conds = self._build_term_conditions(
+                bulletin_search_document.c.document, search_terms, exact, normalize=True
             )
-            if bulletin_conds:
-                ocr_base = (
-                    select(Media.bulletin_id)
-                    .join(Extraction, Media.id == Extraction.media_id)
-                    .where(Extraction.search_text.isnot(None))
-                )
+            if term_conds:
                 if q.get("opTerms", False):
-                    # OR mode: pre-fetch OCR IDs matching any term
-                    ocr_query = ocr_base.where(or_(*ocr_conds))
-                    ocr_ids = {row[0] for row in db.session.execute(ocr_query)}
-                    if ocr_ids:
-                        conditions.append(or_(*bulletin_conds, Bulletin.id.in_(ocr_ids)))
-                    else:
-                        conditions.append(or_(*bulletin_conds))
-                else:
-                    # AND mode: pre-fetch OCR IDs matching all terms
-                    for cond in ocr_conds:
-                        ocr_base = ocr_base.where(cond)
-                    ocr_ids = {row[0] for row in db.session.execute(ocr_base)}
-                    if ocr_ids:
-                        conditions.append(or_(and_(*bulletin_conds), Bulletin.id.in_(ocr_ids)))
-                    else:
-                        conditions.extend(bulletin_conds)
-
-        # Exclude Search Terms
-        if ex_terms := q.get("exTerms"):
-            exact = q.get("exTermsExact", False)
-            ex_conds = self._build_term_conditions(Bulletin.search, ex_terms, exact, negate=True)
-            if ex_conds:
-                if q.get("opExTerms", False):
-                    conditions.append(or_(*ex_conds))
+                    conditions.append(self._search_document_match([or_(*term_conds)]))
                 else:
-                    conditions.extend(ex_conds)
+                    conditions.append(self._search_document_match(term_conds))
+
+        # Exclude Search Terms: any of them by default, only rows matching all with "All"
+        if (
+            exclusion := self._exclude_text(
+                q.get("exTerms") or [],
+                q.get("exTermsExact", False),
+                q.get("opExTerms", False),
+            )
+        ) is not None:
+            conditions.append(exclusion)
 
         # Labels
         if labels := q.get("labels", []):
@@ -604,24 +852,16 @@ class SearchUtils:
         if locations := q.get("locations", []):
             ids = [item.get("id") for item in locations]
             if q.get("oplocations"):
-                locs = db.session.scalars(
-                    select(Location.id).where(
-                        or_(*[Location.id_tree.like("%[{}]%".format(x)) for x in ids])
-                    )
-                ).all()
-                loc_ids = [loc for loc in locs]
-                conditions.append(Bulletin.locations.any(Location.id.in_(loc_ids)))
+                conditions.append(
+                    Bulletin.locations.any(Location.id.in_(Location.descendants_of(ids)))
+                )
             else:
-                # Batch all location children lookups into one query
-                all_locs = db.session.execute(
-                    select(Location.id, Location.id_tree).where(
-                        or_(*[Location.id_tree.like("%[{}]%".format(x)) for x in ids])
-                    )
-                ).all()
                 for parent_id in ids:
-                    pattern = "[{}]".format(parent_id)
-                    matching = [row[0] for row in all_locs if pattern in (row[1] or "")]
-                    conditions.append(Bulletin.locations.any(Location.id.in_(matching)))
+                    conditions.append(
+                        Bulletin.locations.any(
+                            Location.id.in_(Location.descendants_of([parent_id]))
+                        )
+                    )
 
         # Excluded locations
         if exlocations := q.get("exlocations", []):
@@ -690,22 +930,13 @@ class SearchUtils:
 
         # Relations
         if rel_to_bulletin := q.get("rel_to_bulletin"):
-            bulletin = db.session.get(Bulletin, int(rel_to_bulletin))
-            if bulletin:
-                ids = [b.get_other_id(bulletin.id) for b in bulletin.bulletin_relations]
-                conditions.append(Bulletin.id.in_(ids))
+            conditions.append(related_to("bulletin", "bulletin", rel_to_bulletin))
 
         if rel_to_actor := q.get("rel_to_actor"):
-            actor = db.session.get(Actor, int(rel_to_actor))
-            if actor:
-                ids = [b.bulletin_id for b in actor.bulletin_relations]
-                conditions.append(Bulletin.id.in_(ids))
+            conditions.append(related_to("bulletin", "actor", rel_to_actor))
 
         if rel_to_incident := q.get("rel_to_incident"):
-            incident = db.session.get(Incident, int(rel_to_incident))
-            if incident:
-                ids = [b.bulletin_id for b in incident.bulletin_relations]
-                conditions.append(Bulletin.id.in_(ids))
+            conditions.append(related_to("bulletin", "incident", rel_to_incident))
 
         # Geospatial search
         loc_types = q.get("locTypes")
@@ -732,136 +963,43 @@ class SearchUtils:
         if ids := q.get("ids"):
             conditions.append(Actor.id.in_(ids))
 
-        # Text search - PERFORMANCE OPTIMIZED
+        # Text search over the actor search document, which holds the actor fields
+        # AND those of every profile (one trigram index, no join to actor_profile)
+        document = actor_search_document.c.document
         if tsv := q.get("tsv"):
             words = [word.strip() for word in tsv.split(" ") if word.strip()]
             if words:
-                # For each word, create a condition that matches in either Actor.search OR ActorProfile.search
-                qsearch = []
-                for word in words:
-                    qsearch.append(
-                        or_(
-                            Actor.search.ilike(f"%{word}%"),
-                            ActorProfile.search.ilike(f"%{word}%"),
-                        )
+                conditions.append(
+                    self._actor_document_match(
+                        self._build_term_conditions(document, words, normalize=True)
                     )
-
-                # Use explicit join to avoid backref lazy initialization issues
-                subquery = (
-                    select(Actor.id)
-                    .join(ActorProfile, ActorProfile.actor_id == Actor.id)
-                    .where(and_(*qsearch))
                 )
-                conditions.append(Actor.id.in_(subquery))
-        # Exclude text search
-        if extsv := q.get("extsv"):
-            cleaned_extsv = extsv.strip()
-            if cleaned_extsv:
-                if (
-                    cleaned_extsv.startswith('"')
-                    and cleaned_extsv.endswith('"')
-                    and len(cleaned_extsv) > 2
-                ):
-                    # Remove quotes and treat as exact phrase
-                    phrase = cleaned_extsv[1:-1].strip()
-                    if phrase:
-                        actor_exclude = Actor.search.notilike(f"%{phrase}%")
-                        profile_exclude_subquery = (
-                            select(Actor.id)
-                            .join(Actor.actor_profiles)
-                            .where(ActorProfile.search.ilike(f"%{phrase}%"))
-                        )
-                        profile_exclude = ~Actor.id.in_(profile_exclude_subquery)
-                        conditions.extend([actor_exclude, profile_exclude])
-                else:
-                    # Split on spaces and exclude records containing ANY of these words
-                    words = [word.strip() for word in cleaned_extsv.split() if word.strip()]
-                    if words:
-                        exclude_conditions = []
-                        for word in words:
-                            # Exclude if word matches in either Actor.search OR ActorProfile.search
-                            exclude_conditions.append(
-                                or_(
-                                    Actor.search.ilike(f"%{word}%"),
-                                    ActorProfile.search.ilike(f"%{word}%"),
-                                )
-                            )
+        # Exclude text search: anti-join on the search document, rows containing any word
+        if (exclusion := self._exclude_text(self._exclude_terms(q.get("extsv") or ""))) is not None:
+            conditions.append(exclusion)
 
-                        # Create subquery to find actors that match ANY of the exclude conditions
-                        subquery = (
-                            select(Actor.id)
-                            .join(Actor.actor_profiles)
-                            .where(or_(*exclude_conditions))
-                        )
-                        conditions.append(~Actor.id.in_(subquery))
-
-        # Search Terms - chips-based multi-term text search (searches both Actor and ActorProfile)
+        # Search Terms - chips-based multi-term text search (actor and profile fields)
         if search_terms := q.get("searchTerms"):
             exact = q.get("termsExact", False)
-            term_conds = []
-            for term in search_terms:
-                if not term or not term.strip():
-                    continue
-                term = term.strip()
-                if exact:
-                    escaped = re.escape(term)
-                    term_conds.append(
-                        or_(
-                            Actor.search.op("~*")(f"\\y{escaped}\\y"),
-                            ActorProfile.search.op("~*")(f"\\y{escaped}\\y"),
-                        )
-                    )
-                else:
-                    term_conds.append(
-                        or_(
-                            Actor.search.ilike(f"%{term}%"),
-                            ActorProfile.search.ilike(f"%{term}%"),
-                        )
-                    )
+            term_conds = self._build_term_conditions(document, search_terms, exact, normalize=True)
             if term_conds:
                 if q.get("opTerms", False):
                     # OR: match any term
-                    subquery = select(Actor.id).join(Actor.actor_profiles).where(or_(*term_conds))
+                    conditions.append(self._actor_document_match([or_(*term_conds)]))
                 else:
                     # AND: match all terms (default)
-                    subquery = select(Actor.id).join(Actor.actor_profiles).where(and_(*term_conds))
-                conditions.append(Actor.id.in_(subquery))
-
-        # Exclude Search Terms (searches both Actor and ActorProfile)
-        if ex_terms := q.get("exTerms"):
-            exact = q.get("exTermsExact", False)
-            ex_conds = []
-            for term in ex_terms:
-                if not term or not term.strip():
-                    continue
-                term = term.strip()
-                if exact:
-                    escaped = re.escape(term)
-                    ex_conds.append(
-                        or_(
-                            Actor.search.op("~*")(f"\\y{escaped}\\y"),
-                            ActorProfile.search.op("~*")(f"\\y{escaped}\\y"),
-                        )
-                    )
-                else:
-                    ex_conds.append(
-                        or_(
-                            Actor.search.ilike(f"%{term}%"),
-                            ActorProfile.search.ilike(f"%{term}%"),
-                        )
-                    )
-            if ex_conds:
-                if q.get("opExTerms", False):
-                    # OR: exclude if matches any term
-                    exclude_subquery = (
-                        select(Actor.id).join(Actor.actor_profiles).where(or_(*ex_conds))
-                    )
-                else:
-                    # AND: exclude if matches all terms (default)
-                    exclude_subquery = (
-                        select(Actor.id).join(Actor.actor_profiles).where(and_(*ex_conds))
-                    )
-                conditions.append(~Actor.id.in_(exclude_subquery))
+                    conditions.append(self._actor_document_match(term_conds))
+
+        # Exclude Search Terms (actor and profile fields): any of them by default,
+        # only rows matching all of them with "All"
+        if (
+            exclusion := self._exclude_text(
+                q.get("exTerms") or [],
+                q.get("exTermsExact", False),
+                q.get("opExTerms", False),
+            )
+        ) is not None:
+            conditions.append(exclusion)
 
         # Origin ID
         originid = (q.get("originid") or "").strip()
@@ -1033,70 +1171,42 @@ class SearchUtils:
                 ~Actor.actor_profiles.any(ActorProfile.sources.any(Source.id.in_(ids)))
             )
 
-        # Tags
-        if tags := q.get("tags"):
-            exact = q.get("inExact")
-            if exact:
-                tag_conditions = [
-                    func.array_to_string(Actor.tags, " ").op("~*")(f"\\y{re.escape(r)}\\y")
-                    for r in tags
-                ]
-            else:
-                tag_conditions = [
-                    func.array_to_string(Actor.tags, " ").ilike(f"%{r}%") for r in tags
-                ]
-
-            # any operator
-            op = q.get("opTags", False)
-            if op:
-                conditions.append(or_(*tag_conditions))
-            else:
-                conditions.append(and_(*tag_conditions))
+        # Tags: exact tags or tags containing the terms, "Any" switches AND to OR
+        if (
+            condition := tag_condition(
+                Actor.tags,
+                "actor",
+                q.get("tags", []),
+                q.get("inExact", False),
+                q.get("opTags", False),
+            )
+        ) is not None:
+            conditions.append(condition)
 
-        # Exclude tags
-        if extags := q.get("exTags"):
-            exact = q.get("exExact")
-            if exact:
-                tag_conditions = [
-                    ~func.array_to_string(Actor.tags, " ").op("~*")(f"\\y{re.escape(r)}\\y")
-                    for r in extags
-                ]
-            else:
-                tag_conditions = [
-                    ~func.array_to_string(Actor.tags, " ").ilike(f"%{r}%") for r in extags
-                ]
-
-            # get all operator
-            opextags = q.get("opExTags")
-            if opextags:
-                conditions.append(or_(*tag_conditions))
-            else:
-                conditions.append(and_(*tag_conditions))
+        # Exclude tags: rows carrying any of them, or all of them with "All"
+        if (
+            condition := tag_condition(
+                Actor.tags,
+                "actor",
+                q.get("exTags", []),
+                q.get("exExact", False),
+                not q.get("opExTags", False),
+            )
+        ) is not None:
+            conditions.append(~condition)
 
         # Residence locations
         if res_locations := q.get("resLocations", []):
             ids = [item.get("id") for item in res_locations]
-            # get all child locations
-            locs = db.session.scalars(
-                select(Location.id).where(
-                    or_(*[Location.id_tree.like("%[{}]%".format(x)) for x in ids])
-                )
-            ).all()
-            loc_ids = [loc for loc in locs]
+            # match any child location
             # TODO: residence_place_id is not a valid column in the Actor model. Discuss with team.
-            conditions.append(Actor.residence_place_id.in_(loc_ids))
+            conditions.append(Actor.residence_place_id.in_(Location.descendants_of(ids)))
 
         # Origin locations
         if origin_locations := q.get("originLocations", []):
             ids = [item.get("id") for item in origin_locations]
-            # get all child locations
-            locs = db.session.scalars(
-                select(Location.id).where(
-                    or_(*[Location.id_tree.like("%[{}]%".format(x)) for x in ids])
-                )
-            ).all()
-            loc_ids = [loc for loc in locs]
-            conditions.append(Actor.origin_place_id.in_(loc_ids))
+            # match any child location
+            conditions.append(Actor.origin_place_id.in_(Location.descendants_of(ids)))
 
         # Excluded residence locations
         if ex_res_locations := q.get("exResLocations", []):
@@ -1251,24 +1361,15 @@ class SearchUtils:
 
         # Related to bulletin search
         if rel_to_bulletin := q.get("rel_to_bulletin"):
-            bulletin = db.session.get(Bulletin, int(rel_to_bulletin))
-            if bulletin:
-                ids = [a.actor_id for a in bulletin.actor_relations]
-                conditions.append(Actor.id.in_(ids))
+            conditions.append(related_to("actor", "bulletin", rel_to_bulletin))
 
         # Related to actor search
         if rel_to_actor := q.get("rel_to_actor"):
-            actor = db.session.get(Actor, int(rel_to_actor))
-            if actor:
-                ids = [a.get_other_id(actor.id) for a in actor.actor_relations]
-                conditions.append(Actor.id.in_(ids))
+            conditions.append(related_to("actor", "actor", rel_to_actor))
 
         # Related to incident search
         if rel_to_incident := q.get("rel_to_incident"):
-            incident = db.session.get(Incident, int(rel_to_incident))
-            if incident:
-                ids = [a.actor_id for a in incident.actor_relations]
-                conditions.append(Actor.id.in_(ids))
+            conditions.append(related_to("actor", "incident", rel_to_incident))
 
         return select(Actor), conditions
 
@@ -1280,47 +1381,44 @@ class SearchUtils:
         if ids := q.get("ids"):
             conditions.append(Incident.id.in_(ids))
 
+        # Ranked full-text search over the incident tsv column
+        if self.text_mode == "fulltext" and (tsv := q.get("tsv")):
+            if (match := self._fulltext_match(Incident, tsv)) is not None:
+                conditions.append(match)
+
         # Text search - PERFORMANCE OPTIMIZED
-        if tsv := q.get("tsv"):
-            words = tsv.split(" ")
+        elif tsv := q.get("tsv"):
+            words = normalize_arabic(tsv).split(" ")
             # Use individual ILIKE conditions instead of ILIKE ALL() to enable GIN trigram index usage
             word_conditions = [Incident.search.ilike(f"%{word}%") for word in words if word.strip()]
             if word_conditions:
                 conditions.extend(word_conditions)
 
-        # exclude  filter - OPTIMIZED APPROACH
-        extsv = q.get("extsv")
-        if extsv:
-            words = extsv.split(" ")
-            # Use individual indexed searches instead of notilike(all_())
-            exclude_conditions = []
-            for word in words:
-                exclude_conditions.append(Incident.search.ilike(f"%{word}%"))
-
-            # Create subquery of IDs to exclude using individual indexed searches
-            if exclude_conditions:
-                exclude_subquery = select(Incident.id).where(or_(*exclude_conditions))
-                conditions.append(~Incident.id.in_(exclude_subquery))
+        # Exclude text search: self anti-join on the search column, rows containing any word
+        if (exclusion := self._exclude_text(self._exclude_terms(q.get("extsv") or ""))) is not None:
+            conditions.append(exclusion)
 
         # Search Terms - chips-based multi-term text search
         if search_terms := q.get("searchTerms"):
             exact = q.get("termsExact", False)
-            term_conds = self._build_term_conditions(Incident.search, search_terms, exact)
+            term_conds = self._build_term_conditions(
+                Incident.search, search_terms, exact, normalize=True
+            )
             if term_conds:
                 if q.get("opTerms", False):
                     conditions.append(or_(*term_conds))
                 else:
                     conditions.extend(term_conds)
 
-        # Exclude Search Terms
-        if ex_terms := q.get("exTerms"):
-            exact = q.get("exTermsExact", False)
-            ex_conds = self._build_term_conditions(Incident.search, ex_terms, exact, negate=True)
-            if ex_conds:
-                if q.get("opExTerms", False):
-                    conditions.append(or_(*ex_conds))
-                else:
-                    conditions.extend(ex_conds)
+        # Exclude Search Terms: any of them by default, only rows matching all with "All"
+        if (
+            exclusion := self._exclude_text(
+                q.get("exTerms") or [],
+                q.get("exTermsExact", False),
+                q.get("opExTerms", False),
+            )
+        ) is not None:
+            conditions.append(exclusion)
 
         # Labels
         if labels := q.get("labels", []):
@@ -1366,25 +1464,17 @@ class SearchUtils:
         if locations := q.get("locations", []):
             ids = [item.get("id") for item in locations]
             if q.get("oplocations"):
-                # get all child locations
-                locs = db.session.scalars(
-                    select(Location.id).where(
-                        or_(*[Location.id_tree.like("%[{}]%".format(x)) for x in ids])
-                    )
-                ).all()
-                loc_ids = [loc for loc in locs]
-                conditions.append(Incident.locations.any(Location.id.in_(loc_ids)))
+                # match any child location
+                conditions.append(
+                    Incident.locations.any(Location.id.in_(Location.descendants_of(ids)))
+                )
             else:
-                # Batch all location children lookups into one query
-                all_locs = db.session.execute(
-                    select(Location.id, Location.id_tree).where(
-                        or_(*[Location.id_tree.like("%[{}]%".format(x)) for x in ids])
-                    )
-                ).all()
                 for parent_id in ids:
-                    pattern = "[{}]".format(parent_id)
-                    matching = [row[0] for row in all_locs if pattern in (row[1] or "")]
-                    conditions.append(Incident.locations.any(Location.id.in_(matching)))
+                    conditions.append(
+                        Incident.locations.any(
+                            Location.id.in_(Location.descendants_of([parent_id]))
+                        )
+                    )
 
         # Excluded locations
         if exlocations := q.get("exlocations", []):
@@ -1458,22 +1548,13 @@ class SearchUtils:
 
         # Relations
         if rel_to_bulletin := q.get("rel_to_bulletin"):
-            bulletin = db.session.get(Bulletin, int(rel_to_bulletin))
-            if bulletin:
-                ids = [i.incident_id for i in bulletin.incident_relations]
-                conditions.append(Incident.id.in_(ids))
+            conditions.append(related_to("incident", "bulletin", rel_to_bulletin))
 
         if rel_to_actor := q.get("rel_to_actor"):
-            actor = db.session.get(Actor, int(rel_to_actor))
-            if actor:
-                ids = [i.incident_id for i in actor.incident_relations]
-                conditions.append(Incident.id.in_(ids))
+            conditions.append(related_to("incident", "actor", rel_to_actor))
 
         if rel_to_incident := q.get("rel_to_incident"):
-            incident = db.session.get(Incident, int(rel_to_incident))
-            if incident:
-                ids = [i.get_other_id(incident.id) for i in incident.incident_relations]
-                conditions.append(Incident.id.in_(ids))
+            conditions.append(related_to("incident", "incident", rel_to_incident))
 
         return select(Incident), conditions
 
@@ -1551,15 +1632,16 @@ class SearchUtils:
             query.append(Location.country_id == id)
 
         # tags
-        tags = q.get("tags")
-        if tags:
-            search = ["%" + r + "%" for r in tags]
-            # get search operator
-            op = q.get("optags", False)
-            if op:
-                query.append(or_(func.array_to_string(Location.tags, "").ilike(r) for r in search))
-            else:
-                query.append(and_(func.array_to_string(Location.tags, "").ilike(r) for r in search))
+        if (
+            condition := tag_condition(
+                Location.tags,
+                "location",
+                q.get("tags") or [],
+                q.get("inExact", False),
+                q.get("optags", False),
+            )
+        ) is not None:
+            query.append(condition)
 
         return query
 
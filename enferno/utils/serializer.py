@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""Batched serialization of bulletins, actors and incidents.
+
+The models' to_dict() walks locations, labels, sources, events, medias, roles
+and the relation tables lazily, one query per relationship per object, and the
+related items serialized into the relation lists walk their own. A page of
+items, or a single item with many relations, easily issues hundreds of
+queries.
+
+`serialize()` loads the requested ids with loader options that fetch every
+relationship the chosen mode reads in one batched query per relationship
+(`selectinload`, a single IN query over the whole page), preloads the media
+categories and the dynamic field values of the page the same way, and then
+calls the models' own serializers, which only find loaded attributes. The
+number of queries depends on the mode, not on the number of items.
+"""
+
+from collections import defaultdict
+from functools import cache
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import configure_mappers, selectinload
+
+from enferno.admin.models import (
+    Actor,
+    ActorProfile,
+    Atoa,
+    Atob,
+    Btob,
+    Bulletin,
+    DynamicField,
+    Event,
+    GeoLocation,
+    Incident,
+    Itoa,
+    Itob,
+    Itoi,
+    Label,
+    Location,
+    Media,
+    MediaCategory,
+    Source,
+)
+from enferno.admin.models.utils import can_view_media
+from enferno.extensions import db
+from enferno.utils.search_cache import hydrate
+
+# named modes, the models' to_dict() modes are accepted as they are
+MODES = {"mini": "1", "compact": "2", "full": None}
+
+# the items a relation row points at, as (model, foreign key attribute) pairs
+RELATION_SIDES = {
+    Btob: ((Bulletin, "bulletin_id"), (Bulletin, "related_bulletin_id")),
+    Atob: ((Bulletin, "bulletin_id"), (Actor, "actor_id")),
+    Atoa: ((Actor, "actor_id"), (Actor, "related_actor_id")),
+    Itob: ((Incident, "incident_id"), (Bulletin, "bulletin_id")),
+    Itoa: ((Incident, "incident_id"), (Actor, "actor_id")),
+    Itoi: ((Incident, "incident_id"), (Incident, "related_incident_id")),
+}
+
+
+def _location(attr) -> Any:
+    # Location.to_dict() reads its type, admin level, country and parent
+    return selectinload(attr).options(
+        selectinload(Location.location_type),
+        selectinload(Location.admin_level),
+        selectinload(Location.country),
+        selectinload(Location.parent).selectinload(Location.admin_level),
+    )
+
+
+def _events(attr) -> Any:
+    return selectinload(attr).options(_location(Event.location), selectinload(Event.eventtype))
+
+
+def _medias(attr) -> Any:
+    return selectinload(attr).options(selectinload(Media.extraction), selectinload(Media.redaction))
+
+
+def _compact_children(model) -> tuple:
+    """Options for the relationships to_compact() reads besides the roles."""
+    if model is Bulletin:
+        return (selectinload(Bulletin.locations), selectinload(Bulletin.sources))
+    if model is Actor:
+        return (
+            selectinload(Actor.actor_profiles)
+            .selectinload(ActorProfile.sources)
+            .selectinload(Source.parent),
+        )
+    return ()
+
+
+def _compact(model, attr) -> Any:
+    """Options for a related item serialized with to_compact()."""
+    return selectinload(attr).options(selectinload(model.roles), *_compact_children(model))
+
+
+def _relations(model) -> tuple:
+    """Options for the relation lists of a full serialization."""
+    if model is Bulletin:
+        return (
+            selectinload(Bulletin.bulletins_to).options(_compact(Bulletin, Btob.bulletin_to)),
+            selectinload(Bulletin.bulletins_from).options(_compact(Bulletin, Btob.bulletin_from)),
+            selectinload(Bulletin.related_actors).options(_compact(Actor, Atob.actor)),
+            selectinload(Bulletin.related_incidents).options(_compact(Incident, Itob.incident)),
+        )
+    if model is Actor:
+        return (
+            selectinload(Actor.related_bulletins).options(_compact(Bulletin, Atob.bulletin)),
+            selectinload(Actor.actors_to).options(_compact(Actor, Atoa.actor_to)),
+            selectinload(Actor.actors_from).options(_compact(Actor, Atoa.actor_from)),
+            selectinload(Actor.related_incidents).options(_compact(Incident, Itoa.incident)),
+        )
+    return (
+        selectinload(Incident.related_bulletins).options(_compact(Bulletin, Itob.bulletin)),
+        selectinload(Incident.related_actors).options(_compact(Actor, Itoa.actor)),
+        selectinload(Incident.incidents_to).options(_compact(Incident, Itoi.incident_to)),
+        selectinload(Incident.incidents_from).options(_compact(Incident, Itoi.incident_from)),
+    )
+
+
+def _full(model) -> tuple:
+    """Options for the relationships to_dict() reads besides the relation lists."""
+    common = (
+        selectinload(model.assigned_to),
+        selectinload(model.first_peer_reviewer),
+        _events(model.events),
+    )
+    if model is Bulletin:
+        return common + (
+            selectinload(Bulletin.locations),
+            selectinload(Bulletin.geo_locations).selectinload(GeoLocation.type),
+            selectinload(Bulletin.sources),
+            selectinload(Bulletin.labels),
+            selectinload(Bulletin.ver_labels),
+            _medias(Bulletin.medias),
+        )
+    if model is Actor:
+        return common + (
+            _medias(Actor.medias),
+            _location(Actor.origin_place),
+            selectinload(Actor.ethnographies),
+            selectinload(Actor.nationalities),
+            selectinload(Actor.dialects),
+            selectinload(Actor.actor_profiles).options(
+                selectinload(ActorProfile.sources).selectinload(Source.parent),
+                selectinload(ActorProfile.labels).selectinload(Label.parent),
+                selectinload(ActorProfile.ver_labels).selectinload(Label.parent),
+            ),
+        )
+    return common + (
+        selectinload(Incident.labels),
+        selectinload(Incident.locations),
+        selectinload(Incident.potential_violations),
+        selectinload(Incident.claimed_violations),
+    )
+
+
+@cache
+def loader_options(model, mode: Optional[str] = None) -> tuple:
+    """
+    Get the loader options that batch every relationship a serialization mode reads.
+
+    Args:
+        - model: Bulletin, Actor or Incident.
+        - mode: 'mini', 'compact', 'full' or one of the to_dict() modes.
+
+    Returns:
+        - tuple of loader options for a select of the model.
+    """
+    # backrefs (medias, relation sides) exist once the mappers are configured
+    configure_mappers()
+    mode = MODES.get(mode, mode)
+    # access is checked against the item's roles in every mode
+    options = (selectinload(model.roles),)
+    if mode == "1":
+        return options + (
+            selectinload(model.assigned_to),
+            selectinload(model.first_peer_reviewer),
+        )
+    if mode == "2":
+        if model is Bulletin:
+            return options + (selectinload(Bulletin.locations), selectinload(Bulletin.sources))
+        if model is Incident:
+            return options + (
+                selectinload(Incident.labels),
+                selectinload(Incident.locations).selectinload(Location.location_type),
+            )
+        return options
+    options += _full(model)
+    if mode != "3":
+        options += _relations(model)
+    return options
+
+
+def _preload_media_categories(items: list) -> None:
+    # Media.to_dict() looks its category up by id, load them into the identity map
+    category_ids = {
+        media.category for item in items for media in item.medias if media.category is not None
+    }
+    if category_ids:
+        db.session.execute(select(MediaCategory).where(MediaCategory.id.in_(category_ids))).all()
+
+
+def serialize(model, ids: list, mode: Optional[str] = None) -> list[dict[str, Any]]:
+    """
+    Serialize the given ids of a model with a bounded number of queries.
+
+    Args:
+        - model: Bulletin, Actor or Incident.
+        - ids: ids to serialize, the output keeps their order and skips missing rows.
+        - mode: 'mini', 'compact', 'full' or one of the to_dict() modes, full by default.
+
+    Returns:
+        - the items' to_dict() output, restricted stubs for items the user cannot access.
+    """
+    mode = MODES.get(mode, mode)
+    items = hydrate(model, ids, loader_options(model, mode))
+    if not items or mode in ("1", "2"):
+        return [item.to_dict(mode) for item in items]
+
+    if model is not Incident and can_view_media():
+        _preload_media_categories(items)
+    values = DynamicField.extract_values_for_many(model.__tablename__, [item.id for item in items])
+    try:
+        for item in items:
+            item._dynamic_values = values.get(item.id, {})
+        return [item.to_dict(mode) for item in items]
+    finally:
+        # the preloaded values only hold for this serialization
+        for item in items:
+            item._dynamic_values = None
+
+
+def serialize_one(model, id: int, mode: Optional[str] = None) -> Optional[dict[str, Any]]:
+    """Serialize a single item like `serialize()`, None when it does not exist."""
+    output = serialize(model, [id], mode)
+    return output[0] if output else None
+
+
+def preload_relations(relations: list, user=None) -> None:
+    """
+    Load the items a page of relation rows points at, ready for their to_dict().
+
+    The roles of all the items are loaded first, in one query per model, so access
+    is decided before anything else is read. The relationships to_compact() reads
+    are then batch loaded for the items the user can access only, the restricted
+    ones are serialized as stubs and never load them.
+
+    Args:
+        - relations: Btob, Atob, Atoa, Itob, Itoa or Itoi rows.
+        - user: the user the relations are serialized for, None to load all items.
+    """
+    ids = defaultdict(set)
+    for relation in relations:
+        for model, column in RELATION_SIDES[type(relation)]:
+            ids[model].add(getattr(relation, column))
+    for model, model_ids in ids.items():
+        items = hydrate(model, list(model_ids), (selectinload(model.roles),))
+        if user is not None:
+            items = [item for item in items if user.can_access(item)]
+        if items and (options := _compact_children(model)):
+            hydrate(model, [item.id for item in items], options)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Tag filters and tag suggestions.
+
+Tag filters match with array operators on the GIN indexed tags columns: exact
+tags with `@>` (all of them) or `&&` (any of them). Substring filters first
+resolve each term to the exact tags containing it through the trigram indexed
+`tag_dictionary`, then match those with `&&`, so they use the same index
+instead of scanning `array_to_string(tags)` row by row.
+"""
+
+from sqlalchemy import String, and_, case, cast, func, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from sqlalchemy.sql.elements import ColumnElement
+
+from enferno.admin.models.tables import TAGGED_TABLES, tag_dictionary
+from enferno.extensions import db
+
+SUGGEST_LIMIT = 20
+
+
+def matching_tags(entity: str, term: str) -> ColumnElement:
+    """Array of the entity's tags containing the term, evaluated once per query."""
+    tags = select(tag_dictionary.c.tag).where(
+        tag_dictionary.c.entity == entity, tag_dictionary.c.tag.ilike(f"%{term}%")
+    )
+    return func.array(tags.scalar_subquery(), type_=ARRAY(String))
+
+
+def tag_condition(
+    column: ColumnElement, entity: str, tags: list, exact: bool = False, any_: bool = False
+) -> ColumnElement | None:
+    """
+    Build the condition matching rows carrying the given tags.
+
+    Args:
+        - column: the entity's tags column.
+        - entity: one of TAGGED_TABLES, selects the dictionary entries.
+        - tags: tags, or substrings of tags when not exact.
+        - exact: match whole tags, otherwise any tag containing the term.
+        - any_: match rows carrying any of the tags instead of all of them.
+
+    Returns:
+        - the condition, None when no tag is given. Negate it to exclude tags.
+    """
+    tags = list(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip()))
+    if not tags:
+        return None
+    if exact:
+        return column.op("&&" if any_ else "@>")(cast(array(tags), ARRAY(String)))
+    conditions = [column.op("&&")(matching_tags(entity, tag)) for tag in tags]
+    return or_(*conditions) if any_ else and_(*conditions)
+
+
+def suggest_tags(entity: str, q: str = "", limit: int = SUGGEST_LIMIT) -> list[dict]:
+    """
+    Suggest tags of an entity for typeahead.
+
+    Exact matches come first, then tags starting with the query, then the rest,
+    the most used first within each group.
+
+    Returns:
+        - list of dicts with the tag and the number of rows carrying it.
+    """
+    if entity not in TAGGED_TABLES:
+        raise ValueError(f"Unsupported entity: {entity}")
+    tag, count = tag_dictionary.c.tag, tag_dictionary.c.count
+    stmt = select(tag, count).where(tag_dictionary.c.entity == entity)
+    order = [count.desc(), tag]
+    if q := q.strip():
+        stmt = stmt.where(tag.ilike(f"%{q}%"))
+        rank = case((func.lower(tag) == q.lower(), 0), (tag.ilike(f"{q}%"), 1), else_=2)
+        order.insert(0, rank)
+    rows = db.session.execute(stmt.order_by(*order).limit(limit))
+    return [{"tag": row.tag, "count": row.count} for row in rows]
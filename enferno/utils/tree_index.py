@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Cached hierarchy of self-referencing lookup tables (labels, sources).
+
+Each process keeps the whole (id, parent, title) set of a table in memory and
+answers descendant and path lookups from it without touching the database. A
+Redis version counter is the shared invalidation signal: ORM writes bump it
+after commit, bulk paths (CSV imports) call `invalidate()` directly, and every
+process reloads its copy on the first lookup after the counter changes.
+"""
+
+from collections import defaultdict
+from typing import Any, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from enferno.extensions import db, rds
+
+_KEY = "tree_index:{}:version"
+_PENDING = "tree_index_pending"
+
+
+class TreeIndex:
+    """In-process parent/children map of one table, validated against a Redis version key."""
+
+    def __init__(self, name: str, model: Any, parent_column: Any):
+        self.name = name
+        self.model = model
+        self.parent_column = parent_column
+        self._version = None
+        self._snapshot = None
+
+        for evt in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, evt, self._mark_pending)
+
+    @property
+    def key(self) -> str:
+        return _KEY.format(self.name)
+
+    def _mark_pending(self, mapper, connection, target) -> None:
+        session = object_session(target)
+        if session is not None:
+            session.info.setdefault(_PENDING, set()).add(self)
+
+    def invalidate(self) -> None:
+        """Drop the cached map in every process. Call after the write is committed."""
+        rds.incr(self.key)
+        self._snapshot = None
+
+    def _load(self) -> tuple[dict, dict]:
+        version = rds.get(self.key)
+        snapshot = self._snapshot
+        if snapshot is not None and version == self._version:
+            return snapshot
+        rows = db.session.execute(
+            select(self.model.id, self.parent_column, self.model.title, self.model.title_ar)
+        ).all()
+        nodes, children = {}, defaultdict(list)
+        for id, parent_id, title, title_ar in rows:
+            nodes[id] = (parent_id, title, title_ar)
+            if parent_id is not None:
+                children[parent_id].append(id)
+        self._snapshot, self._version = (nodes, children), version
+        return nodes, children
+
+    def version(self) -> str:
+        """Version of the cached map, changes whenever the table is written."""
+        self._load()
+        return str(self._version)
+
+    def nodes(self) -> dict:
+        """
+        Get the cached nodes of the table.
+
+        Returns:
+            - dictionary of id to (parent_id, title, title_ar).
+        """
+        nodes, _ = self._load()
+        return nodes
+
+    def descendants(self, ids: list, depth: Optional[int] = None) -> list:
+        """
+        Get the given ids and all of their descendants, breadth first.
+
+        Args:
+            - ids: root node ids, unknown ids are dropped.
+            - depth: maximum number of levels below the roots, unlimited when None.
+
+        Returns:
+            - list of node ids, roots included.
+        """
+        nodes, children = self._load()
+        result = [id for id in dict.fromkeys(ids) if id in nodes]
+        seen = set(result)
+        level, current = 0, result
+        while current and (depth is None or level < depth):
+            current = [c for id in current for c in children.get(id, []) if c not in seen]
+            seen.update(current)
+            result += current
+            level += 1
+        return result
+
+    def ancestors(self, id: int) -> list:
+        """
+        Get the ancestors of a node, nearest parent first.
+
+        Args:
+            - id: the node id.
+
+        Returns:
+            - list of (id, title, title_ar) tuples, empty for roots and unknown ids.
+        """
+        nodes, _ = self._load()
+        result, seen = [], {id}
+        node = nodes.get(id)
+        while node and node[0] is not None and node[0] not in seen:
+            parent_id = node[0]
+            node = nodes.get(parent_id)
+            if node is None:
+                break
+            seen.add(parent_id)
+            result.append((parent_id, node[1], node[2]))
+        return result
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session) -> None:
+    for index in session.info.pop(_PENDING, ()):
+        index.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session) -> None:
+    # the local copy may have been loaded from the rolled back writes
+    for index in session.info.pop(_PENDING, ()):
+        index._snapshot = None
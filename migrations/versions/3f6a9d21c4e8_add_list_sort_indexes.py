@@ -0,0 +1,42 @@
+"""add list sort indexes
+
+Composite (sort column DESC NULLS LAST, id DESC) indexes backing the keyset
+pagination of the bulletin, actor and incident lists on their sort columns.
+
+Revision ID: 3f6a9d21c4e8
+Revises: b8e14c2d9a70
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3f6a9d21c4e8"
+down_revision = "b8e14c2d9a70"
+branch_labels = None
+depends_on = None
+
+SORT_COLUMNS = {
+    "bulletin": ("publish_date", "documentation_date", "updated_at", "status"),
+    "actor": ("updated_at", "status"),
+    "incident": ("updated_at", "status"),
+}
+
+
+def upgrade():
+    for table, columns in SORT_COLUMNS.items():
+        for column in columns:
+            op.create_index(
+                f"ix_{table}_{column}_id",
+                table,
+                [sa.text(f"{column} DESC NULLS LAST"), sa.text("id DESC")],
+                if_not_exists=True,
+            )
+
+
+def downgrade():
+    for table, columns in SORT_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f"ix_{table}_{column}_id", table_name=table, if_exists=True)
@@ -0,0 +1,40 @@
+"""add geography columns for radius search
+
+Radius searches cast latlng to geography inside ST_DWithin, which no index can
+serve. Adds stored generated geography copies of location.latlng and
+geo_location.latlng with GiST indexes so the geo query builders can filter on
+them directly.
+
+Revision ID: 5a2bd6158427
+Revises: c74e2d280b85
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5a2bd6158427"
+down_revision = "c74e2d280b85"
+branch_labels = None
+depends_on = None
+
+TABLES = ("location", "geo_location")
+
+
+def upgrade():
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS latlng_geog geography(POINT,4326) "
+            "GENERATED ALWAYS AS (latlng::geography) STORED"
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_latlng_geog "
+            f"ON {table} USING gist (latlng_geog)"
+        )
+
+
+def downgrade():
+    for table in TABLES:
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_latlng_geog")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS latlng_geog")
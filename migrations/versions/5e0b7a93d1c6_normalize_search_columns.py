@@ -0,0 +1,92 @@
+"""normalize arabic in search columns
+
+The generated search columns of bulletin, actor and incident were plain
+concatenations, so a term typed with a different alef, taa marbuta or alef
+maksura form missed the row. They are now wrapped in normalize_arabic_text(),
+matching the normalized terms SearchUtils sends. PostgreSQL 16 cannot change
+a generation expression in place, so each column is dropped and re-added
+(rewriting the table) and its trigram index rebuilt; the search document
+triggers that watch bulletin.search and actor.search are dropped with the
+column and recreated.
+
+Revision ID: 5e0b7a93d1c6
+Revises: d81f3c6a2b94
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e0b7a93d1c6"
+down_revision = "d81f3c6a2b94"
+branch_labels = None
+depends_on = None
+
+SEARCH_EXPRESSIONS = {
+    "bulletin": """
+        CAST(id AS TEXT) || ' ' ||
+        COALESCE(title, '') || ' ' ||
+        COALESCE(title_ar, '') || ' ' ||
+        COALESCE(description, '') || ' ' ||
+        COALESCE(originid, '') || ' ' ||
+        COALESCE(sjac_title, '') || ' ' ||
+        COALESCE(sjac_title_ar, '') || ' ' ||
+        COALESCE(source_link, '') || ' ' ||
+        COALESCE(comments, '')
+    """,
+    "actor": """
+        (id)::text || ' ' ||
+        COALESCE(name, ''::character varying) || ' ' ||
+        COALESCE(name_ar, ''::character varying) || ' ' ||
+        COALESCE(comments, ''::text)
+    """,
+    "incident": """
+        CAST(id AS TEXT) || ' ' ||
+        COALESCE(title, '') || ' ' ||
+        COALESCE(title_ar, '') || ' ' ||
+        COALESCE(regexp_replace(regexp_replace(description, E'<.*?>', '', 'g'), E'&nbsp;', '', 'g'), '') || ' ' ||
+        COALESCE(comments, '')
+    """,
+}
+
+# triggers with a WHEN clause on the search column, dropped along with it
+SEARCH_TRIGGERS = """
+CREATE TRIGGER bulletin_search_document_update
+    AFTER UPDATE ON bulletin
+    FOR EACH ROW
+    WHEN (OLD.search IS DISTINCT FROM NEW.search)
+    EXECUTE FUNCTION bulletin_search_document_bulletin();
+
+CREATE TRIGGER actor_search_document_update
+    AFTER UPDATE ON actor
+    FOR EACH ROW
+    WHEN (OLD.search IS DISTINCT FROM NEW.search)
+    EXECUTE FUNCTION actor_search_document_actor();
+"""
+
+
+def _rebuild_search_columns(normalized: bool):
+    for table, expression in SEARCH_EXPRESSIONS.items():
+        if normalized:
+            expression = f"normalize_arabic_text({expression})"
+        op.execute(f"ALTER TABLE {table} DROP COLUMN search CASCADE")
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search text GENERATED ALWAYS AS ({expression}) STORED"
+        )
+        op.create_index(
+            f"ix_{table}_search",
+            table,
+            ["search"],
+            postgresql_using="gin",
+            postgresql_ops={"search": "gin_trgm_ops"},
+        )
+    op.execute(SEARCH_TRIGGERS)
+
+
+def upgrade():
+    _rebuild_search_columns(normalized=True)
+
+
+def downgrade():
+    _rebuild_search_columns(normalized=False)
@@ -0,0 +1,126 @@
+"""add actor search document
+
+Actor text searches matched every word against actor.search OR
+actor_profile.search over a join to actor_profile, which multiplies rows for
+actors with many profiles and keeps the trigram indexes out of play. This adds
+actor_search_document, one row per actor holding its Arabic-normalized search
+text plus that of all its profiles, with a single trigram index. Triggers on
+actor and actor_profile keep it in sync; existing actors are backfilled.
+
+Revision ID: 6c2e8b41f5d3
+Revises: 3f6a9d21c4e8
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "6c2e8b41f5d3"
+down_revision = "3f6a9d21c4e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "actor_search_document",
+        sa.Column("actor_id", sa.Integer(), nullable=False),
+        sa.Column("document", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["actor_id"], ["actor.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("actor_id"),
+    )
+
+    op.execute("""
+        INSERT INTO actor_search_document (actor_id, document)
+        SELECT a.id, normalize_arabic_text(a.search || COALESCE(' ' || p.text, ''))
+        FROM actor a
+        LEFT JOIN (
+            SELECT actor_id, string_agg(search, ' ' ORDER BY id) AS text
+            FROM actor_profile
+            WHERE actor_id IS NOT NULL
+            GROUP BY actor_id
+        ) p ON p.actor_id = a.id
+    """)
+
+    # build the index after the backfill, much faster than maintaining it row by row
+    op.create_index(
+        "ix_actor_search_document_trgm",
+        "actor_search_document",
+        ["document"],
+        postgresql_using="gin",
+        postgresql_ops={"document": "gin_trgm_ops"},
+    )
+
+    op.execute("""
+CREATE OR REPLACE FUNCTION actor_search_document_refresh(aid integer) RETURNS void AS $$
+BEGIN
+    IF aid IS NULL THEN RETURN; END IF;
+    INSERT INTO actor_search_document (actor_id, document)
+    SELECT a.id, normalize_arabic_text(a.search || COALESCE(' ' || (
+        SELECT string_agg(p.search, ' ' ORDER BY p.id)
+        FROM actor_profile p
+        WHERE p.actor_id = a.id
+    ), ''))
+    FROM actor a
+    WHERE a.id = aid
+    ON CONFLICT (actor_id) DO UPDATE SET document = EXCLUDED.document;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION actor_search_document_actor() RETURNS trigger AS $$
+BEGIN
+    PERFORM actor_search_document_refresh(NEW.id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION actor_search_document_profile() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM actor_search_document_refresh(NEW.actor_id);
+        RETURN NULL;
+    END IF;
+    PERFORM actor_search_document_refresh(OLD.actor_id);
+    IF TG_OP = 'UPDATE' THEN
+        IF NEW.actor_id IS DISTINCT FROM OLD.actor_id THEN
+            PERFORM actor_search_document_refresh(NEW.actor_id);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS actor_search_document_insert ON actor;
+CREATE TRIGGER actor_search_document_insert
+    AFTER INSERT ON actor
+    FOR EACH ROW EXECUTE FUNCTION actor_search_document_actor();
+
+DROP TRIGGER IF EXISTS actor_search_document_update ON actor;
+CREATE TRIGGER actor_search_document_update
+    AFTER UPDATE ON actor
+    FOR EACH ROW
+    WHEN (OLD.search IS DISTINCT FROM NEW.search)
+    EXECUTE FUNCTION actor_search_document_actor();
+
+DROP TRIGGER IF EXISTS actor_search_document_profile ON actor_profile;
+CREATE TRIGGER actor_search_document_profile
+    AFTER INSERT OR DELETE ON actor_profile
+    FOR EACH ROW EXECUTE FUNCTION actor_search_document_profile();
+
+DROP TRIGGER IF EXISTS actor_search_document_profile_update ON actor_profile;
+CREATE TRIGGER actor_search_document_profile_update
+    AFTER UPDATE ON actor_profile
+    FOR EACH ROW
+    WHEN (OLD.search IS DISTINCT FROM NEW.search OR OLD.actor_id IS DISTINCT FROM NEW.actor_id)
+    EXECUTE FUNCTION actor_search_document_profile();
+""")
+
+
+def downgrade():
+    op.execute("DROP FUNCTION IF EXISTS actor_search_document_actor() CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS actor_search_document_profile() CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS actor_search_document_refresh(integer)")
+    op.drop_index("ix_actor_search_document_trgm", table_name="actor_search_document")
+    op.drop_table("actor_search_document")
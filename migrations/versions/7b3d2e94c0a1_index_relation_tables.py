@@ -0,0 +1,39 @@
+"""index relation tables by their second entity
+
+Relation search filters (rel_to_*) now read the relation tables in a
+subquery, looking rows up by either side. The composite primary keys only
+cover lookups by their leading column, so each table gets an index on the
+other one.
+
+Revision ID: 7b3d2e94c0a1
+Revises: 5e0b7a93d1c6
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7b3d2e94c0a1"
+down_revision = "5e0b7a93d1c6"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_btob_related_bulletin_id": ("btob", "related_bulletin_id"),
+    "ix_atob_actor_id": ("atob", "actor_id"),
+    "ix_itob_bulletin_id": ("itob", "bulletin_id"),
+    "ix_atoa_related_actor_id": ("atoa", "related_actor_id"),
+    "ix_itoa_incident_id": ("itoa", "incident_id"),
+    "ix_itoi_related_incident_id": ("itoi", "related_incident_id"),
+}
+
+
+def upgrade():
+    for name, (table, column) in INDEXES.items():
+        op.create_index(name, table, [column], if_not_exists=True)
+
+
+def downgrade():
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,134 @@
+"""add bulletin search document
+
+Text searches used to pre-fetch the bulletins whose OCR text matched and inline
+their ids into the main query. This adds bulletin_search_document, one row per
+bulletin holding its Arabic-normalized search text plus the OCR text of its
+media, with a single trigram index. Triggers on bulletin, media and extraction
+keep it in sync; existing bulletins are backfilled.
+
+Revision ID: 937abf4d78ed
+Revises: 5a2bd6158427
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "937abf4d78ed"
+down_revision = "5a2bd6158427"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "bulletin_search_document",
+        sa.Column("bulletin_id", sa.Integer(), nullable=False),
+        sa.Column("document", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["bulletin_id"], ["bulletin.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("bulletin_id"),
+    )
+
+    op.execute("""
+        INSERT INTO bulletin_search_document (bulletin_id, document)
+        SELECT b.id, normalize_arabic_text(b.search) || COALESCE(' ' || o.text, '')
+        FROM bulletin b
+        LEFT JOIN (
+            SELECT m.bulletin_id, string_agg(e.search_text, ' ' ORDER BY m.id) AS text
+            FROM media m JOIN extraction e ON e.media_id = m.id
+            WHERE m.bulletin_id IS NOT NULL AND NOT m.deleted AND e.search_text IS NOT NULL
+            GROUP BY m.bulletin_id
+        ) o ON o.bulletin_id = b.id
+    """)
+
+    # build the index after the backfill, much faster than maintaining it row by row
+    op.create_index(
+        "ix_bulletin_search_document_trgm",
+        "bulletin_search_document",
+        ["document"],
+        postgresql_using="gin",
+        postgresql_ops={"document": "gin_trgm_ops"},
+    )
+
+    op.execute("""
+CREATE OR REPLACE FUNCTION bulletin_search_document_refresh(bid integer) RETURNS void AS $$
+BEGIN
+    IF bid IS NULL THEN RETURN; END IF;
+    INSERT INTO bulletin_search_document (bulletin_id, document)
+    SELECT b.id, normalize_arabic_text(b.search) || COALESCE(' ' || (
+        SELECT string_agg(e.search_text, ' ' ORDER BY m.id)
+        FROM media m JOIN extraction e ON e.media_id = m.id
+        WHERE m.bulletin_id = b.id AND NOT m.deleted AND e.search_text IS NOT NULL
+    ), '')
+    FROM bulletin b
+    WHERE b.id = bid
+    ON CONFLICT (bulletin_id) DO UPDATE SET document = EXCLUDED.document;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bulletin_search_document_bulletin() RETURNS trigger AS $$
+BEGIN
+    PERFORM bulletin_search_document_refresh(NEW.id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bulletin_search_document_media() RETURNS trigger AS $$
+BEGIN
+    PERFORM bulletin_search_document_refresh(OLD.bulletin_id);
+    IF TG_OP = 'UPDATE' AND NEW.bulletin_id IS DISTINCT FROM OLD.bulletin_id THEN
+        PERFORM bulletin_search_document_refresh(NEW.bulletin_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION bulletin_search_document_extraction() RETURNS trigger AS $$
+BEGIN
+    PERFORM bulletin_search_document_refresh(
+        (SELECT bulletin_id FROM media WHERE id = COALESCE(NEW.media_id, OLD.media_id))
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bulletin_search_document_insert ON bulletin;
+CREATE TRIGGER bulletin_search_document_insert
+    AFTER INSERT ON bulletin
+    FOR EACH ROW EXECUTE FUNCTION bulletin_search_document_bulletin();
+
+DROP TRIGGER IF EXISTS bulletin_search_document_update ON bulletin;
+CREATE TRIGGER bulletin_search_document_update
+    AFTER UPDATE ON bulletin
+    FOR EACH ROW
+    WHEN (OLD.search IS DISTINCT FROM NEW.search)
+    EXECUTE FUNCTION bulletin_search_document_bulletin();
+
+DROP TRIGGER IF EXISTS bulletin_search_document_media ON media;
+CREATE TRIGGER bulletin_search_document_media
+    AFTER UPDATE OF bulletin_id, deleted OR DELETE ON media
+    FOR EACH ROW EXECUTE FUNCTION bulletin_search_document_media();
+
+DROP TRIGGER IF EXISTS bulletin_search_document_extraction ON extraction;
+CREATE TRIGGER bulletin_search_document_extraction
+    AFTER INSERT OR DELETE ON extraction
+    FOR EACH ROW EXECUTE FUNCTION bulletin_search_document_extraction();
+
+DROP TRIGGER IF EXISTS bulletin_search_document_extraction_update ON extraction;
+CREATE TRIGGER bulletin_search_document_extraction_update
+    AFTER UPDATE ON extraction
+    FOR EACH ROW
+    WHEN (OLD.search_text IS DISTINCT FROM NEW.search_text)
+    EXECUTE FUNCTION bulletin_search_document_extraction();
+""")
+
+
+def downgrade():
+    op.execute("DROP FUNCTION IF EXISTS bulletin_search_document_bulletin() CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS bulletin_search_document_media() CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS bulletin_search_document_extraction() CASCADE")
+    op.execute("DROP FUNCTION IF EXISTS bulletin_search_document_refresh(integer)")
+    op.drop_index("ix_bulletin_search_document_trgm", table_name="bulletin_search_document")
+    op.drop_table("bulletin_search_document")
@@ -0,0 +1,38 @@
+"""add dynamic field index status
+
+Search indexes of dynamic fields are now built and dropped CONCURRENTLY by a
+background task, and searches only use fields whose index is valid. Searchable
+fields whose index exists and is valid are marked valid; those without one
+(searchable was toggled on after creation) are marked failed, saving them in
+the field editor queues the build.
+
+Revision ID: a4d7e9b25c18
+Revises: 6c2e8b41f5d3
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "a4d7e9b25c18"
+down_revision = "6c2e8b41f5d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("dynamic_fields", sa.Column("index_status", sa.String(length=20), nullable=True))
+    op.execute("""
+        UPDATE dynamic_fields df
+        SET index_status = CASE WHEN EXISTS (
+            SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = 'ix_' || df.entity_type || '_' || df.name AND i.indisvalid
+        ) THEN 'valid' ELSE 'failed' END
+        WHERE df.searchable AND NOT COALESCE(df.core, false)
+    """)
+
+
+def downgrade():
+    op.drop_column("dynamic_fields", "index_status")
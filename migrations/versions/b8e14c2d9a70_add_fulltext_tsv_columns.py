@@ -0,0 +1,67 @@
+"""add full-text tsv columns
+
+The unused tsv columns of bulletin and incident become stored generated
+tsvectors over the Arabic-normalized, English-stemmed titles (weight A),
+description (B) and remaining text fields (C), each with a GIN index, for the
+ranked full-text search mode.
+
+Revision ID: b8e14c2d9a70
+Revises: 937abf4d78ed
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b8e14c2d9a70"
+down_revision = "937abf4d78ed"
+branch_labels = None
+depends_on = None
+
+
+def _weighted(parts):
+    return " ||\n".join(
+        f"setweight(to_tsvector('english'::regconfig, normalize_arabic_text({text})), '{weight}')"
+        for text, weight in parts
+    )
+
+
+DESCRIPTION = "COALESCE(regexp_replace(description, E'<[^>]*>', ' ', 'g'), '')"
+
+TSV = {
+    "bulletin": _weighted(
+        [
+            (
+                "COALESCE(title, '') || ' ' || COALESCE(title_ar, '') || ' ' || "
+                "COALESCE(sjac_title, '') || ' ' || COALESCE(sjac_title_ar, '')",
+                "A",
+            ),
+            (DESCRIPTION, "B"),
+            ("COALESCE(originid, '') || ' ' || COALESCE(comments, '')", "C"),
+        ]
+    ),
+    "incident": _weighted(
+        [
+            ("COALESCE(title, '') || ' ' || COALESCE(title_ar, '')", "A"),
+            (DESCRIPTION, "B"),
+            ("COALESCE(comments, '')", "C"),
+        ]
+    ),
+}
+
+
+def upgrade():
+    for table, expression in TSV.items():
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS tsv")
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN tsv tsvector GENERATED ALWAYS AS ({expression}) STORED"
+        )
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_tsv ON {table} USING gin (tsv)")
+
+
+def downgrade():
+    for table in TSV:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_tsv")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS tsv")
+        op.execute(f"ALTER TABLE {table} ADD COLUMN tsv tsvector")
@@ -0,0 +1,42 @@
+"""materialize saved searches
+
+Saved searches can opt in to keeping their matching ids in
+saved_search_result. The ids are refreshed incrementally from the entities
+updated since refreshed_at, and list endpoints serve a materialized saved
+search as a join on the stored ids instead of re-running it.
+
+Revision ID: c5e1f8a3b7d2
+Revises: 7b3d2e94c0a1
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c5e1f8a3b7d2"
+down_revision = "7b3d2e94c0a1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "query",
+        sa.Column("materialize", sa.Boolean(), server_default="false", nullable=False),
+    )
+    op.add_column("query", sa.Column("refreshed_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "saved_search_result",
+        sa.Column("query_id", sa.Integer(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["query_id"], ["query.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("query_id", "entity_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("saved_search_result")
+    op.drop_column("query", "refreshed_at")
+    op.drop_column("query", "materialize")
@@ -0,0 +1,108 @@
+"""add location closure table
+
+Replaces `id_tree LIKE '%[x]%'` descendant lookups with an indexed closure table
+holding one row per (ancestor, descendant) pair. Triggers on location keep it in
+sync when locations are inserted or re-parented; existing rows are backfilled
+from parent_id.
+
+Revision ID: c74e2d280b85
+Revises: d4f7a2c9b310
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c74e2d280b85"
+down_revision = "d4f7a2c9b310"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "location_closure",
+        sa.Column("ancestor_id", sa.Integer(), nullable=False),
+        sa.Column("descendant_id", sa.Integer(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ancestor_id"], ["location.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["descendant_id"], ["location.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ancestor_id", "descendant_id"),
+    )
+    op.create_index("ix_location_closure_descendant_id", "location_closure", ["descendant_id"])
+
+    # backfill from parent_id, guarding against cycles in existing data
+    op.execute("""
+        WITH RECURSIVE tree(ancestor_id, descendant_id, depth, path) AS (
+            SELECT id, id, 0, ARRAY[id] FROM location
+            UNION ALL
+            SELECT t.ancestor_id, l.id, t.depth + 1, t.path || l.id
+            FROM tree t
+            JOIN location l ON l.parent_id = t.descendant_id
+            WHERE NOT l.id = ANY(t.path)
+        )
+        INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree
+    """)
+
+    # keep the closure in sync on insert and when a location is re-parented
+    op.execute("""
+CREATE OR REPLACE FUNCTION location_closure_sync() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+        VALUES (NEW.id, NEW.id, 0);
+        INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, NEW.id, depth + 1
+        FROM location_closure
+        WHERE descendant_id = NEW.parent_id;
+        RETURN NEW;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM location_closure
+        WHERE ancestor_id = NEW.id AND descendant_id = NEW.parent_id
+    ) THEN
+        RAISE EXCEPTION 'Location % cannot be placed under its own descendant %',
+            NEW.id, NEW.parent_id;
+    END IF;
+
+    -- detach the subtree from its old ancestors
+    DELETE FROM location_closure c
+    USING location_closure sub, location_closure sup
+    WHERE sub.ancestor_id = NEW.id
+      AND c.descendant_id = sub.descendant_id
+      AND sup.descendant_id = NEW.id
+      AND sup.ancestor_id <> NEW.id
+      AND c.ancestor_id = sup.ancestor_id;
+
+    -- attach it under the new parent's ancestors
+    INSERT INTO location_closure (ancestor_id, descendant_id, depth)
+    SELECT sup.ancestor_id, sub.descendant_id, sup.depth + sub.depth + 1
+    FROM location_closure sup
+    JOIN location_closure sub ON sub.ancestor_id = NEW.id
+    WHERE sup.descendant_id = NEW.parent_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS location_closure_insert ON location;
+CREATE TRIGGER location_closure_insert
+    AFTER INSERT ON location
+    FOR EACH ROW EXECUTE FUNCTION location_closure_sync();
+
+DROP TRIGGER IF EXISTS location_closure_update ON location;
+CREATE TRIGGER location_closure_update
+    AFTER UPDATE OF parent_id ON location
+    FOR EACH ROW
+    WHEN (OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+    EXECUTE FUNCTION location_closure_sync();
+""")
+
+
+def downgrade():
+    op.execute("DROP FUNCTION IF EXISTS location_closure_sync() CASCADE")
+    op.drop_index("ix_location_closure_descendant_id", table_name="location_closure")
+    op.drop_table("location_closure")
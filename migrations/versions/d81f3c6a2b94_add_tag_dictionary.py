@@ -0,0 +1,105 @@
+"""add tag dictionary
+
+Substring tag filters matched array_to_string(tags) with ILIKE, scanning every
+row. This adds tag_dictionary, the distinct tags in use per entity with their
+usage counts and a trigram index, so substring filters and the tag autocomplete
+resolve terms to exact tags first and match those with && on the GIN indexed
+tags columns. Triggers on bulletin, actor and location keep it in sync; the
+existing tags are backfilled. location.tags gets the GIN index the other
+tagged tables already have.
+
+Revision ID: d81f3c6a2b94
+Revises: a4d7e9b25c18
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d81f3c6a2b94"
+down_revision = "a4d7e9b25c18"
+branch_labels = None
+depends_on = None
+
+TAGGED_TABLES = ("bulletin", "actor", "location")
+
+
+def upgrade():
+    op.create_table(
+        "tag_dictionary",
+        sa.Column("entity", sa.String(length=32), nullable=False),
+        sa.Column("tag", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("entity", "tag"),
+    )
+
+    for table in TAGGED_TABLES:
+        op.execute(f"""
+            INSERT INTO tag_dictionary (entity, tag, count)
+            SELECT '{table}', t.tag, count(*)
+            FROM {table}, LATERAL (SELECT DISTINCT unnest({table}.tags)) AS t(tag)
+            WHERE t.tag IS NOT NULL AND t.tag <> ''
+            GROUP BY t.tag
+        """)
+
+    # build the indexes after the backfill, much faster than maintaining them row by row
+    op.create_index(
+        "ix_tag_dictionary_tag_trgm",
+        "tag_dictionary",
+        ["tag"],
+        postgresql_using="gin",
+        postgresql_ops={"tag": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_location_tags", "location", ["tags"], postgresql_using="gin", if_not_exists=True
+    )
+
+    op.execute("""
+CREATE OR REPLACE FUNCTION tag_dictionary_sync() RETURNS trigger AS $$
+DECLARE
+    added varchar[] := '{}';
+    removed varchar[] := '{}';
+BEGIN
+    IF TG_OP <> 'DELETE' THEN added := COALESCE(NEW.tags, '{}'); END IF;
+    IF TG_OP <> 'INSERT' THEN removed := COALESCE(OLD.tags, '{}'); END IF;
+
+    INSERT INTO tag_dictionary (entity, tag, count)
+    SELECT TG_ARGV[0], t.tag, 1
+    FROM (SELECT unnest(added) EXCEPT SELECT unnest(removed)) AS t(tag)
+    WHERE t.tag IS NOT NULL AND t.tag <> ''
+    ON CONFLICT (entity, tag) DO UPDATE SET count = tag_dictionary.count + 1;
+
+    UPDATE tag_dictionary d SET count = d.count - 1
+    FROM (SELECT unnest(removed) EXCEPT SELECT unnest(added)) AS t(tag)
+    WHERE d.entity = TG_ARGV[0] AND d.tag = t.tag;
+
+    DELETE FROM tag_dictionary
+    WHERE entity = TG_ARGV[0] AND tag = ANY(removed) AND count <= 0;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+""")
+
+    for table in TAGGED_TABLES:
+        op.execute(f"""
+DROP TRIGGER IF EXISTS tag_dictionary_sync ON {table};
+CREATE TRIGGER tag_dictionary_sync
+    AFTER INSERT OR DELETE ON {table}
+    FOR EACH ROW EXECUTE FUNCTION tag_dictionary_sync('{table}');
+
+DROP TRIGGER IF EXISTS tag_dictionary_sync_update ON {table};
+CREATE TRIGGER tag_dictionary_sync_update
+    AFTER UPDATE OF tags ON {table}
+    FOR EACH ROW
+    WHEN (OLD.tags IS DISTINCT FROM NEW.tags)
+    EXECUTE FUNCTION tag_dictionary_sync('{table}');
+""")
+
+
+def downgrade():
+    op.execute("DROP FUNCTION IF EXISTS tag_dictionary_sync() CASCADE")
+    op.drop_index("ix_location_tags", table_name="location", if_exists=True)
+    op.drop_index("ix_tag_dictionary_tag_trgm", table_name="tag_dictionary")
+    op.drop_table("tag_dictionary")
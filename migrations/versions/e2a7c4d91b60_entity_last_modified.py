@@ -0,0 +1,36 @@
+"""store the latest revision time on bulletins, actors and incidents
+
+get_modified_date() loaded the whole history of an item to read the time of
+its latest revision. It is now written to an indexed last_modified column
+whenever a history row is created. Existing rows are filled in by the
+`flask backfill-last-modified` command, until then they fall back to
+updated_at.
+
+Revision ID: e2a7c4d91b60
+Revises: c5e1f8a3b7d2
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e2a7c4d91b60"
+down_revision = "c5e1f8a3b7d2"
+branch_labels = None
+depends_on = None
+
+TABLES = ("bulletin", "actor", "incident")
+
+
+def upgrade():
+    for table in TABLES:
+        op.add_column(table, sa.Column("last_modified", sa.DateTime(), nullable=True))
+        op.create_index(f"ix_{table}_last_modified", table, ["last_modified"])
+
+
+def downgrade():
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_last_modified", table_name=table)
+        op.drop_column(table, "last_modified")
@@ -1,9 +1,11 @@
+import os
+from contextlib import contextmanager
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 from enferno.admin.models.Notification import Notification
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.exc import ProgrammingError
 
 from enferno.settings import TestConfig as cfg
@@ -22,6 +24,22 @@ def pytest_sessionstart(session):
         terminal.write_line("")
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: slow performance benchmark, run with RUN_BENCHMARKS=1"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless explicitly requested, they build large synthetic datasets."""
+    if os.environ.get("RUN_BENCHMARKS"):
+        return
+    skip = pytest.mark.skip(reason="set RUN_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def flush_redis_after_tests():
     """Fixture to flush redis db after all tests are done."""
@@ -222,6 +240,30 @@ def session(setup_db, app):
                 transaction.rollback()
 
 
+@pytest.fixture(scope="function")
+def count_queries(session):
+    """Context manager collecting the SQL statements executed inside it.
+
+    Usage: ``with count_queries() as statements: ...``
+    """
+    from enferno.extensions import db
+
+    @contextmanager
+    def recorder():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+    return recorder
+
+
 @pytest.fixture(scope="function")
 def session_uninitialized(setup_db_uninitialized, uninitialized_app):
     """Same isolation pattern as session(), for setup wizard tests."""
@@ -444,3 +486,25 @@ def roled_client(app, session, create_test_role, isolated_session_store):
         synchronize_session=False
     )
     session.delete(new_user)
+
+
+@pytest.fixture
+def fake_user():
+    """Stand-in user class for code that only reads the roles and the Admin role.
+
+    Usage: ``fake_user([1, 2])`` or ``fake_user(admin=True)``
+    """
+
+    class FakeRole:
+        def __init__(self, id):
+            self.id = id
+
+    class FakeUser:
+        def __init__(self, role_ids=(), admin=False):
+            self.roles = [FakeRole(id) for id in role_ids]
+            self.admin = admin
+
+        def has_role(self, name):
+            return self.admin and name == "Admin"
+
+    return FakeUser
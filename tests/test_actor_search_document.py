@@ -0,0 +1,71 @@
+"""Actor search document.
+
+Actor text searches (tsv, extsv, searchTerms, exTerms) match one trigram-indexed
+document per actor holding its own search text and that of all its profiles,
+instead of joining actor_profile and matching both search columns.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from enferno.admin.models import Actor
+from enferno.admin.models.tables import actor_search_document
+from enferno.utils.search_utils import SearchUtils
+from tests.factories import ActorFactory, ActorProfileFactory
+
+
+def compiled(q):
+    stmt = SearchUtils(q, "actor").get_query()
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return sql.replace("%%", "%")
+
+
+def document_of(session, actor_id):
+    return session.execute(
+        select(actor_search_document.c.document).where(actor_search_document.c.actor_id == actor_id)
+    ).scalar()
+
+
+def test_text_search_is_one_predicate_without_profile_join():
+    sql = compiled([{"tsv": "needle haystack"}])
+    assert "actor_search_document.document ILIKE '%needle%'" in sql
+    assert "actor_search_document.document ILIKE '%haystack%'" in sql
+    assert "actor_profile" not in sql
+
+
+def test_exclusions_match_the_search_document():
+    sql = compiled([{"extsv": "one two", "exTerms": ["three"]}])
+    assert "NOT (EXISTS (SELECT *" in sql
+    assert "actor_search_document.actor_id = actor.id" in sql
+    assert "actor_search_document.document ILIKE '%one%' OR" in sql
+    assert "actor_profile" not in sql
+
+
+def test_search_terms_are_arabic_normalized():
+    assert "'%احمد%'" in compiled([{"searchTerms": ["أحمد"]}])
+
+
+def test_document_follows_actor_and_profile_writes(session):
+    actor = ActorFactory(name="Abu Example")
+    session.add(actor)
+    session.commit()
+    assert "Abu Example" in document_of(session, actor.id)
+
+    profile = ActorProfileFactory(description="seen near bakery-xq", actor_id=actor.id)
+    session.add(profile)
+    session.commit()
+    assert "seen near bakery-xq" in document_of(session, actor.id)
+
+    found = session.scalars(
+        SearchUtils([{"tsv": "example bakery-xq"}], "actor").get_query().with_only_columns(Actor.id)
+    )
+    assert actor.id in set(found)
+
+    profile.description = "moved to kilo-harbour"
+    session.commit()
+    assert "moved to kilo-harbour" in document_of(session, actor.id)
+    assert "bakery-xq" not in document_of(session, actor.id)
+
+    session.delete(profile)
+    session.commit()
+    assert "kilo-harbour" not in document_of(session, actor.id)
@@ -0,0 +1,51 @@
+"""Arabic-normalized search columns.
+
+The generated search columns of bulletins, actors and incidents hold
+normalize_arabic_text() output and SearchUtils normalizes the terms matched
+against them, so one indexed ILIKE per term covers every spelling variant.
+"""
+
+from sqlalchemy.dialects import postgresql
+
+from enferno.admin.models import Actor, Bulletin, Incident
+from enferno.utils.search_utils import SearchUtils
+from tests.factories import BulletinFactory
+
+
+def compiled(q, cls):
+    stmt = SearchUtils(q, cls).get_query()
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return sql.replace("%%", "%")
+
+
+def test_search_columns_are_normalized():
+    for model in (Bulletin, Actor, Incident):
+        expression = model.__table__.c.search.computed.sqltext.text
+        assert "normalize_arabic_text(" in expression
+
+
+def test_incident_terms_are_normalized():
+    sql = compiled({"tsv": "أحمد"}, "incident")
+    assert "incident.search ILIKE '%احمد%'" in sql
+    sql = compiled({"searchTerms": ["مدرسة"], "exTerms": ["إدلب"]}, "incident")
+    assert "incident.search ILIKE '%مدرسه%'" in sql
+    assert "excluded_incident.search ILIKE '%ادلب%'" in sql
+
+
+def test_bulletin_excluded_terms_are_normalized():
+    sql = compiled([{"exTerms": ["إدلب"]}], "bulletin")
+    assert "bulletin_search_document.document ILIKE '%ادلب%'" in sql
+
+
+def test_variant_spellings_match(session):
+    bulletin = BulletinFactory(title="مدرسة أحمد")
+    session.add(bulletin)
+    session.commit()
+
+    for term in ("مدرسه", "احمد", "أحمد"):
+        found = session.scalars(
+            SearchUtils([{"exTerms": [term], "ids": [bulletin.id]}], "bulletin")
+            .get_query()
+            .with_only_columns(Bulletin.id)
+        )
+        assert bulletin.id not in set(found)
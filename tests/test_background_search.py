@@ -8,8 +8,11 @@ from sqlalchemy.exc import OperationalError
 
 from enferno.admin.models.Notification import Notification
 from enferno.extensions import db
+from enferno.tasks import background_count as run_background_count
 from enferno.tasks import background_search as run_background_search
 from enferno.utils import background_search as bgs
+from enferno.utils import search_count
+from enferno.utils.search_utils import SearchUtils
 from tests.factories import create_simple_bulletin  # noqa: F401
 
 
@@ -37,6 +40,19 @@ class TestResultStore:
         assert bgs.get_result("tok-1") == {"user_id": 7, "entity": "bulletin", "ids": [3, 2, 1]}
         assert bgs.get_result("missing-token") is None
 
+    def test_partial_results_are_readable_while_running(self, app):
+        bgs.start_result("tok-2", 7, "actor")
+        assert bgs.append_ids("tok-2", [9, 8]) == 2
+        assert bgs.append_ids("tok-2", [5]) == 3
+
+        status = bgs.get_status("tok-2")
+        assert (status["count"], status["done"]) == (3, False)
+        assert bgs.get_ids("tok-2", 1, 5) == [8, 5]
+        assert bgs.get_ids("tok-2", 0, 0) == []
+
+        bgs.finish_result("tok-2")
+        assert bgs.get_status("tok-2")["done"] is True
+
 
 class TestBackgroundSearchTask:
     def test_task_stores_ids_and_notifies(
@@ -63,6 +79,37 @@ class TestBackgroundSearchTask:
         assert notification.link == "/admin/bulletins/?bgs=tok-task"
         assert "<" not in notification.message
 
+    def test_task_streams_ids_in_batches(
+        self, app, session, users, monkeypatch, create_simple_bulletin  # noqa: F811
+    ):
+        admin_user, _, _, _ = users
+        monkeypatch.setattr(bgs, "BATCH_SIZE", 1)
+        appended = []
+        append_ids = bgs.append_ids
+        monkeypatch.setattr(
+            bgs,
+            "append_ids",
+            lambda token, ids: appended.append(list(ids)) or append_ids(token, ids),
+        )
+
+        run_background_search.run("tok-stream", admin_user.id, "bulletin", [{}])
+
+        assert appended and all(len(batch) == 1 for batch in appended)
+        assert bgs.get_result("tok-stream")["ids"] == [batch[0] for batch in appended]
+        assert bgs.get_status("tok-stream")["done"] is True
+
+    def test_endpoint_serves_a_window_of_the_ids(self, app, admin_client, users):
+        admin_user, _, _, _ = users
+        bgs.start_result("tok-window", admin_user.id, "bulletin")
+        bgs.append_ids("tok-window", [30, 20, 10])
+
+        response = admin_client.get("/admin/api/background-search/tok-window?from=1&count=1")
+        assert response.status_code == 200
+        assert response.json["ids"] == [20]
+        assert (response.json["count"], response.json["done"]) == (3, False)
+
+        assert admin_client.get("/admin/api/background-search/missing").status_code == 404
+
 
 class TestTimeoutFallbackEndpoint:
     def test_timed_out_search_returns_202_and_queues(self, admin_client, monkeypatch):
@@ -84,3 +131,47 @@ class TestTimeoutFallbackEndpoint:
         assert response.json["queued"] is True
         assert response.json["token"] == "tok-ep"
         assert queued["entity"] == "bulletin"
+
+
+class TestEstimatedCount:
+    def test_small_result_sets_are_counted_exactly(
+        self, app, session, create_simple_bulletin  # noqa: F811
+    ):
+        query = SearchUtils([{}], "bulletin").get_query()
+        total, total_type = search_count.count_total(query, "estimate")
+        assert total_type == "exact"
+        assert total == search_count.exact_count(query)
+
+    def test_counts_past_the_cap_are_estimates(
+        self, app, session, monkeypatch, create_simple_bulletin  # noqa: F811
+    ):
+        monkeypatch.setattr(search_count, "ESTIMATE_CAP", 0)
+        query = SearchUtils([{}], "bulletin").get_query()
+
+        total, total_type = search_count.count_total(query, "estimate")
+        assert total_type == "estimate"
+        assert total >= 1
+
+    def test_list_endpoint_reports_total_type(self, admin_client):
+        response = admin_client.post(
+            "/admin/api/bulletins/",
+            json={"q": [{"tsv": "needle"}], "include_count": True, "total_type": "estimate"},
+        )
+        assert response.status_code == 200
+        assert response.json["data"]["totalType"] == "exact"
+
+    def test_exact_count_task_and_endpoint(self, app, admin_client, session, users):
+        admin_user, _, _, _ = users
+        search_count.store_count("tok-count", admin_user.id, "bulletin", None, pending=True)
+        assert admin_client.get("/admin/api/search-count/tok-count").status_code == 202
+
+        run_background_count.run("tok-count", admin_user.id, "bulletin", [{}])
+
+        response = admin_client.get("/admin/api/search-count/tok-count")
+        assert response.status_code == 200
+        assert response.json["data"]["totalType"] == "exact"
+        assert response.json["data"]["total"] >= 0
+
+    def test_exact_count_is_owner_only(self, admin_client):
+        search_count.store_count("tok-other", -1, "bulletin", 5)
+        assert admin_client.get("/admin/api/search-count/tok-other").status_code == 404
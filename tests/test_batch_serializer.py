@@ -0,0 +1,121 @@
+"""Batched serialization.
+
+enferno.utils.serializer loads a page of items with one query per relationship
+the serialization mode reads, so the number of queries of a page does not grow
+with the number of items, and the output is the models' own to_dict().
+Relation lists decide access from the roles before serializing, so restricted
+related items cost no more than their stub.
+"""
+
+import pytest
+
+from enferno.admin.models import Atob, Btob, Bulletin
+from enferno.extensions import db
+from enferno.utils.serializer import serialize
+from tests.factories import (
+    ActorFactory,
+    BulletinFactory,
+    EventFactory,
+    LabelFactory,
+    LocationFactory,
+    SourceFactory,
+)
+
+# upper bound of the queries a page may issue, whatever its size
+QUERY_BUDGET = 60
+
+
+@pytest.fixture
+def bulletin_ids(session):
+    location, label, source = LocationFactory(), LabelFactory(for_bulletin=True), SourceFactory()
+    actor = ActorFactory()
+    bulletins = []
+    for _ in range(12):
+        bulletin = BulletinFactory()
+        bulletin.locations = [location]
+        bulletin.labels = [label]
+        bulletin.sources = [source]
+        bulletin.events = [EventFactory(location=location)]
+        bulletins.append(bulletin)
+    session.add_all([actor, *bulletins])
+    session.commit()
+    # a chain of related bulletins, each also related to the actor
+    for first, second in zip(bulletins, bulletins[1:]):
+        session.add(Btob(bulletin_id=first.id, related_bulletin_id=second.id))
+        session.add(Atob(bulletin_id=first.id, actor_id=actor.id))
+    session.commit()
+    return [bulletin.id for bulletin in bulletins]
+
+
+def queries_for(session, count_queries, ids, mode):
+    session.expire_all()
+    with count_queries() as statements:
+        serialize(Bulletin, ids, mode)
+    return len(statements)
+
+
+@pytest.mark.parametrize("mode", ["mini", "compact", "full"])
+def test_queries_per_page_do_not_grow_with_the_page(session, count_queries, bulletin_ids, mode):
+    # warm the process caches (label tree, dynamic fields) first
+    serialize(Bulletin, bulletin_ids, mode)
+
+    small = queries_for(session, count_queries, bulletin_ids[1:4], mode)
+    large = queries_for(session, count_queries, bulletin_ids, mode)
+    assert large == small
+    assert large <= QUERY_BUDGET
+
+
+def test_output_matches_the_model_serializers(session, bulletin_ids):
+    ids = list(reversed(bulletin_ids[:4]))
+    expected = [db.session.get(Bulletin, id).to_dict() for id in ids]
+    session.expire_all()
+    output = serialize(Bulletin, ids)
+    assert output == expected
+    assert [item["id"] for item in output] == ids
+    assert output[1]["bulletin_relations"] and output[1]["actor_relations"]
+
+    session.expire_all()
+    expected = [db.session.get(Bulletin, id).to_dict("1") for id in ids]
+    assert serialize(Bulletin, ids, "mini") == expected
+
+
+def test_missing_ids_are_skipped(session, bulletin_ids):
+    assert [item["id"] for item in serialize(Bulletin, [bulletin_ids[0], -1], "mini")] == [
+        bulletin_ids[0]
+    ]
+
+
+def test_restricted_relation_lists_load_roles_only(
+    da_client, session, count_queries, create_test_role
+):
+    hub, location, source = BulletinFactory(), LocationFactory(), SourceFactory()
+    session.add(hub)
+    session.commit()
+    related = []
+    for _ in range(12):
+        bulletin = BulletinFactory()
+        bulletin.locations = [location]
+        bulletin.sources = [source]
+        bulletin.roles = [create_test_role]
+        related.append(bulletin)
+    session.add_all(related)
+    session.commit()
+    session.add_all(Btob(bulletin_id=hub.id, related_bulletin_id=b.id) for b in related)
+    session.commit()
+
+    def relations_page(per_page):
+        session.expire_all()
+        with count_queries() as statements:
+            response = da_client.get(
+                f"/admin/api/bulletin/relations/{hub.id}?class=bulletin&per_page={per_page}"
+            )
+        items = response.json["data"]["items"]
+        assert len(items) == per_page
+        assert all(item["restricted"] for item in items)
+        return statements
+
+    relations_page(12)
+    small, large = relations_page(3), relations_page(12)
+    assert len(small) == len(large)
+    # restricted items are never serialized, their locations and sources stay unloaded
+    assert not [s for s in large if "bulletin_locations" in s or "bulletin_sources" in s]
@@ -0,0 +1,87 @@
+"""Bulletin search document.
+
+Text searches (tsv, searchTerms) match one trigram-indexed document per bulletin
+holding its search text and the OCR text of its media, instead of pre-fetching
+the OCR matches and inlining their ids.
+"""
+
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from enferno.admin.models import Bulletin, Extraction, Media
+from enferno.admin.models.tables import bulletin_search_document
+from enferno.utils.search_utils import SearchUtils
+from tests.factories import BulletinFactory
+
+
+def compiled(q):
+    stmt = SearchUtils(q, "bulletin").get_query()
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return sql.replace("%%", "%")
+
+
+def document_of(session, bulletin_id):
+    return session.execute(
+        select(bulletin_search_document.c.document).where(
+            bulletin_search_document.c.bulletin_id == bulletin_id
+        )
+    ).scalar()
+
+
+def test_text_search_matches_the_search_document():
+    # builds without touching the database: there is no OCR pre-fetch anymore
+    sql = compiled([{"tsv": "needle haystack"}])
+    assert "bulletin_search_document.document ILIKE '%needle%'" in sql
+    assert "bulletin_search_document.document ILIKE '%haystack%'" in sql
+    assert "extraction" not in sql
+
+
+def test_search_terms_match_the_search_document():
+    sql = compiled([{"searchTerms": ["one", "two"], "opTerms": True}])
+    assert "bulletin_search_document.document ILIKE '%one%' OR" in sql
+    assert "extraction" not in sql
+
+
+def test_search_terms_are_arabic_normalized():
+    sql = compiled([{"searchTerms": ["أحمد"]}])
+    assert "'%احمد%'" in sql
+
+
+def test_document_follows_bulletin_and_ocr_writes(session):
+    bulletin = BulletinFactory(title="Convoy report")
+    session.add(bulletin)
+    session.commit()
+    assert "Convoy report" in document_of(session, bulletin.id)
+
+    media = Media(
+        media_file=f"test-{uuid4().hex}.png",
+        media_file_type="image/png",
+        etag=uuid4().hex,
+        bulletin_id=bulletin.id,
+    )
+    session.add(media)
+    session.commit()
+    extraction = Extraction(media_id=media.id, text="checkpoint zulu", status="processed")
+    session.add(extraction)
+    session.commit()
+    assert "checkpoint zulu" in document_of(session, bulletin.id)
+
+    found = session.scalars(
+        SearchUtils([{"tsv": "convoy zulu"}], "bulletin").get_query().with_only_columns(Bulletin.id)
+    )
+    assert bulletin.id in set(found)
+
+    search = SearchUtils([{"tsv": "zulu"}], "bulletin")
+    search.get_query()
+    assert search.get_ocr_matched_ids([bulletin.id]) == {bulletin.id}
+
+    bulletin.title = "Renamed"
+    session.commit()
+    assert "Renamed" in document_of(session, bulletin.id)
+    assert "checkpoint zulu" in document_of(session, bulletin.id)
+
+    media.deleted = True
+    session.commit()
+    assert "zulu" not in document_of(session, bulletin.id)
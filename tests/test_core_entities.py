@@ -1007,3 +1007,55 @@ class TestIncidentRoledRestricted:
                 headers={"Accept": "application/json"},
             )
         assert resp.status_code == expected
+
+
+class TestListAccessFilter:
+    """List endpoints drop restricted items in SQL instead of returning stubs."""
+
+    @pytest.mark.parametrize(
+        "endpoint, factory",
+        [
+            ("/admin/api/bulletins/", BulletinFactory),
+            ("/admin/api/actors/", ActorFactory),
+            ("/admin/api/incidents/", IncidentFactory),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "client_fixture, restrictive, sees_restricted, sees_open",
+        [
+            ("admin_client", True, True, True),
+            ("da_client", False, False, True),
+            ("da_client", True, False, False),
+            ("roled_client", True, True, False),
+        ],
+    )
+    def test_list_filters_restricted(
+        self,
+        request,
+        session,
+        create_test_role,
+        endpoint,
+        factory,
+        client_fixture,
+        restrictive,
+        sees_restricted,
+        sees_open,
+    ):
+        restricted = factory()
+        unrestricted = factory()
+        session.add_all([restricted, unrestricted])
+        session.commit()
+        _assign_role(session, restricted, "TestRole")
+        client = request.getfixturevalue(client_fixture)
+        with patch.dict(current_app.config, {"ACCESS_CONTROL_RESTRICTIVE": restrictive}):
+            resp = client.post(
+                endpoint,
+                json={"q": {} if "incidents" in endpoint else [{}], "per_page": 100},
+                headers=HEADERS,
+            )
+        assert resp.status_code == 200
+        items = resp.json["data"]["items"]
+        ids = {item["id"] for item in items}
+        assert (restricted.id in ids) is sees_restricted
+        assert (unrestricted.id in ids) is sees_open
+        assert not any(item.get("restricted") for item in items)
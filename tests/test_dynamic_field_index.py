@@ -0,0 +1,77 @@
+"""Background lifecycle of dynamic field search indexes."""
+
+from enferno.admin.models.DynamicField import DynamicField
+
+
+def make_field(field_type=DynamicField.TEXT, searchable=True, index_status=None):
+    field = DynamicField(
+        name="field_index_test",
+        title="Index Test",
+        entity_type="bulletin",
+        field_type=field_type,
+        options=[{"label": "One", "value": "one"}] if field_type == DynamicField.SELECT else [],
+    )
+    field.searchable = searchable
+    field.index_status = index_status
+    return field
+
+
+class TestIndexLifecycle:
+    def test_index_statements_are_concurrent(self):
+        assert make_field().index_sql() == (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bulletin_field_index_test "
+            "ON bulletin USING gin (field_index_test gin_trgm_ops)"
+        )
+        assert make_field(DynamicField.SELECT).index_sql().endswith("USING gin (field_index_test)")
+        assert (
+            make_field(DynamicField.NUMBER).index_sql().endswith("ON bulletin (field_index_test)")
+        )
+
+    def test_toggling_searchable_requests_a_build_or_drop(self):
+        field = make_field()
+        assert field.request_index_sync()
+        assert field.index_status == DynamicField.INDEX_BUILDING
+
+        field.index_status = DynamicField.INDEX_VALID
+        assert not field.request_index_sync()
+
+        field.searchable = False
+        assert field.request_index_sync()
+        assert field.index_status == DynamicField.INDEX_DROPPING
+
+    def test_failed_builds_are_retried_on_save(self):
+        field = make_field(index_status=DynamicField.INDEX_FAILED)
+        assert field.request_index_sync()
+        assert field.index_status == DynamicField.INDEX_BUILDING
+
+    def test_unsearchable_fields_without_index_need_nothing(self):
+        field = make_field(searchable=False)
+        assert not field.request_index_sync()
+        assert field.index_status is None
+
+
+def test_bulk_save_queues_the_index_after_commit(admin_client, monkeypatch):
+    queued = []
+    monkeypatch.setattr(
+        "enferno.admin.views.dynamic_fields.sync_dynamic_field_index.delay", queued.append
+    )
+    response = admin_client.post(
+        "/admin/api/dynamic-fields/bulk-save",
+        json={
+            "entity_type": "bulletin",
+            "changes": {
+                "create": [
+                    {
+                        "title": "Indexed later",
+                        "field_type": DynamicField.TEXT,
+                        "ui_component": DynamicField.UIComponent.INPUT,
+                        "searchable": True,
+                    }
+                ]
+            },
+        },
+    )
+    assert response.status_code == 200
+    field = next(f for f in response.json["data"]["fields"] if f["title"] == "Indexed later")
+    assert field["index_status"] == DynamicField.INDEX_BUILDING
+    assert queued == [field["id"]]
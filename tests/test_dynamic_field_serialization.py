@@ -0,0 +1,71 @@
+"""Dynamic field serialization reads definitions and table metadata from the process cache.
+
+Serializing an item used to query the active fields and reflect the entity
+table every time. Both are now cached per process until a field write bumps
+the Redis version key.
+"""
+
+import fakeredis
+import pytest
+
+from enferno.admin.models.DynamicField import DynamicField
+from enferno.utils import dynamic_field_cache
+from tests.factories import BulletinFactory
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(dynamic_field_cache, "rds", fakeredis.FakeStrictRedis())
+    monkeypatch.setattr(
+        dynamic_field_cache, "_state", {"version": None, "snapshot": None, "tables": {}}
+    )
+
+
+def test_tables_are_reflected_once_per_version(fresh_cache, monkeypatch):
+    reflected = []
+    monkeypatch.setattr(
+        dynamic_field_cache, "_load", lambda: ({}, dynamic_field_cache._state["version"])
+    )
+    monkeypatch.setattr(
+        dynamic_field_cache, "_reflect", lambda name: reflected.append(name) or name
+    )
+
+    assert dynamic_field_cache.table("bulletin") == "bulletin"
+    dynamic_field_cache.table("bulletin")
+    dynamic_field_cache.table("actor")
+    assert reflected == ["bulletin", "actor"]
+
+    # a field write drops the reflected tables along with the definitions
+    dynamic_field_cache.invalidate()
+    dynamic_field_cache.table("bulletin")
+    assert reflected == ["bulletin", "actor", "bulletin"]
+
+
+def test_custom_fields_leave_out_core_fields(fresh_cache):
+    field = dynamic_field_cache.FieldDefinition
+    dynamic_field_cache._state["snapshot"] = {
+        "bulletin": [
+            field(1, "title", "bulletin", DynamicField.TEXT, True, True, None, {}),
+            field(2, "case_ref", "bulletin", DynamicField.TEXT, False, True, None, {}),
+        ]
+    }
+    assert [f.name for f in dynamic_field_cache.custom_fields("bulletin")] == ["case_ref"]
+    assert dynamic_field_cache.custom_fields("incident") == []
+
+
+def test_serializing_does_not_query_definitions_or_reflect(session, count_queries, monkeypatch):
+    # an existing column stands in for a dynamic field column
+    field = dynamic_field_cache.FieldDefinition(
+        1, "originid", "bulletin", DynamicField.TEXT, False, False, None, {}
+    )
+    monkeypatch.setattr(dynamic_field_cache, "custom_fields", lambda entity_type: [field])
+    bulletins = [BulletinFactory() for _ in range(5)]
+    session.add_all(bulletins)
+    session.commit()
+    bulletins[0].to_dict()
+
+    with count_queries() as statements:
+        for bulletin in bulletins:
+            assert bulletin.to_dict()["originid"] == bulletin.originid
+            bulletin.get_dynamic_fields()
+    assert not [s for s in statements if "dynamic_fields" in s or "pg_catalog" in s]
@@ -0,0 +1,89 @@
+"""Cross-entity search (/admin/api/search/).
+
+One request searches bulletins, actors and incidents for the same text and
+answers with the first page and estimated total of each entity. Entities run
+concurrently on their own connections, a timed-out entity is queued alone.
+"""
+
+import threading
+from types import SimpleNamespace
+
+from psycopg2.errors import QueryCanceled
+from sqlalchemy.exc import OperationalError
+
+from enferno.utils import federated_search as fs
+from tests.factories import ActorFactory, BulletinFactory, IncidentFactory
+
+
+def test_entity_queries_share_the_text():
+    assert fs.entity_query("bulletin", "needle") == [{"tsv": "needle"}]
+    assert fs.entity_query("actor", "needle") == [{"tsv": "needle"}]
+    assert fs.entity_query("incident", "needle") == {"tsv": "needle"}
+
+
+def test_entities_run_in_separate_threads(app, monkeypatch):
+    threads = {}
+
+    def search(app, entity, q, user_id, per_page):
+        threads[entity] = threading.get_ident()
+        return {"ids": [], "total": 0, "total_type": "exact"}
+
+    monkeypatch.setattr(fs, "_search_in_thread", search)
+    app.config["FEDERATED_SEARCH_PARALLEL"] = True
+    try:
+        with app.app_context():
+            results = fs.federated_search("needle", SimpleNamespace(id=1))
+    finally:
+        app.config["FEDERATED_SEARCH_PARALLEL"] = False
+
+    assert set(threads) == {"bulletin", "actor", "incident"}
+    assert threading.get_ident() not in threads.values()
+    assert results["actor"] == {"items": [], "nextCursor": None, "total": 0, "totalType": "exact"}
+
+
+def test_endpoint_returns_a_page_per_entity(admin_client, session):
+    bulletin = BulletinFactory(title="quarry-lantern report")
+    actor = ActorFactory(name="Quarry-Lantern Group")
+    incident = IncidentFactory(title="quarry-lantern incident")
+    session.add_all([bulletin, actor, incident])
+    session.commit()
+
+    response = admin_client.post("/admin/api/search/", json={"q": "quarry-lantern"})
+    assert response.status_code == 200
+    results = response.json["data"]["results"]
+    assert [item["id"] for item in results["bulletin"]["items"]] == [bulletin.id]
+    assert results["actor"]["items"][0]["title"] == "Quarry-Lantern Group"
+    assert [item["id"] for item in results["incident"]["items"]] == [incident.id]
+    assert results["incident"]["total"] == 1
+    assert results["incident"]["totalType"] == "exact"
+
+
+def test_timed_out_entity_is_queued_alone(admin_client, monkeypatch):
+    search_utils = fs.SearchUtils
+
+    def cancel_actors(q, cls, **kwargs):
+        if cls == "actor":
+            raise OperationalError("canceled", None, QueryCanceled())
+        return search_utils(q, cls, **kwargs)
+
+    queued = []
+    monkeypatch.setattr(fs, "SearchUtils", cancel_actors)
+    monkeypatch.setattr(
+        fs, "queue_search", lambda user_id, entity, q: queued.append((entity, q)) or "tok-fed"
+    )
+
+    response = admin_client.post(
+        "/admin/api/search/", json={"q": "needle", "entities": ["bulletin", "actor"]}
+    )
+    assert response.status_code == 200
+    results = response.json["data"]["results"]
+    assert results["actor"] == {"queued": True, "token": "tok-fed"}
+    assert "items" in results["bulletin"]
+    assert "incident" not in results
+    assert queued == [("actor", [{"tsv": "needle"}])]
+
+
+def test_invalid_requests_are_rejected(admin_client):
+    assert admin_client.post("/admin/api/search/", json={"q": ""}).status_code == 400
+    response = admin_client.post("/admin/api/search/", json={"q": "x", "entities": ["location"]})
+    assert response.status_code == 400
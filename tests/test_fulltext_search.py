@@ -0,0 +1,98 @@
+"""Ranked full-text search mode over the tsv columns."""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from enferno.admin.models import Bulletin
+from enferno.utils.keyset import decode_cursor, encode_cursor, keyset_page
+from enferno.utils.search_utils import SearchUtils, fulltext_query
+from tests.factories import BulletinFactory
+
+
+def compiled(stmt):
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return sql.replace("%%", "%")
+
+
+class TestFulltextQuery:
+    def test_words_are_stemmed_and_all_required(self):
+        sql = compiled(fulltext_query("convoys attacked"))
+        assert "plainto_tsquery('english'::regconfig, 'convoys')" in sql
+        assert "&& plainto_tsquery('english'::regconfig, 'attacked')" in sql
+
+    def test_quoted_phrases_and_prefixes(self):
+        sql = compiled(fulltext_query('"air strike" hosp*'))
+        assert "phraseto_tsquery('english'::regconfig, 'air strike')" in sql
+        assert "to_tsquery('english'::regconfig, 'hosp:*')" in sql
+
+    def test_prefix_operators_are_stripped(self):
+        sql = compiled(fulltext_query("a|b!*"))
+        assert "'ab:*'" in sql
+
+    def test_input_is_arabic_normalized(self):
+        assert "'احمد'" in compiled(fulltext_query("أحمد"))
+
+    def test_blank_input_builds_no_query(self):
+        assert fulltext_query('  "" * ') is None
+
+
+class TestFulltextMode:
+    def test_fulltext_mode_matches_the_tsv_column(self):
+        search = SearchUtils([{"tsv": "convoy"}], "bulletin", text_mode="fulltext")
+        sql = compiled(search.get_query())
+        assert "bulletin.tsv @@ plainto_tsquery" in sql
+        assert "bulletin_search_document" not in sql
+        rank = compiled(search.rank_expression())
+        assert "CAST(ts_rank(bulletin.tsv" in rank and rank.endswith("AS DOUBLE PRECISION)")
+
+    def test_trigram_mode_is_unranked(self):
+        search = SearchUtils([{"tsv": "convoy"}], "bulletin")
+        search.get_query()
+        assert search.rank_expression() is None
+
+    def test_entities_without_tsv_fall_back_to_trigram(self):
+        assert SearchUtils([{"tsv": "x"}], "actor", text_mode="fulltext").text_mode == "trigram"
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor([0.5, 12])) == [0.5, 12]
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_ranked_pages_order_by_relevance(session):
+    strong = BulletinFactory(title="Hospital hospital", description="hospital shelled")
+    weak = BulletinFactory(title="Market", description="near the hospital")
+    other = BulletinFactory(title="Checkpoint", description="unrelated")
+    session.add_all([strong, weak, other])
+    session.commit()
+
+    search = SearchUtils([{"tsv": "hospitals"}], "bulletin", text_mode="fulltext")
+    query = search.get_query().where(Bulletin.id.in_([strong.id, weak.id, other.id]))
+    keys = [search.rank_expression(), Bulletin.id]
+
+    first, cursor, has_more = keyset_page(query, keys, None, 1)
+    assert [b.id for b in first] == [strong.id] and has_more
+    second, cursor, has_more = keyset_page(query, keys, cursor, 1)
+    assert [b.id for b in second] == [weak.id]
+    assert not has_more and cursor is None
+
+
+def test_tied_ranks_page_without_repeats_or_gaps(session):
+    strong = BulletinFactory(title="Hospital hospital", description="hospital shelled")
+    # identical text, identical rank, and the tie spans every page break below
+    tied = [BulletinFactory(title="Clinic", description="near the hospital") for _ in range(5)]
+    session.add_all([strong, *tied])
+    session.commit()
+
+    search = SearchUtils([{"tsv": "hospitals"}], "bulletin", text_mode="fulltext")
+    query = search.get_query().where(Bulletin.id.in_([strong.id, *(b.id for b in tied)]))
+    keys = [search.rank_expression(), Bulletin.id]
+
+    seen, cursor = [], None
+    while True:
+        page, cursor, has_more = keyset_page(query, keys, cursor, 2)
+        seen += [b.id for b in page]
+        if not has_more:
+            break
+    assert seen == [strong.id] + sorted((b.id for b in tied), reverse=True)
@@ -0,0 +1,171 @@
+"""JSON encoding.
+
+enferno.utils.json_provider encodes with orjson, with the same output as the
+stdlib encoder it falls back to. It backs app.json, HTTPResponse, the graphs,
+the JSON export and the Celery results.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from markupsafe import Markup
+
+from enferno.utils import json_provider
+from enferno.utils.graph_utils import GraphUtils
+from enferno.utils.http_response import HTTPResponse
+from enferno.utils.json_provider import FastJSONProvider
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Snippet:
+    def __html__(self):
+        return Markup("<b>bold</b>")
+
+
+VALUE = {
+    "created": datetime(2026, 10, 17, 9, 30, 5, 120),
+    "day": date(2026, 10, 17),
+    "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+    "amount": Decimal("10.50"),
+    "point": Point(1, 2),
+    "html": Snippet(),
+    "title": "سوق",
+    7: [1, 2.5, None, True],
+}
+
+ENCODED = {
+    "created": "2026-10-17T09:30:05.000120",
+    "day": "2026-10-17",
+    "uuid": "12345678-1234-5678-1234-567812345678",
+    "amount": "10.50",
+    "point": {"x": 1, "y": 2},
+    "html": "<b>bold</b>",
+    "title": "سوق",
+    "7": [1, 2.5, None, True],
+}
+
+
+def test_extended_types_are_encoded():
+    assert json_provider.loads(json_provider.dumps(VALUE)) == ENCODED
+    assert json_provider.loads(json_provider.dumps_bytes(VALUE)) == ENCODED
+
+
+def test_orjson_and_stdlib_produce_the_same_json(app):
+    stdlib = DefaultJSONProvider(app)
+    stdlib.default = json_provider._default
+    assert json_provider.dumps(VALUE) == stdlib.dumps(
+        VALUE, ensure_ascii=False, sort_keys=False, separators=(",", ":")
+    )
+    assert json_provider.dumps(ENCODED, sort_keys=True, indent=True) == stdlib.dumps(
+        ENCODED, ensure_ascii=False, sort_keys=True, indent=2
+    )
+
+
+def test_app_uses_the_provider(app):
+    assert isinstance(app.json, FastJSONProvider)
+    with app.test_request_context():
+        response = app.json.response({"b": VALUE["created"], "a": 1})
+    assert response.get_data(as_text=True) == '{"a":1,"b":"2026-10-17T09:30:05.000120"}\n'
+    # json.dumps() arguments without a fast equivalent go to the stdlib
+    assert app.json.dumps({"a": [1]}, indent=4) == '{\n    "a": [\n        1\n    ]\n}'
+    assert app.json.loads('{"a": 1}') == {"a": 1}
+
+
+def test_http_response_keeps_the_key_order():
+    response = HTTPResponse.success(data={"z": 1, "a": VALUE["uuid"]}, message="ok")
+    assert response.get_data(as_text=True) == (
+        '{"data":{"z":1,"a":"12345678-1234-5678-1234-567812345678"},"message":"ok"}'
+    )
+
+
+def test_celery_results_round_trip():
+    from kombu.serialization import dumps, loads
+
+    from enferno.tasks import celery
+
+    assert celery.conf.result_serializer == "orjson"
+    content_type, encoding, payload = dumps({"result": VALUE}, serializer="orjson")
+    assert loads(payload, content_type, encoding, accept=[content_type]) == {"result": ENCODED}
+
+
+def encoding_times(app, value, rounds=5):
+    """Best time of the Flask default provider and of app.json encoding the value."""
+    default = DefaultJSONProvider(app)
+    timings = []
+    for provider in (default, app.json):
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            provider.dumps(value)
+            best = min(best, time.perf_counter() - start)
+        timings.append(best)
+    return timings
+
+
+def report(name, value, stdlib, fast):
+    size = len(json_provider.dumps_bytes(value)) / 1024
+    print(f"\n{name} ({size:.0f} KiB): {stdlib * 1e3:.1f}ms stdlib, {fast * 1e3:.1f}ms app.json")
+    assert fast < stdlib
+
+
+def graph(prefix, count):
+    nodes = [
+        {
+            "id": f"{prefix}{i}",
+            "_id": i,
+            "title": f"{prefix} item {i} طريق",
+            "color": "#00f2ff",
+            "type": prefix,
+            "collapsed": True,
+            "childLinks": [],
+            "restricted": False,
+        }
+        for i in range(count)
+    ]
+    links = [
+        {"source": f"{prefix}{i}", "target": f"{prefix}{i + 1}", "type": "related"}
+        for i in range(count - 1)
+    ]
+    return json_provider.dumps({"nodes": nodes, "links": links})
+
+
+@pytest.mark.benchmark
+def test_benchmark_graph_encoding(app):
+    """Encoding a merged 5k-node graph."""
+    merged = json_provider.loads(
+        GraphUtils.merge_graphs(graph("Bulletin", 2500), graph("Actor", 2500))
+    )
+    assert len(merged["nodes"]) == 5000
+
+    report("5k-node graph", merged, *encoding_times(app, merged))
+
+
+@pytest.mark.benchmark
+def test_benchmark_bulletin_page_encoding(app, session):
+    """Encoding a page of 50 fully serialized bulletins."""
+    from enferno.admin.models import Bulletin
+    from enferno.utils.serializer import serialize
+    from tests.factories import BulletinFactory, LabelFactory, LocationFactory, SourceFactory
+
+    location, label, source = LocationFactory(), LabelFactory(for_bulletin=True), SourceFactory()
+    bulletins = []
+    for _ in range(50):
+        bulletin = BulletinFactory()
+        bulletin.locations, bulletin.labels, bulletin.sources = [location], [label], [source]
+        bulletins.append(bulletin)
+    session.add_all(bulletins)
+    session.commit()
+    page = {"items": serialize(Bulletin, [b.id for b in bulletins]), "perPage": 50}
+    assert len(page["items"]) == 50
+
+    report("50 full bulletins", page, *encoding_times(app, page))
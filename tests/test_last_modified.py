@@ -0,0 +1,82 @@
+"""Stored latest revision time.
+
+Revisions write last_modified along with their history row, and the
+serializers read it instead of loading the history. backfill-last-modified
+fills it in for items revised before the column existed.
+"""
+
+from datetime import timedelta
+
+from enferno.admin.models import Bulletin, BulletinHistory
+from enferno.commands import backfill_last_modified
+from enferno.extensions import db
+from enferno.tasks.bulk_ops import bulk_update_bulletins
+from enferno.utils.date_helper import DateHelper
+from enferno.utils.serializer import serialize
+from tests.factories import ActorFactory, BulletinFactory, IncidentFactory
+
+
+def test_revisions_write_last_modified(session, users):
+    admin_user = users[0]
+    items = [BulletinFactory(), ActorFactory(), IncidentFactory()]
+    session.add_all(items)
+    session.commit()
+
+    for item in items:
+        item.create_revision(user_id=admin_user.id)
+        latest = item.history[-1].updated_at
+        assert item.last_modified == latest
+        assert item.get_modified_date() == latest
+
+        # a backdated revision is kept but does not move the latest one back
+        item.create_revision(user_id=admin_user.id, created=latest - timedelta(days=30))
+        assert item.last_modified == latest
+
+
+def test_bulk_update_writes_last_modified(session, users):
+    admin_user = users[0]
+    bulletin = BulletinFactory()
+    session.add(bulletin)
+    session.commit()
+
+    bulk_update_bulletins.run([bulletin.id], {"comments": "bulk"}, admin_user.id)
+    session.expire_all()
+    revision = session.query(BulletinHistory).filter_by(bulletin_id=bulletin.id).one()
+    assert db.session.get(Bulletin, bulletin.id).last_modified == revision.updated_at
+
+
+def test_serializing_does_not_load_history(session, count_queries, users):
+    bulletin = BulletinFactory()
+    session.add(bulletin)
+    session.commit()
+    bulletin.create_revision(user_id=users[0].id)
+
+    session.expire_all()
+    with count_queries() as statements:
+        output = serialize(Bulletin, [bulletin.id])
+    assert output[0]["updated_at"] == DateHelper.serialize_datetime(bulletin.last_modified)
+    assert not [s for s in statements if "bulletin_history" in s]
+
+
+def test_backfill_reads_the_latest_revision(app, session, users):
+    revised, untouched = BulletinFactory(), BulletinFactory()
+    session.add_all([revised, untouched])
+    session.commit()
+    latest = DateHelper.utcnow() - timedelta(days=2)
+    for created in (latest - timedelta(days=5), latest):
+        session.add(
+            BulletinHistory(
+                bulletin_id=revised.id,
+                data={},
+                user_id=users[0].id,
+                created_at=created,
+                updated_at=created,
+            )
+        )
+    session.commit()
+
+    result = app.test_cli_runner().invoke(backfill_last_modified, ["--batch-size", "1"])
+    assert result.exit_code == 0, result.output
+    session.expire_all()
+    assert revised.last_modified == latest
+    assert untouched.last_modified == untouched.updated_at
@@ -0,0 +1,161 @@
+"""Location hierarchy closure table.
+
+Descendant lookups (location search filters, get_children_ids) go through
+location_closure, which triggers on location keep in sync with parent_id.
+"""
+
+import time
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+
+from enferno.admin.models import Location
+from enferno.admin.models.tables import location_closure
+from enferno.utils.search_utils import SearchUtils
+from tests.factories import LocationFactory
+
+
+def compiled(q, cls):
+    stmt = SearchUtils(q, cls).get_query()
+    return str(stmt.compile(compile_kwargs={"literal_binds": True}))
+
+
+def closure_pairs(session, ids):
+    rows = session.execute(
+        select(
+            location_closure.c.ancestor_id,
+            location_closure.c.descendant_id,
+            location_closure.c.depth,
+        ).where(location_closure.c.descendant_id.in_(ids))
+    ).all()
+    return {tuple(row) for row in rows}
+
+
+@pytest.mark.parametrize(
+    "q,cls",
+    [
+        ([{"locations": [{"id": 7}]}], "bulletin"),
+        ([{"locations": [{"id": 7}, {"id": 8}], "oplocations": True}], "bulletin"),
+        ([{"originLocations": [{"id": 7}]}], "actor"),
+        ({"locations": [{"id": 7}]}, "incident"),
+    ],
+)
+def test_location_filters_use_closure_table(q, cls):
+    sql = compiled(q, cls)
+    assert "location_closure.ancestor_id IN (7" in sql
+    assert "id_tree" not in sql
+
+
+def test_closure_tracks_inserts_and_moves(session):
+    root, other = LocationFactory(), LocationFactory()
+    session.add_all([root, other])
+    session.flush()
+    child = LocationFactory(parent_id=root.id)
+    session.add(child)
+    session.flush()
+    leaf = LocationFactory(parent_id=child.id)
+    session.add(leaf)
+    session.flush()
+
+    assert closure_pairs(session, [leaf.id]) == {
+        (leaf.id, leaf.id, 0),
+        (child.id, leaf.id, 1),
+        (root.id, leaf.id, 2),
+    }
+    assert set(root.get_children_ids()) == {root.id, child.id, leaf.id}
+
+    # moving a subtree re-links every descendant under the new ancestors
+    child.parent_id = other.id
+    session.flush()
+
+    assert closure_pairs(session, [leaf.id]) == {
+        (leaf.id, leaf.id, 0),
+        (child.id, leaf.id, 1),
+        (other.id, leaf.id, 2),
+    }
+    assert set(Location.get_children_by_id(root.id)) == {root.id}
+    assert set(Location.get_children_by_id(other.id)) == {other.id, child.id, leaf.id}
+
+    child.parent_id = None
+    session.flush()
+    assert set(Location.get_children_by_id(child.id)) == {child.id, leaf.id}
+    assert closure_pairs(session, [leaf.id]) == {(leaf.id, leaf.id, 0), (child.id, leaf.id, 1)}
+
+
+def test_closure_rejects_cycles(session):
+    root = LocationFactory()
+    session.add(root)
+    session.flush()
+    child = LocationFactory(parent_id=root.id)
+    session.add(child)
+    session.flush()
+
+    nested = session.begin_nested()
+    root.parent_id = child.id
+    with pytest.raises(DBAPIError):
+        session.flush()
+    nested.rollback()
+
+
+def test_rebuild_closure_matches_triggers(session):
+    root = LocationFactory()
+    session.add(root)
+    session.flush()
+    child = LocationFactory(parent_id=root.id)
+    session.add(child)
+    session.flush()
+    before = closure_pairs(session, [root.id, child.id])
+
+    Location.rebuild_closure()
+
+    assert closure_pairs(session, [root.id, child.id]) == before
+
+
+@pytest.mark.benchmark
+def test_benchmark_descendant_lookup_100k(session):
+    """Closure lookup vs the legacy `id_tree LIKE` scan on a 100k-node, 10-ary tree."""
+    size = 100_000
+    base = session.execute(text("SELECT COALESCE(MAX(id), 0) + 1 FROM location")).scalar()
+    session.execute(
+        text("""
+            INSERT INTO location (id, title, parent_id, deleted)
+            SELECT g, 'bench ' || g,
+                   CASE WHEN g = :base THEN NULL ELSE :base + (g - :base - 1) / 10 END,
+                   FALSE
+            FROM generate_series(:base, :base + :size - 1) AS g
+            ORDER BY g
+            """),
+        {"base": base, "size": size},
+    )
+    # legacy id_tree strings, for comparison only
+    session.execute(
+        text("""
+            UPDATE location l SET id_tree = t.tree
+            FROM (
+                SELECT descendant_id, string_agg('[' || ancestor_id || ']', ' ' ORDER BY depth) AS tree
+                FROM location_closure WHERE descendant_id >= :base
+                GROUP BY descendant_id
+            ) t
+            WHERE l.id = t.descendant_id
+            """),
+        {"base": base},
+    )
+    session.execute(text("ANALYZE location"))
+    session.execute(text("ANALYZE location_closure"))
+
+    target = base + 1  # first child of the root, ~11k descendants
+
+    start = time.perf_counter()
+    legacy = session.scalars(
+        select(Location.id).where(Location.id_tree.like("%[{}]%".format(target)))
+    ).all()
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    closure = session.scalars(Location.descendants_of([target])).all()
+    closure_time = time.perf_counter() - start
+
+    print(f"\nid_tree LIKE: {legacy_time * 1000:.1f}ms, closure: {closure_time * 1000:.1f}ms")
+    assert set(closure) == set(legacy)
+    assert closure_time < legacy_time
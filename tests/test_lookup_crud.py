@@ -536,3 +536,47 @@ def test_label_mode2_includes_translated_title_and_path(session):
     assert d["path"] == "Root > Mid"
     # untranslated ancestors fall back to their English title per level
     assert d["path_ar"] == "جذر > Mid"
+
+
+def test_label_tree_index_follows_commits(session):
+    from enferno.admin.models import Label
+
+    root = Label(title="Tree Root")
+    session.add(root)
+    session.commit()
+    assert [x["id"] for x in Label.find_by_ids([root.id])] == [root.id]
+
+    child = Label(title="Tree Child", parent_label_id=root.id)
+    session.add(child)
+    session.commit()
+    grandchild = Label(title="Tree Grandchild", parent_label_id=child.id)
+    session.add(grandchild)
+    session.commit()
+
+    assert {x["id"] for x in Label.find_by_ids([root.id])} == {root.id, child.id, grandchild.id}
+    assert {x.id for x in Label.get_children([root], depth=1)} == {child.id}
+    assert grandchild._build_path() == "Tree Root > Tree Child"
+
+    # re-parenting moves the subtree on the next lookup
+    child.parent_label_id = None
+    session.commit()
+    assert {x["id"] for x in Label.find_by_ids([root.id])} == {root.id}
+    assert grandchild._build_path() == "Tree Child"
+
+
+def test_source_tree_index_follows_commits(session):
+    from enferno.admin.models import Source
+
+    root = Source(title="Tree Source Root")
+    session.add(root)
+    session.commit()
+    child = Source(title="Tree Source Child", parent_id=root.id)
+    session.add(child)
+    session.commit()
+
+    assert {x["id"] for x in Source.find_by_ids([root.id])} == {root.id, child.id}
+    assert [x.id for x in Source.get_children([root])] == [child.id]
+
+    session.delete(child)
+    session.commit()
+    assert {x["id"] for x in Source.find_by_ids([root.id])} == {root.id}
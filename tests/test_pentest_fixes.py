@@ -147,6 +147,7 @@ def test_bay_01_004_path_traversal_rejected(admin_client, endpoint, payload):
 
 def test_bay_01_003_accessible_items_skips_restricted(session, create_test_role, users):
     """Helper drops restricted items the requester cannot access."""
+    from enferno.admin.models import Bulletin
     from enferno.tasks.exports import _accessible_items
 
     _, _, _, sa_dict = users
@@ -158,18 +159,19 @@ def test_bay_01_003_accessible_items_skips_restricted(session, create_test_role,
 
     restricted = _make_restricted_bulletin(session, role_name="TestRole")
 
-    result = list(_accessible_items(da_user, [accessible, restricted], export_id=1))
+    result = _accessible_items(da_user, Bulletin, [accessible.id, restricted.id], export_id=1)
     assert accessible in result
     assert restricted not in result
 
 
 def test_bay_01_003_accessible_items_no_requester_yields_nothing(session):
+    from enferno.admin.models import Bulletin
     from enferno.tasks.exports import _accessible_items
 
     bulletin = BulletinFactory()
     session.add(bulletin)
     session.commit()
-    assert list(_accessible_items(None, [bulletin], export_id=1)) == []
+    assert _accessible_items(None, Bulletin, [bulletin.id], export_id=1) == []
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,66 @@
+"""Relation search filters (rel_to_bulletin, rel_to_actor, rel_to_incident).
+
+They read the btob/atob/itob/atoa/itoa/itoi tables in a subquery of the search
+statement instead of loading the related item through the ORM and inlining the
+ids of its relations.
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from enferno.admin.models import Actor, Atob, Btob, Bulletin
+from enferno.utils.search_utils import SearchUtils
+from tests.factories import ActorFactory, BulletinFactory
+
+
+def compiled(q, cls):
+    stmt = SearchUtils(q, cls).get_query()
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.parametrize(
+    "cls,q,expected",
+    [
+        ("bulletin", {"rel_to_actor": 7}, "bulletin.id IN (SELECT atob.bulletin_id"),
+        ("bulletin", {"rel_to_incident": 7}, "bulletin.id IN (SELECT itob.bulletin_id"),
+        ("actor", {"rel_to_bulletin": 7}, "actor.id IN (SELECT atob.actor_id"),
+        ("actor", {"rel_to_incident": 7}, "actor.id IN (SELECT itoa.actor_id"),
+        ("incident", {"rel_to_bulletin": 7}, "incident.id IN (SELECT itob.incident_id"),
+        ("incident", {"rel_to_actor": "7"}, "incident.id IN (SELECT itoa.incident_id"),
+    ],
+)
+def test_relation_filters_are_subqueries(cls, q, expected):
+    # builds without touching the database
+    sql = compiled(q if cls == "incident" else [q], cls)
+    assert expected in sql
+    assert "= 7" in sql
+
+
+def test_same_entity_relations_read_both_directions():
+    sql = compiled([{"rel_to_bulletin": 5}], "bulletin")
+    assert "WHERE btob.bulletin_id = 5 UNION ALL SELECT btob.bulletin_id" in sql
+    assert "WHERE btob.related_bulletin_id = 5" in sql
+
+
+def test_relation_filters_match_related_items(session):
+    hub, first, second, other = (BulletinFactory() for _ in range(4))
+    actor = ActorFactory()
+    session.add_all([hub, first, second, other, actor])
+    session.commit()
+    low, high = sorted([hub.id, first.id])
+    session.add_all(
+        [
+            Btob(bulletin_id=low, related_bulletin_id=high),
+            Btob(bulletin_id=min(hub.id, second.id), related_bulletin_id=max(hub.id, second.id)),
+            Atob(bulletin_id=first.id, actor_id=actor.id),
+        ]
+    )
+    session.commit()
+
+    def found(q, cls, model):
+        return set(session.scalars(SearchUtils(q, cls).get_query().with_only_columns(model.id)))
+
+    assert found([{"rel_to_bulletin": hub.id}], "bulletin", Bulletin) == {first.id, second.id}
+    assert found([{"rel_to_actor": actor.id}], "bulletin", Bulletin) == {first.id}
+    assert found([{"rel_to_bulletin": first.id}], "actor", Actor) == {actor.id}
+    assert found([{"rel_to_bulletin": other.id}], "actor", Actor) == set()
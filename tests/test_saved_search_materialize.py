@@ -0,0 +1,158 @@
+"""Materialized saved searches.
+
+A saved search with materialize set keeps its matching ids in
+saved_search_result, refreshed from the entities updated since the last
+refresh, and the list endpoints serve it as a join on the stored ids while
+the refresh runs in the background.
+"""
+
+from types import SimpleNamespace
+
+import fakeredis
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from enferno.admin.models import Query
+from enferno.admin.models.tables import saved_search_result
+from enferno.utils import saved_search
+from enferno.utils.date_helper import DateHelper
+from tests.factories import BulletinFactory
+
+
+def stored_ids(session, query):
+    return set(
+        session.scalars(
+            select(saved_search_result.c.entity_id).where(
+                saved_search_result.c.query_id == query.id
+            )
+        )
+    )
+
+
+def test_stored_query_joins_the_stored_ids(monkeypatch):
+    query = Query(
+        id=5,
+        query_type="bulletin",
+        data=[{"tsv": "x"}],
+        materialize=True,
+        refreshed_at=DateHelper.utcnow(),
+    )
+    queued = []
+    monkeypatch.setattr(saved_search, "queue_refresh", queued.append)
+    admin = SimpleNamespace(has_role=lambda role: role == "Admin")
+    stmt = saved_search.stored_query(query, admin)
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert (
+        "JOIN saved_search_result ON saved_search_result.query_id = 5 "
+        "AND saved_search_result.entity_id = bulletin.id" in sql
+    )
+    assert "bulletin_search_document" not in sql
+    # the stored ids are served as they are, the refresh is left to a worker
+    assert queued == [5]
+
+    # searches that are not materialized, or not built yet, run as usual
+    query.refreshed_at = None
+    assert saved_search.stored_query(query, admin) is None
+    query.materialize, query.refreshed_at = False, DateHelper.utcnow()
+    assert saved_search.stored_query(query, admin) is None
+
+
+def test_reads_queue_one_refresh_per_interval(monkeypatch):
+    from enferno.tasks import refresh_saved_search
+
+    delayed = []
+    monkeypatch.setattr(saved_search, "rds", fakeredis.FakeStrictRedis())
+    monkeypatch.setattr(
+        refresh_saved_search, "delay", lambda *args, **kwargs: delayed.append((args, kwargs))
+    )
+    saved_search.queue_refresh(5)
+    saved_search.queue_refresh(5)
+    saved_search.queue_refresh(6)
+    assert delayed == [((5,), {"full": False}), ((6,), {"full": False})]
+
+
+def test_refresh_reevaluates_updated_entities_only(session, users):
+    admin_user, _, _, _ = users
+    kept = BulletinFactory(title="harbour-crane-q kept")
+    changed = BulletinFactory(title="harbour-crane-q changed")
+    session.add_all([kept, changed])
+    session.commit()
+    query = Query(
+        name="cranes",
+        user_id=admin_user.id,
+        query_type="bulletin",
+        data=[{"tsv": "harbour-crane-q"}],
+        materialize=True,
+    )
+    session.add(query)
+    session.commit()
+
+    saved_search.refresh(query.id)
+    assert stored_ids(session, query) == {kept.id, changed.id}
+
+    # ids of entities outside the refresh window are left as they are
+    session.execute(saved_search_result.insert().values(query_id=query.id, entity_id=-1))
+    changed.title = "unrelated now"
+    added = BulletinFactory(title="harbour-crane-q added")
+    session.add(added)
+    session.commit()
+
+    saved_search.refresh(query.id)
+    assert stored_ids(session, query) == {kept.id, added.id, -1}
+
+    saved_search.refresh(query.id, full=True)
+    assert stored_ids(session, query) == {kept.id, added.id}
+
+
+def test_list_endpoint_serves_the_stored_ids(admin_client, session, users, monkeypatch):
+    admin_user, da_user, _, _ = users
+    bulletin = BulletinFactory(title="signal-tower-q")
+    session.add(bulletin)
+    session.commit()
+    query = Query(
+        name="towers",
+        user_id=admin_user.id,
+        query_type="bulletin",
+        data=[{"tsv": "signal-tower-q"}],
+        materialize=True,
+    )
+    other = Query(name="theirs", user_id=da_user.id, query_type="bulletin", data=[{}])
+    session.add_all([query, other])
+    session.commit()
+    saved_search.refresh(query.id)
+    # a stored id the search no longer matches proves the ids are read, not the search
+    extra = BulletinFactory(title="unrelated")
+    session.add(extra)
+    session.commit()
+    session.execute(saved_search_result.insert().values(query_id=query.id, entity_id=extra.id))
+    session.commit()
+    queued = []
+    monkeypatch.setattr(saved_search, "queue_refresh", queued.append)
+
+    response = admin_client.post("/admin/api/bulletins/", json={"saved_search": query.id})
+    assert response.status_code == 200
+    ids = [item["id"] for item in response.json["data"]["items"]]
+    assert ids == [extra.id, bulletin.id]
+    assert queued == [query.id]
+
+    response = admin_client.post("/admin/api/bulletins/", json={"saved_search": other.id})
+    assert response.status_code == 404
+
+
+def test_materialize_must_be_a_boolean(admin_client, session, users, monkeypatch):
+    queued = []
+    monkeypatch.setattr("enferno.admin.views.activity.refresh_saved_search.delay", queued.append)
+    payload = {"name": "strict", "type": "bulletin", "q": [{"tsv": "x"}]}
+    for value in ("false", "0", 1):
+        response = admin_client.post("/admin/api/query/", json={**payload, "materialize": value})
+        assert response.status_code == 400
+
+    response = admin_client.post("/admin/api/query/", json={**payload, "materialize": False})
+    assert response.status_code == 201
+    query_id = response.json["data"]["item"]["id"]
+    response = admin_client.put(
+        f"/admin/api/query/{query_id}", json={"q": [{"tsv": "y"}], "materialize": "false"}
+    )
+    assert response.status_code == 400
+    assert not session.get(Query, query_id).materialize
+    assert queued == []
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Tests for the cached result ids of entity searches."""
+
+import pytest
+
+from enferno.admin.models import Bulletin
+from enferno.extensions import rds
+from enferno.utils import search_cache
+from tests.factories import BulletinFactory, SourceFactory
+
+
+class TestCacheKey:
+    def test_empty_filters_and_key_order_do_not_matter(self, app, fake_user):
+        user = fake_user([2, 1])
+        a = search_cache.cache_key("bulletin", [{"tsv": "x", "labels": [], "op": "and"}], user)
+        b = search_cache.cache_key("bulletin", [{"op": "and", "tsv": "x", "ref": None}], user)
+        assert a == b
+
+    def test_role_sets_are_partitioned(self, app, fake_user):
+        q = [{"tsv": "x"}]
+        assert search_cache.cache_key("bulletin", q, fake_user([1, 2])) == search_cache.cache_key(
+            "bulletin", q, fake_user([2, 1])
+        )
+        assert search_cache.cache_key("bulletin", q, fake_user([1])) != search_cache.cache_key(
+            "bulletin", q, fake_user([1, 2])
+        )
+        assert search_cache.cache_key("bulletin", q, fake_user(admin=True)) != (
+            search_cache.cache_key("bulletin", q, fake_user())
+        )
+
+    def test_writes_to_searched_tables_change_the_key(self, app, fake_user):
+        q, user = [{"tsv": "x"}], fake_user(admin=True)
+        before = search_cache.cache_key("actor", q, user)
+
+        search_cache.bump("bulletin")
+        assert search_cache.cache_key("actor", q, user) == before
+
+        search_cache.bump("atob")
+        assert search_cache.cache_key("actor", q, user) != before
+
+    def test_reparenting_a_source_changes_child_source_actor_keys(self, app, session, fake_user):
+        parent, child, other = SourceFactory(), SourceFactory(), SourceFactory()
+        session.add_all([parent, child, other])
+        session.commit()
+        child.parent = parent
+        session.commit()
+        q = [{"sources": [{"id": parent.id}], "childsources": True}]
+        before = search_cache.cache_key("actor", q, fake_user(admin=True))
+
+        child.parent = other
+        session.commit()
+        assert search_cache.cache_key("actor", q, fake_user(admin=True)) != before
+
+    def test_committed_orm_writes_bump_the_generation(self, app, session):
+        key = search_cache._GEN_KEY.format("bulletin")
+        before = int(rds.get(key) or 0)
+
+        session.add(BulletinFactory())
+        session.commit()
+
+        assert int(rds.get(key) or 0) > before
+
+
+class TestCachedPages:
+    @pytest.fixture
+    def cache_enabled(self, app):
+        app.config["SEARCH_CACHE_TTL"] = 60
+        yield
+        app.config["SEARCH_CACHE_TTL"] = 0
+
+    def test_disabled_cache_defers_to_the_caller(self, app, fake_user):
+        page = search_cache.cached_page(
+            Bulletin, "bulletin", [{"tsv": "x"}], fake_user(admin=True), None, None, 10
+        )
+        assert page is None
+
+    def test_pages_are_sliced_from_cached_ids(self, app, session, cache_enabled, fake_user):
+        bulletins = [BulletinFactory() for _ in range(5)]
+        session.add_all(bulletins)
+        session.commit()
+        ids = sorted((b.id for b in bulletins), reverse=True)
+        user, q = fake_user(admin=True), [{"ids": ids}]
+        calls = []
+
+        def build_query():
+            calls.append(1)
+            return Bulletin.query.filter(Bulletin.id.in_(ids)).statement
+
+        first = search_cache.cached_page(
+            Bulletin, "bulletin", q, user, build_query, None, 2, "exact"
+        )
+        assert [b.id for b in first.items] == ids[:2]
+        assert first.has_more and first.next_cursor == str(ids[1])
+        assert (first.total, first.total_type) == (5, "exact")
+
+        second = search_cache.cached_page(
+            Bulletin, "bulletin", q, user, build_query, first.next_cursor, 2
+        )
+        last = search_cache.cached_page(
+            Bulletin, "bulletin", q, user, build_query, second.next_cursor, 2
+        )
+        assert [b.id for b in second.items] == ids[2:4]
+        assert [b.id for b in last.items] == ids[4:]
+        assert not last.has_more and last.next_cursor is None
+        # the search ran once, later pages were hydrated from the cached ids
+        assert len(calls) == 1
+
+    def test_list_endpoint_serves_later_pages_from_cache(
+        self, app, admin_client, cache_enabled, monkeypatch
+    ):
+        q = [{"tsv": "cache-endpoint-needle"}]
+        first = admin_client.post("/admin/api/bulletins/", json={"q": q, "include_count": True})
+        assert first.status_code == 200
+
+        def fail(*args, **kwargs):
+            raise AssertionError("search re-ran on a cache hit")
+
+        monkeypatch.setattr("enferno.utils.search_utils.SearchUtils.get_query", fail)
+        again = admin_client.post("/admin/api/bulletins/", json={"q": q, "include_count": True})
+        assert again.status_code == 200
+        assert again.json["data"]["items"] == first.json["data"]["items"]
+        assert again.json["data"]["total"] == first.json["data"]["total"]
@@ -0,0 +1,58 @@
+"""Facet counts of entity searches."""
+
+from sqlalchemy.dialects import postgresql
+
+from enferno.utils.search_facets import facet_query
+from tests.factories import BulletinFactory, LabelFactory, SourceFactory
+
+
+def compiled(stmt):
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return sql.replace("%%", "%")
+
+
+def test_all_facets_are_one_statement_over_the_matched_ids(fake_user):
+    facets = ["status", "assignee", "label", "source"]
+    sql = compiled(facet_query("bulletin", [{"tsv": "convoy"}], fake_user([3]), facets))
+    assert sql.startswith("WITH matched AS")
+    assert sql.count("UNION ALL") == 3
+    # the restricted user's access filter applies to the counted ids
+    assert "bulletin_roles.role_id IN (3)" in sql
+
+
+def test_facets_an_entity_lacks_are_skipped(fake_user):
+    assert facet_query("incident", {}, fake_user(admin=True), ["source"]) is None
+    sql = compiled(facet_query("incident", {}, fake_user(admin=True), ["source", "label"]))
+    assert "incident_labels" in sql and "UNION ALL" not in sql
+
+
+def test_actor_labels_count_each_actor_once(fake_user):
+    sql = compiled(facet_query("actor", [{}], fake_user(admin=True), ["label"]))
+    assert "actor_profile.actor_id = matched.id" in sql
+    assert "count(DISTINCT matched.id)" in sql
+
+
+def test_facets_endpoint_counts_the_search(admin_client, session):
+    label, source = LabelFactory(), SourceFactory()
+    session.add_all([label, source])
+    bulletins = [BulletinFactory(status="Peer Reviewed", tags=["facet-needle"]) for _ in range(3)]
+    bulletins[0].status = "Assigned"
+    for bulletin in bulletins[:2]:
+        bulletin.labels = [label]
+    bulletins[0].sources = [source]
+    session.add_all(bulletins)
+    session.commit()
+
+    response = admin_client.post(
+        "/admin/api/search-facets/",
+        json={"entity": "bulletin", "q": [{"tags": ["facet-needle"]}]},
+    )
+    assert response.status_code == 200
+    facets = response.json["data"]["facets"]
+    assert {f["value"]: f["count"] for f in facets["status"]} == {
+        "Peer Reviewed": 2,
+        "Assigned": 1,
+    }
+    assert facets["label"] == [{"value": label.id, "title": label.title, "count": 2}]
+    assert facets["source"] == [{"value": source.id, "title": source.title, "count": 1}]
+    assert sum(f["count"] for f in facets["assignee"]) == 3
@@ -5,7 +5,13 @@ block's op (and/or) combines it with the accumulated query.
 """
 
 import re
+import time
 
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from enferno.admin.models import Incident
 from enferno.utils.search_utils import SearchUtils
 
 
@@ -14,6 +20,12 @@ def compiled(q, cls):
     return str(stmt.compile(compile_kwargs={"literal_binds": True}))
 
 
+def pg_compiled(q, cls):
+    stmt = SearchUtils(q, cls).get_query()
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return sql.replace("%%", "%")
+
+
 def test_or_groups_block_conditions():
     # Block 2 has two conditions; they must stay AND-ed inside the OR,
     # not be flattened into independent OR operands.
@@ -45,3 +57,66 @@ def test_and_after_or_applies_to_combined_result():
         "bulletin",
     )
     assert re.search(r"\(.*IN \(1\).*OR.*IN \(2\).*\).*AND.*IN \(3\)", sql, re.DOTALL)
+
+
+@pytest.mark.parametrize(
+    "cls,q,matched",
+    [
+        ("bulletin", [{"extsv": "x"}], "bulletin_search_document.document"),
+        ("actor", [{"extsv": "x"}], "actor_search_document.document"),
+        ("incident", {"extsv": "x"}, "excluded_incident.search"),
+    ],
+)
+def test_exclusions_are_anti_joins(cls, q, matched):
+    # the excluded set is a positive, indexable match removed through NOT EXISTS
+    sql = pg_compiled(q, cls)
+    assert "NOT (EXISTS (SELECT" in sql
+    assert f"{matched} ILIKE '%x%'" in sql
+    assert "NOT ILIKE" not in sql
+
+
+@pytest.mark.parametrize("cls", ["bulletin", "actor", "incident"])
+def test_excluded_terms_combine_the_same_way(cls):
+    def block(q):
+        return q if cls == "incident" else [q]
+
+    # any term by default, all of them with "All"
+    sql = pg_compiled(block({"exTerms": ["aa", "bb"]}), cls)
+    assert re.search(r"ILIKE '%aa%' OR \S+ ILIKE '%bb%'", sql)
+    sql = pg_compiled(block({"exTerms": ["aa", "bb"], "opExTerms": True}), cls)
+    assert re.search(r"ILIKE '%aa%' AND \S+ ILIKE '%bb%'", sql)
+
+
+@pytest.mark.benchmark
+def test_benchmark_exclusion_heavy_incident_search(session):
+    """Excluding common words from 500k incidents runs as an indexed anti-join."""
+    session.execute(text("""
+            INSERT INTO incident (title, description)
+            SELECT 'bench ' || md5(i::text), CASE WHEN i % 3 = 0 THEN 'convoy' ELSE 'market' END
+            FROM generate_series(1, 500000) AS i
+            """))
+    session.execute(text("ANALYZE incident"))
+
+    stmt = SearchUtils({"tsv": "bench", "extsv": "convoy checkpoint"}, "incident").get_query()
+    stmt = stmt.with_only_columns(Incident.id).limit(30)
+    plan = "\n".join(
+        row[0]
+        for row in session.execute(
+            text(
+                "EXPLAIN "
+                + str(
+                    stmt.compile(
+                        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+                    )
+                )
+            )
+        )
+    )
+    assert "Anti Join" in plan
+
+    start = time.perf_counter()
+    session.execute(stmt).all()
+    elapsed = time.perf_counter() - start
+
+    print(f"\nexclusion-heavy search over 500k incidents: {elapsed * 1000:.1f}ms")
+    assert elapsed < 1
@@ -0,0 +1,124 @@
+"""Cached search statements.
+
+SearchUtils keeps the statements it builds per normalized query, so repeated
+searches (saved searches, paging, counts, facets) skip rebuilding the
+expression tree. Access roles are applied per user on top of the cached
+statement, and the dynamic field definitions it expands come from a process
+cache instead of a query per build.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from enferno.admin.models.DynamicField import DynamicField
+from enferno.utils import dynamic_field_cache
+from enferno.utils import search_utils
+from enferno.utils.search_utils import SearchUtils
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    search_utils.clear_statement_cache()
+    yield
+    search_utils.clear_statement_cache()
+
+
+def compiled(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_repeated_queries_share_the_statement():
+    q = [{"tsv": "convoy", "labels": [{"id": 3}], "op": "and"}, {"extsv": "market"}]
+    first = SearchUtils(q, "bulletin").get_query()
+    assert SearchUtils(q, "bulletin").get_query() is first
+    # empty filters are ignored by the builders and by the key
+    padded = [{**q[0], "sources": [], "originid": ""}, {"extsv": "market", "tags": None}]
+    assert SearchUtils(padded, "bulletin").get_query() is first
+    assert SearchUtils([{"tsv": "checkpoint"}], "bulletin").get_query() is not first
+    assert SearchUtils(q, "actor").get_query() is not first
+
+
+def test_access_roles_apply_on_top_of_the_cached_statement():
+    user = SimpleNamespace(has_role=lambda role: False, roles=[SimpleNamespace(id=41)])
+    restricted = SearchUtils({"tsv": "convoy"}, "incident", user=user).get_query()
+    unrestricted = SearchUtils({"tsv": "convoy"}, "incident").get_query()
+    assert "incident_roles.role_id IN (41)" in compiled(restricted)
+    assert "incident_roles" not in compiled(unrestricted)
+
+
+def test_build_state_is_restored_on_a_hit():
+    SearchUtils([{"tsv": "convoy market"}], "bulletin").get_query()
+    search = SearchUtils([{"tsv": "convoy market"}], "bulletin")
+    search.get_query()
+    assert search.tsv_words == ["convoy", "market"]
+
+    SearchUtils({"tsv": "convoy"}, "incident", text_mode="fulltext").get_query()
+    search = SearchUtils({"tsv": "convoy"}, "incident", text_mode="fulltext")
+    search.get_query()
+    assert search.rank_expression() is not None
+    # building twice does not rank the same query twice
+    search.get_query()
+    assert len(search._rank_queries) == 1
+
+
+def test_dynamic_field_filters_follow_the_definitions(monkeypatch):
+    field = dynamic_field_cache.FieldDefinition(
+        1, "case_ref", "bulletin", DynamicField.TEXT, False, True, DynamicField.INDEX_VALID, {}
+    )
+    definitions = {"version": "1", "fields": {"case_ref": field}}
+    monkeypatch.setattr(dynamic_field_cache, "version", lambda: definitions["version"])
+    monkeypatch.setattr(dynamic_field_cache, "searchable_fields", lambda _: definitions["fields"])
+
+    q = [{"dyn": [{"name": "case_ref", "op": "contains", "value": "2024-"}]}]
+    stmt = SearchUtils(q, "bulletin").get_query()
+    assert "case_ref ILIKE" in compiled(stmt)
+    assert SearchUtils(q, "bulletin").get_query() is stmt
+
+    # a field change bumps the version, the statement is rebuilt without the field
+    definitions.update(version="2", fields={})
+    assert "case_ref" not in compiled(SearchUtils(q, "bulletin").get_query())
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(search_utils, "STATEMENT_CACHE_SIZE", 2)
+    first = SearchUtils([{"tsv": "one"}], "bulletin").get_query()
+    SearchUtils([{"tsv": "two"}], "bulletin").get_query()
+    SearchUtils([{"tsv": "three"}], "bulletin").get_query()
+    assert len(search_utils._statements) == 2
+    assert SearchUtils([{"tsv": "one"}], "bulletin").get_query() is not first
+
+
+@pytest.mark.benchmark
+def test_benchmark_complex_saved_search_build():
+    """Building a complex saved search, cold and from the statement cache."""
+    block = {
+        "tsv": "convoy checkpoint market",
+        "extsv": "training exercise",
+        "labels": [{"id": i} for i in range(1, 6)],
+        "exlabels": [{"id": 9}],
+        "sources": [{"id": 2}, {"id": 4}],
+        "locations": [{"id": 7}, {"id": 8}],
+        "tags": ["shelling", "airstrike"],
+        "exTerms": ["drill"],
+        "pubdate": ["2020-01-01", "2021-01-01"],
+        "rel_to_actor": 12,
+    }
+    q = [block, {**block, "tsv": "hospital", "op": "or"}, {**block, "tsv": "school"}]
+    rounds = 200
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        search_utils.clear_statement_cache()
+        SearchUtils(q, "bulletin").get_query()
+    cold = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        SearchUtils(q, "bulletin").get_query()
+    warm = (time.perf_counter() - start) / rounds
+
+    print(f"\nget_query() build: {cold * 1e3:.2f}ms cold, {warm * 1e3:.3f}ms cached")
+    assert warm < cold
@@ -561,18 +561,21 @@ class TestValidationModels:
 
 class TestDynamicFieldSearch:
     @staticmethod
-    def _mock_db(fields, monkeypatch):
-        from types import SimpleNamespace
-
-        query_result = SimpleNamespace(filter=lambda *a, **k: SimpleNamespace(all=lambda: fields))
-        sess = SimpleNamespace(query=lambda *a, **k: query_result)
-        monkeypatch.setattr("enferno.utils.search_utils.db", SimpleNamespace(session=sess))
+    def _mock_fields(fields, monkeypatch):
+        # the search reads its field definitions from the process cache
+        monkeypatch.setattr(
+            "enferno.utils.dynamic_field_cache.searchable_fields",
+            lambda entity_type: {field.name: field for field in fields},
+        )
 
     @staticmethod
     def _make_field(name, field_type):
-        from types import SimpleNamespace
+        from enferno.admin.models.DynamicField import DynamicField
+        from enferno.utils.dynamic_field_cache import FieldDefinition
 
-        return SimpleNamespace(name=name, field_type=field_type, active=True, searchable=True)
+        return FieldDefinition(
+            1, name, "bulletin", field_type, False, True, DynamicField.INDEX_VALID, {}
+        )
 
     def test_select_field_any_operator(self, monkeypatch):
         from enferno.admin.models.DynamicField import DynamicField
@@ -580,7 +583,7 @@ class TestDynamicFieldSearch:
         from sqlalchemy.dialects import postgresql
 
         field = self._make_field("test_select", DynamicField.SELECT)
-        self._mock_db([field], monkeypatch)
+        self._mock_fields([field], monkeypatch)
 
         conditions = []
         utils = SearchUtils([], "bulletin")
@@ -605,7 +608,7 @@ class TestDynamicFieldSearch:
         from sqlalchemy.dialects import postgresql
 
         field = self._make_field("test_text", DynamicField.TEXT)
-        self._mock_db([field], monkeypatch)
+        self._mock_fields([field], monkeypatch)
 
         conditions = []
         utils = SearchUtils([], "bulletin")
@@ -0,0 +1,104 @@
+"""Tag filters and the tag dictionary.
+
+Exact tag filters match with array containment (@>) or overlap (&&) on the GIN
+indexed tags columns; substring filters resolve through the trigram indexed
+tag_dictionary to exact tags first and then overlap them.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from enferno.admin.models import Bulletin, Location
+from enferno.admin.models.tables import tag_dictionary
+from enferno.utils.search_utils import SearchUtils
+from enferno.utils.tag_dictionary import suggest_tags
+from tests.factories import BulletinFactory
+
+
+def compiled(q, cls="bulletin"):
+    query = SearchUtils(q, cls).get_query()
+    if cls == "location":
+        query = select(Location.id).where(*query)
+    sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return sql.replace("%%", "%")
+
+
+def count_of(session, entity, tag):
+    return session.execute(
+        select(tag_dictionary.c.count).where(
+            tag_dictionary.c.entity == entity, tag_dictionary.c.tag == tag
+        )
+    ).scalar()
+
+
+def test_exact_tags_use_containment_and_overlap():
+    sql = compiled([{"tags": ["a", "b"], "inExact": True}])
+    assert "bulletin.tags @> CAST(ARRAY['a', 'b'] AS VARCHAR[])" in sql
+    sql = compiled([{"tags": ["a", "b"], "inExact": True, "opTags": True}], "actor")
+    assert "actor.tags && CAST(ARRAY['a', 'b'] AS VARCHAR[])" in sql
+    assert "array_to_string" not in sql
+
+
+def test_substring_tags_resolve_through_the_dictionary():
+    sql = compiled([{"tags": ["conv"]}])
+    assert "bulletin.tags && array((SELECT tag_dictionary.tag" in sql
+    assert "tag_dictionary.entity = 'bulletin'" in sql
+    assert "tag_dictionary.tag ILIKE '%conv%'" in sql
+    assert "array_to_string" not in sql
+
+
+def test_excluded_tags_negate_overlap_or_containment():
+    sql = compiled([{"exTags": ["a", "b"], "exExact": True}])
+    assert "NOT (bulletin.tags && CAST(ARRAY['a', 'b'] AS VARCHAR[]))" in sql
+    sql = compiled([{"exTags": ["a", "b"], "exExact": True, "opExTags": True}])
+    assert "NOT (bulletin.tags @> CAST(ARRAY['a', 'b'] AS VARCHAR[]))" in sql
+
+
+def test_location_tags():
+    sql = compiled({"tags": ["a"], "inExact": True}, "location")
+    assert "location.tags @> CAST(ARRAY['a'] AS VARCHAR[])" in sql
+
+
+def test_dictionary_follows_tag_writes(session):
+    first = BulletinFactory(tags=["kilo-harbour", "bakery-xq"])
+    second = BulletinFactory(tags=["kilo-harbour"])
+    session.add_all([first, second])
+    session.commit()
+    assert count_of(session, "bulletin", "kilo-harbour") == 2
+    assert count_of(session, "bulletin", "bakery-xq") == 1
+
+    first.tags = ["kilo-harbour"]
+    session.commit()
+    assert count_of(session, "bulletin", "bakery-xq") is None
+
+    session.delete(second)
+    session.commit()
+    assert count_of(session, "bulletin", "kilo-harbour") == 1
+
+    found = session.scalars(
+        SearchUtils([{"tags": ["harbou"]}], "bulletin").get_query().with_only_columns(Bulletin.id)
+    )
+    assert set(found) == {first.id}
+
+
+def test_suggestions_rank_exact_and_prefix_matches_first(session):
+    session.add_all(
+        [
+            BulletinFactory(tags=["old-quay-zx"]),
+            BulletinFactory(tags=["quay-zx", "quay-zx-north"]),
+            BulletinFactory(tags=["quay-zx-north"]),
+        ]
+    )
+    session.commit()
+    tags = [item["tag"] for item in suggest_tags("bulletin", "quay-zx")]
+    assert tags == ["quay-zx", "quay-zx-north", "old-quay-zx"]
+
+
+def test_autocomplete_endpoint(admin_client, session):
+    session.add(BulletinFactory(tags=["zebra-crossing-q"]))
+    session.commit()
+    response = admin_client.get("/admin/api/tags/?entity=bulletin&q=crossing-q")
+    assert response.status_code == 200
+    assert response.json["data"]["items"] == [{"tag": "zebra-crossing-q", "count": 1}]
+
+    assert admin_client.get("/admin/api/tags/?entity=incident").status_code == 400